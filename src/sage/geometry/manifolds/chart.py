@@ -36,6 +36,14 @@ from sage.rings.integer import Integer
 from domain import OpenDomain
 from utilities import simplify_chain
 
+def _numerical_predicate(op, lhs, rhs):
+    r"""
+    Return the numerical predicate ``op(lhs(*x), rhs(*x))``, for use in 
+    :meth:`Chart.valid_coordinates_numerical`.
+
+    """
+    return lambda *x: op(lhs(*x), rhs(*x))
+
 class Chart(UniqueRepresentation, SageObject):
     r"""
     Class for charts on a manifold.
@@ -340,6 +348,9 @@ class Chart(UniqueRepresentation, SageObject):
         
         # Additional restrictions on the coordinates
         self._restrictions = []  # to be set with method add_restrictions()
+        self._numerical_predicates = {} # compiled bounds and restrictions
+                            # (key: tolerance and parameters, cf. method 
+                            #  valid_coordinates_numerical())
 
         # The chart is added to the domain's atlas, as well as to all the 
         # superdomains' atlases; moreover the fist defined chart is considered 
@@ -347,11 +358,9 @@ class Chart(UniqueRepresentation, SageObject):
         for sd in self._domain._superdomains:
             # the chart is added in the top charts only if its coordinates have
             # not been used:
-            for chart in sd._atlas:
-                if self._xx == chart._xx:
-                    break
-            else: 
+            if self._xx not in sd._atlas_coords:
                 sd._top_charts.append(self)
+                sd._atlas_coords.add(self._xx)
             sd._atlas.append(self)
             if sd._def_chart is None: 
                 sd._def_chart = self
@@ -372,6 +381,11 @@ class Chart(UniqueRepresentation, SageObject):
         self._dom_restrict = {} # dict. of the restrictions of self to
                                 # subdomains of self._domain, with the 
                                 # subdomains as keys
+        self._jacobian_store = {} # Jacobian data shared by all the coordinate
+                                  # changes and differentiable mappings from
+                                  # self with the same coordinate expression
+                                  # (cf. class JacobianData); key: (chart2, 
+                                  # expressions)
     
     def _repr_(self):
         r"""
@@ -644,6 +658,7 @@ class Chart(UniqueRepresentation, SageObject):
             # case of a single condition or conditions to be combined by "or"
             restrictions = [restrictions]
         self._restrictions.extend(restrictions)
+        self._numerical_predicates.clear()
 
 
     def restrict(self, subdomain, restrictions=None):
@@ -812,6 +827,163 @@ class Chart(UniqueRepresentation, SageObject):
         # All tests have been passed:
         return True
 
+    def valid_coordinates_numerical(self, *coordinates, **kwds):
+        r""" 
+        Check whether some arrays of numerical coordinates are the 
+        coordinates of points in the chart domain. 
+
+        This is a vectorized version of :meth:`valid_coordinates`: the 
+        coordinate ranges and the restrictions of the chart are compiled 
+        once into numerical predicates acting on NumPy arrays, so that a 
+        large set of points (e.g. a mesh) is checked without any Python loop.
+
+        INPUT:
+
+        - ``*coordinates`` -- coordinate values, each of them being a number
+          or a NumPy array (arrays of different shapes being broadcast 
+          together)
+        - ``**kwds`` -- options:
+
+          - ``tolerance=0``, to set the absolute tolerance in the test of 
+            coordinate ranges
+          - ``parameters=None``, to set some numerical values to parameters
+
+        OUTPUT:
+
+        - NumPy array of booleans, the element of which is True if the
+          corresponding coordinate values are admissible in the chart range
+
+        EXAMPLES:
+
+        Chart on the open unit half-disk::
+
+            sage: import numpy
+            sage: M = Manifold(2, 'M')
+            sage: X.<x,y> = M.chart('x y:(0,+oo)')
+            sage: X.add_restrictions(x^2+y^2<1)
+            sage: xx = numpy.array([0., 0.5, 0.9, -0.5, 0.5])
+            sage: yy = numpy.array([0.5, 0.5, 0.9, 0.1, -0.1])
+            sage: list(X.valid_coordinates_numerical(xx, yy))
+            [True, True, False, True, False]
+            sage: [X.valid_coordinates(a, b) for a, b in zip(xx, yy)]  # check
+            [True, True, False, True, False]
+
+        Check of a `1000\times 1000` mesh::
+
+            sage: t = numpy.linspace(-1, 1, 1000)
+            sage: mask = X.valid_coordinates_numerical(*numpy.meshgrid(t, t))
+            sage: mask.shape
+            (1000, 1000)
+
+        Restrictions combined by "or"::
+
+            sage: Y.<u,v> = M.chart('u:(-2,2) v')
+            sage: Y.add_restrictions((u<0, v!=0))  # u<0 or v!=0
+            sage: list(Y.valid_coordinates_numerical(numpy.array([-1,1,1,2]),
+            ....:                                    numpy.array([0,1,0,1])))
+            [True, True, False, False]
+
+        """
+        import numpy
+        if len(coordinates) != self._manifold._dim:
+            raise ValueError("Bad number of coordinates: " + 
+                             str(len(coordinates)) + "; " + 
+                             str(self._manifold._dim) + " were expected.")
+        if 'tolerance' in kwds:
+            tolerance = kwds['tolerance']
+        else:
+            tolerance = 0
+        if 'parameters' in kwds:
+            parameters = kwds['parameters']
+        else:
+            parameters = None
+        bounds, restrictions = self._compile_predicates(tolerance, parameters)
+        coords = numpy.broadcast_arrays(*[numpy.asarray(x, 
+                                    dtype=numpy.float64) for x in coordinates])
+        mask = numpy.ones(coords[0].shape, dtype=bool)
+        with numpy.errstate(invalid='ignore'):
+            # Check of the coordinate ranges:
+            for x, (op_min, xmin, op_max, xmax) in zip(coords, bounds):
+                mask &= op_min(x, xmin)
+                mask &= op_max(x, xmax)
+            # Check of additional restrictions:
+            for restrict in restrictions:
+                # case of or conditions:
+                combine = numpy.zeros(coords[0].shape, dtype=bool)
+                for predicate in restrict:
+                    combine |= predicate(*coords)
+                mask &= combine
+        return mask
+
+    def _compile_predicates(self, tolerance, parameters):
+        r"""
+        Compile the coordinate ranges and the restrictions of the chart into 
+        numerical predicates, for use in :meth:`valid_coordinates_numerical`. 
+
+        INPUT:
+
+        - ``tolerance`` -- absolute tolerance in the test of coordinate 
+          ranges
+        - ``parameters`` -- dictionary of numerical values of parameters, 
+          or None
+
+        OUTPUT:
+
+        - pair ``(bounds, restrictions)``, where ``bounds`` is a list of 
+          tuples ``(op_min, xmin, op_max, xmax)``, one per coordinate, and 
+          ``restrictions`` is a list of lists of predicates, the predicates 
+          of each inner list being combined by "or"
+
+        The result is cached in ``self._numerical_predicates``.
+
+        """
+        import operator
+        from utilities import numerical_function
+        if parameters:
+            key = (tolerance, frozenset(parameters.iteritems()))
+        else:
+            key = (tolerance, None)
+        if key in self._numerical_predicates:
+            return self._numerical_predicates[key]
+        bounds = []
+        for bounds_x in self._bounds:
+            xmin = bounds_x[0][0] - tolerance
+            xmax = bounds_x[1][0] + tolerance
+            if parameters:
+                xmin = xmin.subs(parameters)
+                xmax = xmax.subs(parameters)
+            if bounds_x[0][1]:
+                op_min = operator.ge
+            else:
+                op_min = operator.gt
+            if bounds_x[1][1]:
+                op_max = operator.le
+            else:
+                op_max = operator.lt
+            bounds.append((op_min, float(xmin), op_max, float(xmax)))
+        comparisons = [operator.lt, operator.le, operator.gt, operator.ge, 
+                       operator.eq, operator.ne]
+        restrictions = []
+        for restrict in self._restrictions:
+            if isinstance(restrict, tuple): # case of or conditions
+                conditions = restrict
+            else:
+                conditions = (restrict,)
+            predicates = []
+            for cond in conditions:
+                if parameters:
+                    cond = cond.subs(parameters)
+                op = cond.operator()
+                if op not in comparisons:
+                    raise ValueError("The restriction " + str(cond) + 
+                                     " cannot be compiled.")
+                predicates.append(_numerical_predicate(op, 
+                                numerical_function(cond.lhs(), self._xx), 
+                                numerical_function(cond.rhs(), self._xx)))
+            restrictions.append(predicates)
+        self._numerical_predicates[key] = (bounds, restrictions)
+        return bounds, restrictions
+
     def transition_map(self, other, transformations, intersection_name=None, 
                        restrictions1=None, restrictions2=None):
         r""" 
@@ -1125,7 +1297,8 @@ class Chart(UniqueRepresentation, SageObject):
           of line styles, with keys the coordinates to be drawn, representing 
           the style of the lines along which the coordinate varies, the other 
           being kept constant; if ``style`` is a single style, it is used for
-          all coordinate lines; NB: ``style`` is effective only for 2D plots
+          all coordinate lines; NB: ``style`` is effective only for 2D plots, 
+          the lines of 3D plots being always solid
         - ``thickness`` -- (default: 1) either a single line thickness or a 
           dictionary of line thicknesses, with keys the coordinates to be drawn, 
           representing the thickness of the lines along which the coordinate 
@@ -1148,6 +1321,11 @@ class Chart(UniqueRepresentation, SageObject):
           2 coordinates of the ambient chart) or an instance of 
           :class:`~sage.plot.plot3d.base.Graphics3d` for a 3D plot (i.e. 
           based on 3 coordinates of the ambient chart)
+
+        In a 2D plot, all the lines along which a given coordinate varies form
+        a single line primitive, in which the portions where the chart is not
+        defined are skipped. In a 3D plot, each line is a separate primitive
+        and the isolated points where the chart is defined are not drawn.
           
         EXAMPLES:
         
@@ -1162,6 +1340,8 @@ class Chart(UniqueRepresentation, SageObject):
             sage: g = c_pol.plot(c_cart)
             sage: type(g)
             <class 'sage.plot.graphics.Graphics'>
+            sage: len(g)  # one line primitive per coordinate
+            2
             sage: show(g) # graphical display
 
         Call with non-default values::
@@ -1253,13 +1433,17 @@ class Chart(UniqueRepresentation, SageObject):
             sage: show(g)  # a 2D mesh square
         
         """
+        import numpy
         from sage.rings.infinity import Infinity
-        from sage.misc.functional import numerical_approx
         from sage.misc.latex import latex
+        from sage.symbolic.ring import SR
         from sage.plot.graphics import Graphics
-        from sage.plot.line import line
+        from sage.plot.line import line, Line
+        from sage.plot.plot3d.base import Graphics3dGroup
+        from sage.plot.plot3d.shapes2 import Line as Line3d
+        from sage.plot.plot3d.texture import Texture
         from diffmapping import DiffMapping
-        from utilities import set_axes_labels
+        from utilities import set_axes_labels, valid_runs
         if not isinstance(ambient_chart, Chart):
             raise TypeError("The first argument must be a chart.")
         #
@@ -1346,22 +1530,22 @@ class Chart(UniqueRepresentation, SageObject):
         ranges0 = {}
         for coord in coords:
             if coord in ranges:
-                ranges0[coord] = (numerical_approx(ranges[coord][0]), 
-                                  numerical_approx(ranges[coord][1]))
+                ranges0[coord] = (float(ranges[coord][0]), 
+                                  float(ranges[coord][1]))
             else:
                 bounds = self._bounds[self._xx.index(coord)]
                 if bounds[0][0] == -Infinity:
-                    xmin = numerical_approx(-max_value)
+                    xmin = -float(max_value)
                 elif bounds[0][1]:
-                    xmin = numerical_approx(bounds[0][0])
+                    xmin = float(bounds[0][0])
                 else:
-                    xmin = numerical_approx(bounds[0][0] + 1.e-3)
+                    xmin = float(bounds[0][0] + 1.e-3)
                 if bounds[1][0] == Infinity:
-                    xmax = numerical_approx(max_value)
+                    xmax = float(max_value)
                 elif bounds[1][1]:
-                    xmax = numerical_approx(bounds[1][0])
+                    xmax = float(bounds[1][0])
                 else:
-                    xmax = numerical_approx(bounds[1][0] - 1.e-3)
+                    xmax = float(bounds[1][0] - 1.e-3)
                 ranges0[coord] = (xmin, xmax)
         ranges = ranges0
         if nb_values is None:
@@ -1406,109 +1590,102 @@ class Chart(UniqueRepresentation, SageObject):
         #
         # 3/ Plots
         #    -----
+        # The coordinate lines are computed as NumPy arrays, by means of the
+        # compiled version of transf; each family of coordinate lines 
+        # is evaluated at once on a grid of shape (number of lines, 
+        # number of points along each line).
         xx0 = [0] * nc
         if fixed_coords is not None:
             if len(fixed_coords) != nc - len(coords):
                 raise TypeError("Bad number of fixed coordinates.")
             for fc, val in fixed_coords.iteritems():
-                xx0[self._xx.index(fc)] = val
+                if parameters:
+                    val = SR(val).subs(parameters)
+                xx0[self._xx.index(fc)] = float(val)
         ind_a = [ambient_chart._xx.index(ac) for ac in ambient_coords]
-        resu = Graphics()
+        functions = transf.numerical_functions(parameters=parameters)
+        functions = [functions[j] for j in ind_a]
+        curves = []
         for coord in coords:
-            color_c, style_c = color[coord], style[coord]
-            thickness_c = thickness[coord]
             rem_coords = list(coords)
             rem_coords.remove(coord)
-            xx_list = [xx0]
-            if len(rem_coords) >= 1:
-                xx_list = self._plot_xx_list(xx_list, rem_coords, ranges, 
-                                             steps, nb_values)
+            # Values of the coordinates that are constant along the lines:
+            values = [ranges[rc][0] + float(steps[rc]) *
+                      numpy.arange(nb_values[rc]) for rc in rem_coords]
+            # Values along the lines:
             xmin, xmax = ranges[coord]
-            nbp = plot_points[coord]
-            dx = (xmax - xmin) / (nbp-1)
-            ind_coord = self._xx.index(coord)
-            for xx in xx_list:
-                curve = []
-                first_invalid = False # initialization
-                xc = xmin
-                xp = list(xx)
-                if parameters is None:
-                    for i in range(nbp):
-                        xp[ind_coord] = xc
-                        if self.valid_coordinates(*xp, tolerance=1e-13):
-                            yp = transf(*xp, simplify=False)
-                            curve.append( [numerical_approx(yp[j]) 
-                                           for j in ind_a] )
-                            first_invalid = True # next invalid point will be
-                                                 # the first one
-                        else:
-                            if first_invalid:
-                                # the curve is stopped at previous point and 
-                                # added to the graph:
-                                resu += line(curve, color=color_c, 
-                                             linestyle=style_c,
-                                             thickness=thickness_c)
-                                curve = [] # a new curve will start at the 
-                                           # next valid point
-                            first_invalid = False # next invalid point will not
-                                                  # be the first one
-                        xc += dx
+            values.append(numpy.linspace(xmin, xmax, plot_points[coord]))
+            grid = numpy.meshgrid(*values, indexing='ij')
+            xx = []
+            for i, xc in enumerate(self._xx):
+                if xc == coord:
+                    xx.append(grid[-1])
+                elif xc in rem_coords:
+                    xx.append(grid[rem_coords.index(xc)])
                 else:
-                    for i in range(nbp):
-                        xp[ind_coord] = xc
-                        if self.valid_coordinates(*xp, tolerance=1e-13, 
-                                                  parameters=parameters):
-                            yp = transf(*xp, simplify=False)
-                            curve.append( 
-                              [numerical_approx( yp[j].substitute(parameters) ) 
-                               for j in ind_a] )
-                            first_invalid = True # next invalid point will be
-                                                 # the first one
-                        else:
-                            if first_invalid:
-                                # the curve is stopped at previous point and 
-                                # added to the graph:
-                                resu += line(curve, color=color_c, 
-                                             linestyle=style_c,
-                                             thickness=thickness_c)
-                                curve = [] # a new curve will start at the 
-                                           # next valid point
-                            first_invalid = False # next invalid point will not
-                                                  # be the first one
-                        xc += dx
-                if curve != []:
-                    resu += line(curve, color=color_c, 
-                                 linestyle=style_c,
-                                 thickness=thickness_c)
+                    xx.append(xx0[i])
+            xx = [x.reshape(-1, plot_points[coord]) for x in 
+                  numpy.broadcast_arrays(*[numpy.asarray(x, 
+                                         dtype=numpy.float64) for x in xx])]
+            valid = self.valid_coordinates_numerical(*xx, tolerance=1e-13, 
+                                                     parameters=parameters)
+            yy = [funct(*xx) for funct in functions]
+            for y in yy:
+                valid &= numpy.isfinite(y)
+            # Each line is split at the points where it is not defined (a 3D
+            # line requires at least 2 points, so that isolated valid points
+            # are not drawn in 3D):
+            min_points = 1 if nca == 2 else 2
+            for k in range(valid.shape[0]):
+                for start, stop in valid_runs(valid[k]):
+                    if stop - start >= min_points:
+                        curves.append((coord, [y[k, start:stop] for y in yy]))
         if nca==2:  # 2D graphic
+            # all the lines along which a given coordinate varies are gathered
+            # in a single line primitive, in which they are separated by NaN 
+            # values (NB: a NaN value is never the first one, so that it does 
+            # not alter the bounding box computed by min/max):
+            resu = Graphics()
+            separator = numpy.array([numpy.nan])
+            for coord in coords:
+                xdata = []
+                ydata = []
+                for c, curve in curves:
+                    if c == coord:
+                        if xdata:
+                            xdata.append(separator)
+                            ydata.append(separator)
+                        xdata.append(curve[0])
+                        ydata.append(curve[1])
+                if not xdata:
+                    continue
+                options = line([(0,0), (1,1)], color=color[coord],
+                               linestyle=style[coord],
+                               thickness=thickness[coord])[0].options()
+                resu.add_primitive(Line(numpy.concatenate(xdata).tolist(), 
+                                        numpy.concatenate(ydata).tolist(),
+                                        options))
             resu.set_aspect_ratio(1)
             if label_axes:
                 resu.axes_labels([r'$'+latex(ac)+r'$' for ac in ambient_coords])
         else: # 3D graphic
+            # the 3D line primitive is a single polyline, which cannot be 
+            # interrupted; the lines along which a given coordinate varies 
+            # are therefore distinct primitives, sharing the same texture 
+            # (NB: the 3D lines have no line style, so that the argument 
+            # style is ignored):
+            textures = {}
+            for coord in coords:
+                textures[coord] = Texture(color=color[coord])
+            resu = Graphics3dGroup([Line3d(zip(*curve), 
+                                           thickness=thickness[coord],
+                                           texture=textures[coord]) 
+                                    for coord, curve in curves])
             resu.aspect_ratio(1)
             if label_axes:
                 labels = [str(ac) for ac in ambient_coords]
                 resu = set_axes_labels(resu, *labels)
         return resu
-                
-    def _plot_xx_list(self, xx_list, rem_coords, ranges, steps, nb_values):
-        coord = rem_coords[0]
-        xmin = ranges[coord][0]
-        sx = steps[coord]
-        resu = []
-        for xx in xx_list:
-            xc = xmin
-            for i in range(nb_values[coord]):
-                nxx = list(xx)
-                nxx[self._xx.index(coord)] = xc
-                resu.append(nxx)
-                xc += sx
-        if len(rem_coords) == 1:
-            return resu
-        else:
-            rem_coords.remove(coord)
-            return self._plot_xx_list(resu, rem_coords, ranges, steps, 
-                                      nb_values)
 
 #*****************************************************************************
 
@@ -2669,6 +2846,11 @@ class MultiFunctionChart(SageObject):
         self._jacob = None
         self._jacob_matrix = None
         self._jacob_det = None
+        self._jacob_source = None # system of functions with the same 
+                                  # expressions, from which the Jacobian
+                                  # matrix and determinant are taken 
+                                  # (cf. _jacobian_data())
+        self._numerical = {} # compiled numerical functions (key: parameters)
     
     def _repr_(self):
         r"""
@@ -2768,6 +2950,59 @@ class MultiFunctionChart(SageObject):
         return tuple( self._functions[i](*coords, **options) for i in 
                                                               range(self._nf) )
 
+    def numerical_functions(self, parameters=None):
+        r"""
+        Return the functions compiled into numerical functions acting on 
+        NumPy arrays of coordinates.
+
+        The compilation is performed only at the first call (for a given
+        set of parameter values), so that the functions can be evaluated 
+        efficiently on large sets of points, e.g. for plotting. 
+
+        INPUT:
+
+        - ``parameters`` -- (default: None) dictionary giving the numerical 
+          values of the parameters that may appear in the functions
+
+        OUTPUT:
+
+        - list of `m` numerical functions (cf. 
+          :func:`~sage.geometry.manifolds.utilities.numerical_function`), 
+          each of them taking `n` arguments, which are numbers or NumPy 
+          arrays of coordinate values
+
+        EXAMPLE::
+
+            sage: import numpy
+            sage: M = Manifold(2, 'M')
+            sage: c_xy.<x,y> = M.chart()
+            sage: a = var('a')
+            sage: f = c_xy.multifunction(x-y, a*x*y)
+            sage: ff = f.numerical_functions(parameters={a: 2})
+            sage: xx = numpy.array([1., 2., 3.])
+            sage: ff[0](xx, 1.)
+            array([ 0.,  1.,  2.])
+            sage: ff[1](xx, 1.)
+            array([  2.,   4.,   6.])
+            sage: f.numerical_functions(parameters={a: 2}) is ff
+            True
+
+        """
+        from utilities import numerical_function
+        if parameters:
+            key = frozenset(parameters.iteritems())
+        else:
+            key = None
+        if key not in self._numerical:
+            functions = []
+            for funct in self._functions:
+                expr = funct._express
+                if parameters:
+                    expr = expr.subs(parameters)
+                functions.append(numerical_function(expr, self._chart._xx))
+            self._numerical[key] = functions
+        return self._numerical[key]
+
     def jacobian(self):
         r"""
         Return the Jacobian matrix of the system of functions.
@@ -2804,6 +3039,10 @@ class MultiFunctionChart(SageObject):
         """
         from sage.matrix.constructor import matrix
         from sage.calculus.functional import diff
+        if self._jacob is None and self._jacob_source is not None:
+            source = self._jacob_source
+            self._jacob = source.jacobian()
+            self._jacob_matrix = source._jacob_matrix
         if self._jacob is None:
             self._jacob = [[ FunctionChart(self._chart, 
                             simplify_chain(diff(self._functions[i]._express, 
@@ -2845,6 +3084,8 @@ class MultiFunctionChart(SageObject):
             
         """
         from utilities import simple_determinant
+        if self._jacob_det is None and self._jacob_source is not None:
+            self._jacob_det = self._jacob_source.jacobian_det()
         if self._jacob_det is None: 
             if (self._nf != self._nc):
                 raise ValueError("The Jacobian matrix is not square.")
@@ -2856,6 +3097,153 @@ class MultiFunctionChart(SageObject):
             # self._jacob_det = FunctionChart(self._chart, simplify_chain(self._jacob_matrix.det()) )
         return self._jacob_det
 
+    def _jacobian_data(self, chart2):
+        r"""
+        Return the Jacobian data of ``self``, regarded as the coordinate 
+        expression of a mapping to the chart ``chart2``, from the store 
+        of the start chart, which is shared by all the coordinate changes and
+        differentiable mappings.
+
+        INPUT:
+
+        - ``chart2`` -- chart on the arrival domain
+
+        OUTPUT:
+
+        - instance of :class:`JacobianData`; if the same expression between
+          the same charts has already been met, ``self`` takes its Jacobian 
+          matrix and determinant from it, so that they are computed only once
+
+        EXAMPLE::
+
+            sage: M = Manifold(2, 'M')
+            sage: c_xy.<x,y> = M.chart()
+            sage: c_uv.<u,v> = M.chart()
+            sage: f = c_xy.multifunction(x+y, x*y)
+            sage: jd = f._jacobian_data(c_uv) ; jd
+            Jacobian data of the mapping (x, y) |--> (x + y, x*y) from chart (M, (x, y)) to chart (M, (u, v))
+            sage: g = c_xy.multifunction(x+y, x*y)
+            sage: g._jacobian_data(c_uv) is jd
+            True
+            sage: g.jacobian()[1][0] is f.jacobian()[1][0]
+            True
+
+        """
+        store = self._chart._jacobian_store
+        key = (chart2, tuple(str(func._express) for func in self._functions))
+        if key in store:
+            jdata = store[key]
+            if jdata._transf is not self:
+                # the Jacobian matrix and determinant will be taken from 
+                # jdata._transf, once computed:
+                self._jacob_source = jdata._transf
+        else:
+            jdata = JacobianData(self, chart2)
+            store[key] = jdata
+        return jdata
+
+
+#*****************************************************************************
+
+class JacobianData(SageObject):
+    r"""
+    Jacobian matrix of a coordinate expression of a mapping, together with 
+    its determinant, its inverse and the determinant of the latter. 
+
+    The instances of this class are shared, via 
+    :meth:`MultiFunctionChart._jacobian_data`, by all the coordinate changes 
+    and differentiable mappings having the same coordinate expression 
+    between the same charts, so that each Jacobian matrix is differentiated,
+    inverted and simplified only once. Each quantity is computed at its 
+    first call. 
+
+    INPUT:
+
+    - ``transf`` -- coordinate expression of the mapping (instance of 
+      :class:`MultiFunctionChart`)
+    - ``chart2`` -- chart on the arrival domain
+
+    EXAMPLE:
+
+    The Jacobian data of the change from polar to Cartesian coordinates::
+
+        sage: M = Manifold(2, 'R^2')
+        sage: c_cart.<x,y> = M.chart()
+        sage: U = M.open_domain('U')
+        sage: c_pol.<r,ph> = U.chart(r'r:(0,+oo) ph:(0,2*pi):\phi')
+        sage: ch = c_pol.coord_change(c_cart.restrict(U), r*cos(ph), r*sin(ph))
+        sage: jd = ch._transf._jacobian_data(c_cart.restrict(U))
+        sage: jd.jacobian()
+        [[cos(ph), -r*sin(ph)], [sin(ph), r*cos(ph)]]
+        sage: jd.det()
+        r
+        sage: jd.inverse()
+        [[cos(ph), sin(ph)], [-sin(ph)/r, cos(ph)/r]]
+        sage: jd.inverse_det()
+        1/r
+
+    """
+    def __init__(self, transf, chart2):
+        self._transf = transf
+        self._chart1 = transf._chart
+        self._chart2 = chart2
+        self._inverse = None
+        self._inverse_det = None
+
+    def _repr_(self):
+        r"""
+        Special Sage function for the string representation of the object.
+        """
+        transf = self._transf
+        description = "Jacobian data of the mapping " + \
+                      str(self._chart1._xx) + " |--> " + \
+                      str(tuple(func._express for func in transf._functions)) \
+                      + " from " + str(self._chart1) + " to " + \
+                      str(self._chart2)
+        return description
+
+    def jacobian(self):
+        r"""
+        Return the Jacobian matrix, as a 2-dimensional array of 
+        :class:`FunctionChart`'s (cf. :meth:`MultiFunctionChart.jacobian`). 
+        """
+        return self._transf.jacobian()
+
+    def det(self):
+        r"""
+        Return the Jacobian determinant, as a :class:`FunctionChart`.
+        """
+        return self._transf.jacobian_det()
+
+    def inverse(self):
+        r"""
+        Return the inverse of the Jacobian matrix, as a 2-dimensional array 
+        of :class:`FunctionChart`'s expressed in terms of the coordinates of
+        the start chart. 
+        """
+        if self._inverse is None:
+            transf = self._transf
+            if transf._nf != transf._nc:
+                raise ValueError("The Jacobian matrix is not square.")
+            transf.jacobian() # to force the computation of transf._jacob_matrix
+            mat_inv = transf._jacob_matrix.inverse()
+            chart1 = self._chart1
+            nc = transf._nc
+            self._inverse = [[FunctionChart(chart1, 
+                                            simplify_chain(mat_inv[i,j]))
+                              for j in range(nc)] for i in range(nc)]
+        return self._inverse
+
+    def inverse_det(self):
+        r"""
+        Return the determinant of the inverse of the Jacobian matrix, as a 
+        :class:`FunctionChart`.
+        """
+        if self._inverse_det is None:
+            self._inverse_det = FunctionChart(self._chart1, 
+                                   simplify_chain(1 / self.det()._express))
+        return self._inverse_det
+
 
 #*****************************************************************************
 
@@ -2937,9 +3325,6 @@ class CoordChange(SageObject):
 
     """
     def __init__(self, chart1, chart2, *transformations): 
-        from sage.matrix.constructor import matrix
-        from sage.calculus.functional import diff
-        from rank2field import AutomorphismFieldParal
         n1 = len(chart1._xx)
         n2 = len(chart2._xx)
         if len(transformations) != n2:
@@ -2949,11 +3334,16 @@ class CoordChange(SageObject):
         self._chart2 = chart2
         self._transf = MultiFunctionChart(chart1, *transformations)
         self._inverse = None
+        self._numerical_jacobian = None # compiled Jacobian matrix (cf. 
+                                        # method numerical_inverse())
+        # Jacobian data, shared with the other coordinate changes and 
+        # differentiable mappings having the same expression:
+        self._jacobian_data = self._transf._jacobian_data(chart2)
         # Jacobian matrix: 
-        self._jacobian  = self._transf.jacobian()  
+        self._jacobian  = self._jacobian_data.jacobian()  
         # Jacobian determinant: 
         if n1 == n2: 
-            self._jacobian_det = self._transf.jacobian_det()
+            self._jacobian_det = self._jacobian_data.det()
         # If the two charts are on the same domain, the coordinate change is 
         # added to the domain (and superdomains) dictionary and the 
         # Jacobian matrix is added to the dictionary of changes of frame:
@@ -2961,19 +3351,47 @@ class CoordChange(SageObject):
             domain = chart1._domain
             for sdom in domain._superdomains:
                 sdom._coord_changes[(chart1, chart2)] = self
-            frame1 = chart1._frame
-            frame2 = chart2._frame
-            vf_module = domain.vector_field_module()
-            ch_basis = AutomorphismFieldParal(vf_module)
-            ch_basis.add_comp(frame1)[:, chart1] = self._jacobian
-            ch_basis.add_comp(frame2)[:, chart1] = self._jacobian
-            vf_module._basis_changes[(frame2, frame1)] = ch_basis
-            vf_module._basis_changes[(frame1, frame2)] = ch_basis.inverse()            
+            deferred = chart1._manifold._deferred_coord_changes
+            if deferred is not None:
+                # bulk atlas construction: the changes of frame are computed
+                # at the end (cf. Manifold.build_atlas)
+                deferred.append(self)
+            else:
+                self._register_frame_changes()
+
+    def _register_frame_changes(self):
+        r"""
+        Add the change of coordinate frames induced by ``self`` to the 
+        dictionaries of changes of frames of the domain and its superdomains.
+        """
+        from rank2field import AutomorphismFieldParal
+        chart1 = self._chart1
+        chart2 = self._chart2
+        domain = chart1._domain
+        frame1 = chart1._frame
+        frame2 = chart2._frame
+        vf_module = domain.vector_field_module()
+        ch_basis = AutomorphismFieldParal(vf_module)
+        ch_basis.add_comp(frame1)[:, chart1] = self._jacobian
+        ch_basis.add_comp(frame2)[:, chart1] = self._jacobian
+        # the inverse is taken from the shared Jacobian data, instead of being
+        # recomputed frame by frame by ch_basis.inverse():
+        jacob_inv = self._jacobian_data.inverse()
+        ch_inv = AutomorphismFieldParal(vf_module)
+        ch_inv.add_comp(frame1)[:, chart1] = jacob_inv
+        ch_inv.add_comp(frame2)[:, chart1] = jacob_inv
+        ch_basis._inverse = ch_inv
+        ch_inv._inverse = ch_basis
+        # the changes of frame derived from a former coordinate change 
+        # between the two charts are obsolete:
+        vf_module._del_derived_basis_changes()
+        vf_module._basis_changes[(frame2, frame1)] = ch_basis
+        vf_module._basis_changes[(frame1, frame2)] = ch_inv
+        for sdom in domain._superdomains:
+            sdom._frame_changes[(frame2, frame1)] = ch_basis
+        if (frame1, frame2) not in domain._frame_changes:
             for sdom in domain._superdomains:
-                sdom._frame_changes[(frame2, frame1)] = ch_basis
-            if (frame1, frame2) not in domain._frame_changes:
-                for sdom in domain._superdomains:
-                    sdom._frame_changes[(frame1, frame2)] = ch_basis.inverse()
+                sdom._frame_changes[(frame1, frame2)] = ch_basis.inverse()
 
     def _repr_(self):
         r"""
@@ -3090,25 +3508,157 @@ class CoordChange(SageObject):
                    "inverse manually.")
             x2_to_x1 = list_x2_to_x1[0]
         self._inverse = CoordChange(self._chart2, self._chart1, *x2_to_x1)
-        #
-        # Update of chart expressions of the frame changes:
-        if self._chart1._domain == self._chart2._domain:
-            domain = self._chart1._domain
-            frame1 = self._chart1._frame
-            frame2 = self._chart2._frame
-            fr_change12 = domain._frame_changes[(frame1,frame2)]
-            fr_change21 = domain._frame_changes[(frame2,frame1)]
-            for comp in fr_change12._components[frame1]._comp.itervalues():
-                comp.function_chart(self._chart1, from_chart=self._chart2)
-            for comp in fr_change12._components[frame2]._comp.itervalues():
-                comp.function_chart(self._chart1, from_chart=self._chart2)
-            for comp in fr_change21._components[frame1]._comp.itervalues():
-                comp.function_chart(self._chart2, from_chart=self._chart1)
-            for comp in fr_change21._components[frame2]._comp.itervalues():
-                comp.function_chart(self._chart2, from_chart=self._chart1)
+        # The chart expressions of the components of the frame changes are
+        # not updated here: they are computed on first use, by 
+        # ScalarField.function_chart, from the inverse that has just been 
+        # stored in the domain's dictionary of coordinate changes.
         return self._inverse
 
 
+    def numerical_inverse(self, *coords, **kwds):
+        r"""
+        Compute numerically the old coordinates from the new ones.
+
+        This is useful when the inverse coordinate transformation has no
+        closed form, so that :meth:`inverse` fails. The old coordinates are 
+        obtained by Newton iterations, involving the coordinate 
+        transformation and its Jacobian matrix compiled into numerical 
+        functions (the compilation is performed only at the first call).
+        The computation is vectorized: it can be applied at once to arrays 
+        of new coordinates. 
+
+        INPUT:
+
+        - ``*coords`` -- values of the new coordinates, either numbers or 
+          NumPy arrays of the same shape
+        - ``**kwds`` -- options:
+
+          - ``initial=None``, values of the old coordinates at which the 
+            Newton iterations are started; if None, the center of the 
+            coordinate ranges of the old chart is used
+          - ``tolerance=1e-12``, relative tolerance on the old coordinates
+          - ``max_iterations=50``, maximum number of Newton iterations
+
+        OUTPUT:
+
+        - tuple of the old coordinate values, as floats if ``coords`` are
+          numbers or as NumPy arrays otherwise; in the latter case, the 
+          values for which the Newton iterations have not converged to a 
+          point of the old chart are set to ``NaN``
+
+        EXAMPLES:
+
+        Inverse of a transcendental coordinate transformation (Kepler's 
+        equation)::
+
+            sage: M = Manifold(2, 'M')
+            sage: X.<x,y> = M.chart()
+            sage: Y.<u,v> = M.chart()
+            sage: ch = X.transition_map(Y, (x + sin(x)/2, y))
+            sage: xy = ch.numerical_inverse(1.5, 2) ; xy  # random (float output)
+            (1.0630731347759919, 2.0)
+            sage: [round(c, 8) for c in xy]
+            [1.06307313, 2.0]
+            sage: [round(c, 8) for c in ch(*xy)]  # check
+            [1.5, 2.0]
+
+        Vectorized computation::
+
+            sage: import numpy
+            sage: xx, yy = ch.numerical_inverse(numpy.array([0., 1.5]), 
+            ....:                               numpy.array([1., 2.]))
+            sage: [round(c, 8) for c in xx]
+            [0.0, 1.06307313]
+
+        """
+        import numpy
+        from utilities import numerical_function
+        x1 = self._chart1._xx
+        n = len(x1)
+        if len(self._chart2._xx) != n:
+            raise TypeError("The change of coordinates is not invertible " + 
+                            "(different number of coordinates in the two " + 
+                            "charts).")
+        if len(coords) != n:
+            raise ValueError(str(n) + " coordinates must be provided.")
+        if 'initial' in kwds:
+            initial = kwds['initial']
+        else:
+            initial = None
+        if 'tolerance' in kwds:
+            tolerance = kwds['tolerance']
+        else:
+            tolerance = 1e-12
+        if 'max_iterations' in kwds:
+            max_iterations = kwds['max_iterations']
+        else:
+            max_iterations = 50
+        functions = self._transf.numerical_functions()
+        if self._numerical_jacobian is None:
+            self._numerical_jacobian = [[numerical_function(jac._express, x1) 
+                                         for jac in row] 
+                                        for row in self._transf.jacobian()]
+        jacob = self._numerical_jacobian
+        yy = numpy.broadcast_arrays(*[numpy.asarray(y, dtype=numpy.float64) 
+                                      for y in coords])
+        shape = yy[0].shape
+        if initial is None:
+            # center of the coordinate ranges of chart1:
+            initial = []
+            for bounds in self._chart1._bounds:
+                try:
+                    xmin = float(bounds[0][0])
+                    xmax = float(bounds[1][0])
+                except TypeError: # bounds depending on some parameters
+                    xmin, xmax = -numpy.inf, numpy.inf
+                if numpy.isfinite(xmin) and numpy.isfinite(xmax):
+                    initial.append((xmin + xmax) / 2)
+                elif numpy.isfinite(xmin):
+                    initial.append(xmin + 1)
+                elif numpy.isfinite(xmax):
+                    initial.append(xmax - 1)
+                else:
+                    initial.append(0.)
+        xx = numpy.array([numpy.asarray(x0, dtype=numpy.float64) + 
+                          numpy.zeros(shape) for x0 in initial])
+        # the points are stored along the first axis for numpy.linalg:
+        xx = xx.reshape(n, -1).T
+        yy = numpy.array([y.ravel() for y in yy]).T
+        active = numpy.ones(xx.shape[0], dtype=bool)
+        with numpy.errstate(all='ignore'):
+            for it in range(max_iterations):
+                xa = xx[active].T
+                res = numpy.array([funct(*xa) for funct in functions]).T \
+                      - yy[active]
+                jac = numpy.array([[der(*xa) for der in row] 
+                                   for row in jacob]).transpose(2, 0, 1)
+                try:
+                    dx = numpy.linalg.solve(jac, res[..., None])[..., 0]
+                except numpy.linalg.LinAlgError: # some singular matrix
+                    dx = numpy.array([numpy.linalg.lstsq(jac_p, res_p)[0] 
+                                      for jac_p, res_p in zip(jac, res)])
+                xx[active] -= dx
+                done = numpy.all(numpy.abs(dx) <= 
+                                tolerance*(1 + numpy.abs(xx[active])), axis=1)
+                done |= ~numpy.all(numpy.isfinite(dx), axis=1)
+                ind = numpy.nonzero(active)[0]
+                active[ind[done]] = False
+                if not active.any():
+                    break
+            xx[active] = numpy.nan  # no convergence
+            xx = xx.T
+            # the solutions must lie in the chart1 domain:
+            valid = self._chart1.valid_coordinates_numerical(*xx, 
+                                                             tolerance=1e-10)
+            valid &= numpy.all(numpy.isfinite(xx), axis=0)
+            xx[:, ~valid] = numpy.nan
+        if shape == ():
+            if not valid[0]:
+                raise ValueError("The Newton iterations have not converged " + 
+                                 "to a point of the " + str(self._chart1))
+            return tuple(float(x[0]) for x in xx)
+        return tuple(x.reshape(shape) for x in xx)
+
     def set_inverse(self, *transformations, **kwds):
         r"""
         Sets the inverse of the coordinate transformation. 
@@ -3174,21 +3724,10 @@ class CoordChange(SageObject):
                 print "  ", x1[i], '==' , self._inverse(*(self(*x1)))[i]
             for i in range(n1):
                 print "  ", x2[i], '==', self(*(self._inverse(*x2)))[i]
-        # Update of chart expressions of the frame changes:
-        if self._chart1._domain == self._chart2._domain:
-            domain = self._chart1._domain
-            frame1 = self._chart1._frame
-            frame2 = self._chart2._frame
-            fr_change12 = domain._frame_changes[(frame1,frame2)]
-            fr_change21 = domain._frame_changes[(frame2,frame1)]
-            for comp in fr_change12._components[frame1]._comp.itervalues():
-                comp.function_chart(self._chart1, from_chart=self._chart2)
-            for comp in fr_change12._components[frame2]._comp.itervalues():
-                comp.function_chart(self._chart1, from_chart=self._chart2)
-            for comp in fr_change21._components[frame1]._comp.itervalues():
-                comp.function_chart(self._chart2, from_chart=self._chart1)
-            for comp in fr_change21._components[frame2]._comp.itervalues():
-                comp.function_chart(self._chart2, from_chart=self._chart1)
+        # The chart expressions of the components of the frame changes are
+        # not updated here: they are computed on first use, by 
+        # ScalarField.function_chart, from the inverse that has just been 
+        # stored in the domain's dictionary of coordinate changes.
     
     def __mul__(self, other):
         r""" 
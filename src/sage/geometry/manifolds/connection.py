@@ -389,13 +389,37 @@ class AffConnection(SageObject):
             [[0, 0, 0], [0, 0, 0], [0, 0, 0]],
             [[0, 0, 0], [0, 0, y*z], [0, 0, 0]]]
 
+        Connection coefficients with respect to a frame related to the
+        coordinate frame by a change of frame; they are deduced from the
+        coefficients in the coordinate frame by the transformation law (see
+        :meth:`_coef_from_frame_change`)::
+
+            sage: M = Manifold(2, 'M', start_index=1)
+            sage: c_xy.<x,y> = M.chart()
+            sage: nab = M.aff_connection('nabla')
+            sage: nab[1,1,1] = x
+            sage: ch = M.automorphism_field()
+            sage: ch[1,1], ch[2,2] = x, 1
+            sage: e = c_xy.frame().new_frame(ch, 'e')
+            sage: nab.coef(e)[:]
+            [[[x^2 + 1, 0], [0, 0]], [[0, 0], [0, 0]]]
+
+        The inverse change of frame is not required to be known::
+
+            sage: f = M.vector_frame('f')
+            sage: M.set_frame_change(c_xy.frame(), f, ch, compute_inverse=False)
+            sage: (f, c_xy.frame()) in M._frame_changes
+            False
+            sage: nab.coef(f)[:]
+            [[[x^2 + 1, 0], [0, 0]], [[0, 0], [0, 0]]]
+
         """
-        if frame is None: 
+        if frame is None:
             frame = self._domain._def_frame
         if frame not in self._coefficients:
             # the coefficients must be computed
             #
-            # Check whether frame is a subframe of a frame in which the 
+            # Check whether frame is a subframe of a frame in which the
             # coefficients are already known:
             for oframe in self._coefficients:
                 if frame in oframe._subframes:
@@ -406,6 +430,13 @@ class AffConnection(SageObject):
                         comp_store[ind] = value.restrict(frame._domain)
                     break
             else:
+                # Check whether the coefficients are known in a frame related
+                # to frame by a known change of frame:
+                for oframe in self._coefficients:
+                    if (oframe, frame) in self._domain._frame_changes:
+                        self._coefficients[frame] = \
+                                  self._coef_from_frame_change(oframe, frame)
+                        return self._coefficients[frame]
                 # If not, the coefficients must be computed from scratch:
                 manif = self._manifold
                 ev = frame  # the vector frame
@@ -419,6 +450,124 @@ class AffConnection(SageObject):
         return self._coefficients[frame]
         
 
+    def _frame_change_der(self, frame1, frame2):
+        r"""
+        Return the derivatives of the components of the change of frame
+        from ``frame1`` to ``frame2`` along the vectors of ``frame1``.
+
+        The derivatives do not depend on the connection; they are therefore
+        cached in the domain, for each pair of frames.
+
+        INPUT:
+
+        - ``frame1`` -- vector frame `(e_i)`
+        - ``frame2`` -- vector frame `(n_i)`, with `n_i = P(e_i)`
+
+        OUTPUT:
+
+        - dictionary of the nonzero scalar fields `e_m(P^s_{\ \, i})`, with
+          the triplets of indices `(s,i,m)` as keys
+
+        """
+        dom = self._domain
+        ch_frame = dom._frame_changes[(frame1, frame2)]
+        key = (frame1, frame2)
+        if key in dom._frame_change_der:
+            # the cached derivatives are valid only if the change of frame
+            # has not been redefined meanwhile:
+            cached_ch, dpp = dom._frame_change_der[key]
+            if cached_ch is ch_frame:
+                return dpp
+        dpp = {}
+        for ind, value in ch_frame.comp(frame1)._comp.iteritems():
+            for m in self._manifold.irange():
+                der = frame1[m](value)
+                if not der.is_zero():
+                    dpp[ind + (m,)] = der
+        dom._frame_change_der[key] = (ch_frame, dpp)
+        return dpp
+
+    def _coef_from_frame_change(self, frame1, frame2):
+        r"""
+        Compute the connection coefficients w.r.t. ``frame2`` from those
+        w.r.t. ``frame1``, via the change of frame between them.
+
+        Denoting by `(e_i)` the vector frame ``frame1``, by `(n_i)` the
+        vector frame ``frame2`` and by `P` the automorphism such that
+        `n_i = P(e_i)`, the connection coefficients obey the inhomogeneous
+        transformation law
+
+        .. MATH::
+
+            \bar\Gamma^k_{\ \, ij} = (P^{-1})^k_{\ \, s} \left(
+                P^m_{\ \, j}\, e_m(P^s_{\ \, i})
+                + P^l_{\ \, i} P^m_{\ \, j} \Gamma^s_{\ \, lm} \right)
+
+        where all the components are taken w.r.t. the frame `(e_i)`. The
+        sums are performed one index at a time and involve only the nonzero
+        components.
+
+        INPUT:
+
+        - ``frame1`` -- vector frame `(e_i)` in which the connection
+          coefficients are known
+        - ``frame2`` -- vector frame `(n_i)` in which the connection
+          coefficients are required
+
+        OUTPUT:
+
+        - connection coefficients w.r.t. ``frame2``, as an instance of
+          :class:`~sage.tensor.modules.comp.Components`
+
+        """
+        dom = self._domain
+        ch_frame = dom._frame_changes[(frame1, frame2)]
+        pp = ch_frame.comp(frame1)
+        if (frame2, frame1) in dom._frame_changes:
+            ppinv = dom._frame_changes[(frame2, frame1)].comp(frame1)
+        else:
+            # the inverse change of frame has not been set:
+            ppinv = ch_frame.inverse().comp(frame1)
+        ogam = self._nonzero_comp(self._coefficients[frame1])
+        # Nonzero components of P, grouped by rows, and of P^(-1), grouped
+        # by columns:
+        pp_rows = {}
+        for (l, i), value in pp._comp.iteritems():
+            pp_rows.setdefault(l, []).append((i, value))
+        ppinv_cols = {}
+        for (k, s), value in ppinv._comp.iteritems():
+            ppinv_cols.setdefault(s, []).append((k, value))
+        # 1/ B^s_{im} = e_m(P^s_i) + P^l_i Gamma^s_{lm}
+        bb = {}
+        for ind, value in self._frame_change_der(frame1, frame2).iteritems():
+            bb[ind] = [value]
+        for (s, l, m), coef in ogam.iteritems():
+            for i, value in pp_rows.get(l, []):
+                bb.setdefault((s, i, m), []).append(value * coef)
+        # 2/ A^s_{ij} = P^m_j B^s_{im}
+        aa = {}
+        for (s, i, m), terms in bb.iteritems():
+            bsum = terms[0]
+            for term in terms[1:]:
+                bsum += term
+            for j, value in pp_rows.get(m, []):
+                aa.setdefault((s, i, j), []).append(value * bsum)
+        # 3/ Gamma'^k_{ij} = (P^(-1))^k_s A^s_{ij}
+        gam_terms = {}
+        for (s, i, j), terms in aa.iteritems():
+            asum = terms[0]
+            for term in terms[1:]:
+                asum += term
+            for k, value in ppinv_cols.get(s, []):
+                gam_terms.setdefault((k, i, j), []).append(value * asum)
+        gam = self._new_coef(frame2)
+        for ind, terms in gam_terms.iteritems():
+            rsum = terms[0]
+            for term in terms[1:]:
+                rsum += term
+            gam[[ind]] = rsum
+        return gam
+
     def set_coef(self, frame=None):
         r"""
         Return the connection coefficients in a given frame for assignment.
@@ -760,23 +909,45 @@ class AffConnection(SageObject):
                               sym=tensor._sym, antisym=tensor._antisym)
         n_con = tensor._tensor_type[0]
         n_cov = tensor._tensor_type[1]
+        # Nonzero pattern of the connection coefficients, computed once:
+        #   gam_con[(a,p)] = [(i, Gamma^a_{ip}), ...] for contravariant slots
+        #   gam_cov[(b,p)] = [(i, Gamma^i_{bp}), ...] for covariant slots
+        gam_con = {}
+        gam_cov = {}
+        for ind, coef in self._nonzero_comp(gam).iteritems():
+            k, i, p = ind
+            gam_con.setdefault((k, p), []).append((i, coef))
+            gam_cov.setdefault((i, p), []).append((k, coef))
+        # Nonzero components of the tensor, all index orderings included:
+        tc_nz = self._nonzero_comp(tc)
+        # Partial derivatives of all the stored components, in a single pass:
+        dtc = {}
+        for ind0, value in tc._comp.iteritems():
+            for p in manif.irange():
+                dtc[ind0 + (p,)] = frame[p](value)
         for ind in resc.non_redundant_index_generator():
             p = ind[-1]  # derivation index
             ind0 = ind[:-1]
-            rsum = frame[p](tc[[ind0]])
-            # loop on contravariant indices:
-            for k in range(n_con): 
-                for i in manif.irange():
-                    indk = list(ind0)
-                    indk[k] = i  
-                    rsum += gam[[ind0[k], i, p]] * tc[[indk]]
-            # loop on covariant indices:
-            for k in range(n_con, tensor._tensor_rank): 
-                for i in manif.irange():
-                    indk = list(ind0)
-                    indk[k] = i  
-                    rsum -= gam[[i, ind0[k], p]] * tc[[indk]]
-            resc[[ind]] = rsum
+            terms = []
+            if ind in dtc:
+                terms.append(dtc[ind])
+            # contravariant indices: only the nonzero Gamma^a_{ip} contribute
+            for k in range(n_con):
+                for i, coef in gam_con.get((ind0[k], p), []):
+                    indk = ind0[:k] + (i,) + ind0[k+1:]
+                    if indk in tc_nz:
+                        terms.append(coef * tc_nz[indk])
+            # covariant indices: only the nonzero Gamma^i_{bp} contribute
+            for k in range(n_con, tensor._tensor_rank):
+                for i, coef in gam_cov.get((ind0[k], p), []):
+                    indk = ind0[:k] + (i,) + ind0[k+1:]
+                    if indk in tc_nz:
+                        terms.append(-(coef * tc_nz[indk]))
+            if terms:
+                rsum = terms[0]
+                for term in terms[1:]:
+                    rsum += term
+                resc[[ind]] = rsum
         # Resulting tensor field
         return tdom.vector_field_module().tensor_from_comp((n_con, n_cov+1),
                         resc, 
@@ -784,6 +955,69 @@ class AffConnection(SageObject):
                         latex_name=format_unop_latex(self._latex_name + ' ', 
                                                         tensor._latex_name) )
 
+    def _load_comp(self, frame, quantity, comp):
+        r"""
+        Set the components of some quantity derived from the connection from
+        a persistent cache, if available.
+
+        A generic affine connection has no persistent cache, so that this
+        method always returns False; it is redefined in
+        :class:`LeviCivitaConnection`.
+
+        INPUT:
+
+        - ``frame`` -- the frame of the components
+        - ``quantity`` -- string naming the quantity (e.g. ``'riemann'``)
+        - ``comp`` -- the components to be set
+
+        OUTPUT:
+
+        - True if the components have been set, False otherwise
+
+        """
+        return False
+
+    def _save_comp(self, frame, quantity, comp):
+        r"""
+        Store the components of some quantity derived from the connection in
+        a persistent cache.
+
+        A generic affine connection has no persistent cache, so that this
+        method does nothing; it is redefined in :class:`LeviCivitaConnection`.
+
+        """
+        pass
+
+    def _nonzero_comp(self, comp):
+        r"""
+        Return the nonzero values of a set of components, including those 
+        that are not stored owing to some (anti)symmetry.
+        
+        INPUT:
+        
+        - ``comp`` -- instance of 
+          :class:`~sage.tensor.modules.comp.Components`
+          
+        OUTPUT:
+        
+        - dictionary of the nonzero components, with the full tuple of 
+          indices as keys
+
+        """
+        from sage.tensor.modules.comp import CompWithSym
+        if not isinstance(comp, CompWithSym) or \
+                             (comp._sym == [] and comp._antisym == []):
+            return dict(comp._comp)
+        resu = {}
+        for ind in comp.index_generator():
+            sign, oind = comp._ordered_indices(ind)
+            if sign != 0 and oind in comp._comp:
+                if sign == 1:
+                    resu[ind] = comp._comp[oind]
+                else:
+                    resu[ind] = -comp._comp[oind]
+        return resu
+
     def torsion(self):
         r""" 
         Return the connection's torsion tensor.
@@ -986,6 +1220,7 @@ class AffConnection(SageObject):
             (1/32*u^3 - 1/32*u*v^2 - 1/32*v^3 + 1/32*(u^2 + 4)*v - 1/8*u - 1/4) d/du*du*du*dv + (-1/32*u^3 + 1/32*u*v^2 + 1/32*v^3 - 1/32*(u^2 + 4)*v + 1/8*u + 1/4) d/du*du*dv*du + (1/32*u^3 - 1/32*u*v^2 + 3/32*v^3 - 1/32*(3*u^2 - 4)*v - 1/8*u + 1/4) d/du*dv*du*dv + (-1/32*u^3 + 1/32*u*v^2 - 3/32*v^3 + 1/32*(3*u^2 - 4)*v + 1/8*u - 1/4) d/du*dv*dv*du + (-1/32*u^3 + 1/32*u*v^2 + 5/32*v^3 - 1/32*(5*u^2 + 4)*v + 1/8*u - 1/4) d/dv*du*du*dv + (1/32*u^3 - 1/32*u*v^2 - 5/32*v^3 + 1/32*(5*u^2 + 4)*v - 1/8*u + 1/4) d/dv*du*dv*du + (-1/32*u^3 + 1/32*u*v^2 + 1/32*v^3 - 1/32*(u^2 + 4)*v + 1/8*u + 1/4) d/dv*dv*du*dv + (1/32*u^3 - 1/32*u*v^2 - 1/32*v^3 + 1/32*(u^2 + 4)*v - 1/8*u - 1/4) d/dv*dv*dv*du
 
         """
+        from utilities import compute_components
         if self._riemann is None:
             manif = self._manifold
             resu = self._domain.tensor_field(1, 3, antisym=(2,3))
@@ -996,21 +1231,32 @@ class AffConnection(SageObject):
                         break
                 else:
                     # frame in not a subframe and the computation is performed:
+                    res = resu.add_comp(frame)
+                    if self._load_comp(frame, 'riemann', res):
+                        continue  # the components were in the disk cache
                     sc = frame.structure_coef()
                     gam_gam = gam.contract(1, gam, 0)
                     gam_sc = gam.contract(2, sc, 0)
-                    res = resu.add_comp(frame)
-                    for i in manif.irange():
-                        for j in manif.irange():
-                            for k in manif.irange():
-                                # antisymmetry of the Riemann tensor taken into 
-                                # account by l>k: 
-                                for l in manif.irange(start=k+1):
-                                    res[i,j,k,l] = frame[k](gam[[i,j,l]]) - \
-                                                   frame[l](gam[[i,j,k]]) + \
-                                                   gam_gam[[i,k,j,l]] -  \
-                                                   gam_gam[[i,l,j,k]] -  \
-                                                   gam_sc[[i,j,k,l]]
+                    def riemann_comp(ind):
+                        i, j, k, l = ind
+                        return frame[k](gam[[i,j,l]]) - \
+                               frame[l](gam[[i,j,k]]) + \
+                               gam_gam[[i,k,j,l]] -  \
+                               gam_gam[[i,l,j,k]] -  \
+                               gam_sc[[i,j,k,l]]
+                    # antisymmetry of the Riemann tensor taken into account 
+                    # by l>k: 
+                    indices = [(i,j,k,l) for i in manif.irange() 
+                                         for j in manif.irange()
+                                         for k in manif.irange()
+                                         for l in manif.irange(start=k+1)]
+                    # The independent components are possibly computed in 
+                    # parallel:
+                    for ind, value in compute_components(riemann_comp, 
+                                      indices, frame._domain, 
+                                      nproc=manif._nproc):
+                        res[[ind]] = value
+                    self._save_comp(frame, 'riemann', res)
             self._riemann = resu
         return self._riemann 
         
@@ -1591,6 +1837,37 @@ class LeviCivitaConnection(AffConnection):
             self._restrictions[subdomain] = resu
         return self._restrictions[subdomain]
 
+    def _load_comp(self, frame, quantity, comp):
+        r"""
+        Set the components of some quantity derived from the connection from
+        the disk cache, if the latter is active (see 
+        :mod:`~sage.geometry.manifolds.diskcache`).
+
+        INPUT:
+
+        - ``frame`` -- the frame of the components
+        - ``quantity`` -- string naming the quantity (e.g. ``'riemann'``)
+        - ``comp`` -- the components to be set
+
+        OUTPUT:
+
+        - True if the components have been found in the disk cache, False 
+          otherwise
+
+        """
+        from diskcache import load_components
+        return load_components(self._metric, frame, quantity, comp)
+
+    def _save_comp(self, frame, quantity, comp):
+        r"""
+        Store the components of some quantity derived from the connection in
+        the disk cache, if the latter is active (see 
+        :mod:`~sage.geometry.manifolds.diskcache`).
+
+        """
+        from diskcache import save_components
+        save_components(self._metric, frame, quantity, comp)
+
     def _new_coef(self, frame): 
         r"""
         Create the connection coefficients w.r.t. the given frame. 
@@ -1693,6 +1970,7 @@ class LeviCivitaConnection(AffConnection):
         """
         from scalarfield import ScalarField
         from vectorframe import CoordFrame
+        from utilities import compute_components
         if frame is None: 
             frame = self._domain._def_frame
         if frame not in self._coefficients:
@@ -1715,9 +1993,13 @@ class LeviCivitaConnection(AffConnection):
                     # Christoffel symbols
                     chart = frame._chart
                     gam = self._new_coef(frame)
+                    if self._load_comp(frame, 'christoffel', gam):
+                        # the Christoffel symbols were in the disk cache
+                        self._coefficients[frame] = gam
+                        return gam
                     gg = self._metric.comp(frame)
                     ginv = self._metric.inverse().comp(frame)
-                    for ind in gam.non_redundant_index_generator():
+                    def christoffel(ind):
                         i, j, k = ind
                         # The computation is performed at the FunctionChart level:
                         rsum = 0
@@ -1726,8 +2008,15 @@ class LeviCivitaConnection(AffConnection):
                                                 gg[s,k, chart].diff(j)
                                               + gg[j,s, chart].diff(k)
                                               - gg[j,k, chart].diff(s) )
-                        gam[i,j,k, chart] = rsum / 2
-                        self._coefficients[frame] = gam
+                        return ScalarField(frame._domain, rsum / 2)
+                    # The independent components are possibly computed in 
+                    # parallel:
+                    for ind, value in compute_components(christoffel, 
+                                  list(gam.non_redundant_index_generator()),
+                                  frame._domain, nproc=manif._nproc):
+                        gam[[ind]] = value
+                    self._save_comp(frame, 'christoffel', gam)
+                    self._coefficients[frame] = gam
                 else:
                     # Computation from the formula defining the connection coef.
                     return AffConnection.coef(self, frame)
@@ -1871,20 +2160,31 @@ class LeviCivitaConnection(AffConnection):
             True
 
         """
+        from utilities import compute_components
         if self._ricci is None:
             manif = self._manifold
             riem = self.riemann()
             resu = self._domain.tensor_field(0,2, sym=(0,1))
             for frame in self._coefficients:
                 cric = resu.add_comp(frame)
+                if self._load_comp(frame, 'ricci', cric):
+                    continue  # the components were in the disk cache
                 criem = riem.comp(frame)
-                for i in manif.irange():
-                    # symmetry of the Ricci tensor taken into account by j>=i: 
-                    for j in manif.irange(start=i):  
-                        rsum = 0
-                        for k in manif.irange():
-                            rsum += criem[[k,i,k,j]]
-                        cric[i,j] = rsum
+                def ricci_comp(ind):
+                    i, j = ind
+                    rsum = 0
+                    for k in manif.irange():
+                        rsum += criem[[k,i,k,j]]
+                    return rsum
+                # symmetry of the Ricci tensor taken into account by j>=i: 
+                indices = [(i,j) for i in manif.irange() 
+                                 for j in manif.irange(start=i)]
+                # The independent components are possibly computed in 
+                # parallel:
+                for ind, value in compute_components(ricci_comp, indices, 
+                                         frame._domain, nproc=manif._nproc):
+                    cric[[ind]] = value
+                self._save_comp(frame, 'ricci', cric)
             if name is None:
                 resu._name = "Ric(" + self._metric._name + ")"
             else:
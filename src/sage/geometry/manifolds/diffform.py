@@ -653,9 +653,7 @@ class DiffFormParal(FreeModuleAltForm, TensorFieldParal):
             True
 
         """
-        from sage.calculus.functional import diff
         from utilities import format_unop_txt, format_unop_latex
-        from sage.tensor.modules.comp import CompFullyAntiSym
         from vectorframe import CoordFrame
         if self._exterior_derivative is None:
             # A new computation is necessary:
@@ -666,51 +664,142 @@ class DiffFormParal(FreeModuleAltForm, TensorFieldParal):
                                                       self._tensor_rank+1, 
                                                       name=rname, 
                                                       latex_name=rlname)
-            # 1/ List of all coordinate frames in which the components of self
-            # are known
-            coord_frames = []
+            # 1/ List of the frames in which the computation is performed: 
+            # all the coordinate frames in which the components of self are 
+            # known or, if there is none, a single frame of self._components
+            # (the computation involving then the structure coefficients)
+            frames = []
             for frame in self._components:
                 if isinstance(frame, CoordFrame):
-                    coord_frames.append(frame)
-            if coord_frames == []:
-                # A coordinate frame is searched, at the price of a change of
-                # frame, priveleging the frame of the domain's default chart
-                dom = self._domain
-                def_coordf = dom._def_chart._frame
-                for frame in self._components:
-                    if (frame, def_coordf) in dom._frame_changes:
-                        self.comp(def_coordf, from_basis=frame)
-                        coord_frames = [def_coordf]
-                        break
-                if coord_frames == []:
-                    for chart in dom._atlas:
-                        if chart != dom._def_chart: # the case def_chart is treated above
-                            coordf = chart._frame
-                            for frame in self._components:
-                                if (frame, coordf) in dom._frame_changes:
-                                    self.comp(coordf, from_basis=frame)
-                                    coord_frames[coordf]
-                                    break
-                            if coord_frames != []:
-                                break   
+                    frames.append(frame)
+            if frames == []:
+                if fmodule._def_basis in self._components:
+                    frames = [fmodule._def_basis]
+                else:
+                    frames = [self._components.keys()[0]]
             # 2/ The computation:
-            for frame in coord_frames:
-                chart = frame._chart
-                sc = self._components[frame]
-                dc = CompFullyAntiSym(fmodule._ring, frame, 
-                                      self._tensor_rank+1, 
-                                      start_index=fmodule._sindex,
-                                     output_formatter=fmodule._output_formatter)
-                for ind, val in sc._comp.iteritems():
-                    for i in fmodule.irange():
-                        ind_d = (i,) + ind
-                        if len(ind_d) == len(set(ind_d)): 
-                            # all indices are different
-                            dc[[ind_d]] += \
-                               val.function_chart(chart).diff(i).scalar_field()
-                self._exterior_derivative._components[frame] = dc
+            for frame in frames:
+                self._exterior_derivative._components[frame] = \
+                                                self._exterior_der_comp(frame)
         return self._exterior_derivative
 
+    def _exterior_der_comp(self, frame):
+        r"""
+        Compute the components of the exterior derivative of ``self`` in a 
+        given vector frame. 
+
+        The components `\omega_{j_1\ldots j_p}` of ``self`` being known
+        for `j_1<\cdots<j_p`, the components of the exterior derivative are
+
+        .. MATH::
+
+            (\mathrm{d}\omega)_{i_0\ldots i_p} = \sum_{k=0}^p (-1)^k 
+            e_{i_k}(\omega_{i_0\ldots\hat{\imath}_k\ldots i_p}) 
+            + \sum_{0\leq k<l\leq p} (-1)^{k+l} C^m_{\ \, i_k i_l}
+            \omega_{m i_0\ldots\hat{\imath}_k\ldots\hat{\imath}_l
+            \ldots i_p}
+
+        where the `C^m_{\ \, ij}` are the structure coefficients of the 
+        frame `(e_i)` (cf. 
+        :meth:`~sage.geometry.manifolds.vectorframe.VectorFrame.structure_coef`),
+        which vanish for a coordinate frame. Each nonzero component 
+        `\omega_{j_1\ldots j_p}` is distributed to the strictly increasing
+        index sets `(i_0,\ldots,i_p)` obtained by inserting a new index 
+        in `(j_1,\ldots,j_p)`, the sign `(-1)^k` of the insertion at 
+        position `k` being read from a table. In a coordinate frame, the 
+        terms are summed as symbolic expressions, so that a single 
+        simplification and a single scalar field are required per 
+        component. 
+
+        INPUT:
+
+        - ``frame`` -- vector frame in which the components of ``self`` are
+          known
+
+        OUTPUT:
+
+        - instance of :class:`~sage.tensor.modules.comp.CompFullyAntiSym`
+          representing the components of the exterior derivative in 
+          ``frame``
+
+        EXAMPLE:
+
+        Exterior derivative of a 1-form in the orthonormal frame 
+        associated with polar coordinates::
+
+            sage: M = Manifold(2, 'M', start_index=1)
+            sage: c_pol.<r,ph> = M.chart(r'r:(0,+oo) ph:(0,2*pi):\phi')
+            sage: e = M.vector_frame('e')
+            sage: e[1][:] = [1, 0]
+            sage: e[2][:] = [0, 1/r]
+            sage: a = M.one_form('a')
+            sage: a[e,:] = [0, r]    # a = r^2 dph
+            sage: a._exterior_der_comp(e)[1,2]
+            2
+            sage: a.exterior_der()[c_pol.frame(),1,2]   # check in polar coordinates
+            2*r
+
+        """
+        from sage.tensor.modules.comp import CompFullyAntiSym
+        from vectorframe import CoordFrame
+        from chart import FunctionChart
+        from utilities import simplify_chain
+        fmodule = self._fmodule # shortcut
+        si = fmodule._sindex
+        nsi = si + fmodule._rank
+        sc = self._components[frame]
+        dc = CompFullyAntiSym(fmodule._ring, frame, self._tensor_rank+1, 
+                              start_index=si, 
+                              output_formatter=fmodule._output_formatter)
+        def insertions(ind):
+            # table of the insertions of a new index i in the strictly 
+            # increasing index set ind, as triples (i, sign, new index set):
+            resu = []
+            pos = 0
+            for i in range(si, nsi):
+                if pos < len(ind) and ind[pos] == i:
+                    pos += 1
+                else:
+                    resu.append((i, (-1)**pos, ind[:pos] + (i,) + ind[pos:]))
+            return resu
+        terms = {}  # terms of the components of the exterior derivative
+        if isinstance(frame, CoordFrame):
+            chart = frame._chart
+            for ind, val in sc._comp.iteritems():
+                funct = val.function_chart(chart)
+                for i, sign, ind_d in insertions(ind):
+                    dexpr = funct.diff(i)._express
+                    if not dexpr.is_zero():
+                        terms.setdefault(ind_d, []).append(sign*dexpr)
+            for ind_d, expressions in terms.iteritems():
+                funct = FunctionChart(chart, simplify_chain(sum(expressions)))
+                if not funct.is_zero():
+                    dc._comp[ind_d] = funct.scalar_field()
+            return dc
+        # Case of a non-coordinate frame; first the derivative terms:
+        for ind, val in sc._comp.iteritems():
+            for i, sign, ind_d in insertions(ind):
+                terms.setdefault(ind_d, []).append(sign*frame[i](val))
+        # then the structure coefficient terms, omega_{m K} being 
+        # (-1)^pos omega_J, with m at the position pos in J and K = J minus m:
+        struct_coef = frame.structure_coef()._comp
+        for ind, val in sc._comp.iteritems():
+            for pos, m in enumerate(ind):
+                ind_k = ind[:pos] + ind[pos+1:]
+                for ind_c, coef in struct_coef.iteritems():
+                    a = ind_c[1] ; b = ind_c[2]  # a < b
+                    if ind_c[0] != m or a in ind_k or b in ind_k:
+                        continue
+                    ind_d = tuple(sorted(ind_k + (a, b)))
+                    sign = (-1)**(ind_d.index(a) + ind_d.index(b) + pos)
+                    terms.setdefault(ind_d, []).append(sign*coef*val)
+        for ind_d, values in terms.iteritems():
+            res = sum(values[1:], values[0])
+            if not res.is_zero():
+                dc._comp[ind_d] = res
+        return dc
+
+
     def wedge(self, other):
         r"""
         Exterior product with another differential form. 
@@ -758,6 +847,11 @@ class DiffFormParal(FreeModuleAltForm, TensorFieldParal):
         where `\epsilon` is the volume form associated with some 
         pseudo-Riemannian metric `g` on the manifold, and the indices 
         `k_1,\ldots, k_p` are raised with `g`. 
+
+        The computation is performed by the Hodge operator associated with 
+        `g` (see 
+        :class:`~sage.geometry.manifolds.metric.HodgeOperator`), which
+        reduces it to a scaling of the components with raised indices.
         
         INPUT:
         
@@ -901,18 +995,7 @@ class DiffFormParal(FreeModuleAltForm, TensorFieldParal):
             True
 
         """
-        from sage.functions.other import factorial
-        from utilities import format_unop_txt, format_unop_latex
-        p = self._tensor_rank
-        eps = metric.volume_form(p)
-        resu = self.contract(0, eps, 0)
-        for j in range(1, p):
-            resu = resu.trace(0, p-j)
-        if p > 1:
-            resu = resu / factorial(p)
-        resu.set_name(name=format_unop_txt('*', self._name),
-                     latex_name=format_unop_latex(r'\star ', self._latex_name))
-        return resu
+        return metric.hodge_operator()(self)
         
 #******************************************************************************
 
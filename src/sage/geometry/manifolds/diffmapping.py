@@ -16,6 +16,9 @@ Subclasses of :class:`DiffMapping` are devoted to specific cases:
   
   * :class:`IdentityMap` for the identity map of an open set. 
 
+* :class:`CompositeDiffMapping` for the composite of two differentiable 
+  mappings
+
 
 AUTHORS:
 
@@ -38,6 +41,46 @@ from domain import Domain
 from chart import Chart, FunctionChart, MultiFunctionChart, CoordChange
 from point import Point
      
+class CoordExpressionDict(dict):
+    r"""
+    Dictionary of the coordinate expressions of a differentiable mapping, 
+    which records its modifications by means of a version number. 
+
+    The version number allows :class:`CompositeDiffMapping` to update its 
+    coordinate expressions only when those of the composed mappings have 
+    been modified. 
+
+    EXAMPLE::
+
+        sage: from sage.geometry.manifolds.diffmapping import CoordExpressionDict
+        sage: d = CoordExpressionDict()
+        sage: d._version
+        0
+        sage: d['a'] = 1 ; d._version
+        1
+        sage: d.clear() ; d._version
+        2
+
+    """
+    def __init__(self, *args, **kwds):
+        dict.__init__(self, *args, **kwds)
+        self._version = 0
+
+    def __setitem__(self, key, value):
+        dict.__setitem__(self, key, value)
+        self._version += 1
+
+    def __delitem__(self, key):
+        dict.__delitem__(self, key)
+        self._version += 1
+
+    def clear(self):
+        dict.clear(self)
+        self._version += 1
+
+
+#******************************************************************************
+
 class DiffMapping(SageObject):
     r"""
     Class for differentiable mappings between manifolds.
@@ -200,7 +243,7 @@ class DiffMapping(SageObject):
             raise TypeError("The argument codomain must be a domain.")
         self._domain = domain
         self._codomain = codomain
-        self._coord_expression = {}
+        self._coord_expression = CoordExpressionDict()
         if coord_functions is not None:
             if not isinstance(coord_functions, dict):
                 # Turn coord_functions into a dictionary:
@@ -259,12 +302,14 @@ class DiffMapping(SageObject):
         Initialize the derived quantities
         """
         self._restrictions = {} # dict. of restrictions to subdomains of self._domain
+        self._pullback_data = {} # data for the pullback (key: pair of charts)
 
     def _del_derived(self):
         r"""
         Delete the derived quantities
         """
         self._restrictions.clear()
+        self._pullback_data.clear()
 
     def __eq__(self, other):
         r"""
@@ -931,6 +976,9 @@ class DiffMapping(SageObject):
         else:
             self._coord_expression[(chart1, chart2)] = \
                                    MultiFunctionChart(chart1, coord_functions)
+        # the pullback data for the pair of charts may be obsolete:
+        if (chart1, chart2) in self._pullback_data:
+            del self._pullback_data[(chart1, chart2)]
 
 
     def __call__(self, p, chart1=None, chart2=None):
@@ -1101,6 +1149,89 @@ class DiffMapping(SageObject):
         return self._restrictions[(subdomain, subcodomain)]
 
         
+    def __mul__(self, other):
+        r"""
+        Composition of ``self`` with another differentiable mapping.
+
+        INPUT:
+
+        - ``other`` -- a differentiable mapping `\Phi`, whose codomain is 
+          a subdomain of the domain of ``self``, `\Psi` say
+          
+        OUTPUT:
+
+        - the composite mapping `\Psi\circ\Phi`, as an instance of 
+          :class:`CompositeDiffMapping`; its coordinate expressions and 
+          their Jacobian matrices are computed only when they are required, 
+          from those of `\Psi` and `\Phi` (chain rule)
+
+        EXAMPLES:
+
+        Composite of a curve in `\RR^2` with a map `\RR^2\rightarrow\RR^2`::
+
+            sage: M = Manifold(1, 'R')
+            sage: T.<t> = M.chart()
+            sage: N = Manifold(2, 'N')
+            sage: X.<x,y> = N.chart()
+            sage: P = Manifold(2, 'P')
+            sage: Y.<u,v> = P.chart()
+            sage: phi = M.diff_mapping(N, (t, t^2), name='phi')
+            sage: psi = N.diff_mapping(P, (x+y, x*y), name='psi')
+            sage: chi = psi * phi ; chi
+            differentiable mapping 'psi o phi' from 1-dimensional manifold 'R' to 2-dimensional manifold 'P'
+            sage: chi.expr()
+            (t^2 + t, t^3)
+            sage: chi.multi_function_chart(T, Y).jacobian()  # obtained by the chain rule
+            [[2*t + 1], [3*t^2]]
+
+        The pullback by the composite mapping is performed in a single pass, 
+        without any intermediate tensor field on `N`::
+
+            sage: a = P.one_form('a')
+            sage: a[:] = [v, 0]
+            sage: chi.pullback(a)[:]
+            [2*t^4 + t^3]
+            sage: chi.pullback(a) == phi.pullback(psi.pullback(a))
+            True
+
+        The composition with the identity map is trivial::
+
+            sage: psi * N.identity_map() is psi
+            True
+
+        unless the identity map is that of a subdomain, in which case the 
+        composition results in a restriction::
+
+            sage: U = N.open_domain('U', coord_def={X: x>0})
+            sage: psi * U.identity_map() is psi.restrict(U)
+            True
+
+        """
+        from utilities import format_mul_txt, format_mul_latex
+        if not isinstance(other, DiffMapping):
+            raise TypeError("The argument must be a differentiable mapping.")
+        if not other._codomain.is_subdomain(self._domain):
+            raise ValueError("The codomain of " + str(other) + 
+                             " is not included in the domain of " + 
+                             str(self) + ".")
+        if isinstance(other, IdentityMap):
+            if other._domain == self._domain:
+                return self
+            return self.restrict(other._domain)
+        if isinstance(self, IdentityMap) and other._codomain == self._domain:
+            return other
+        return CompositeDiffMapping(self, other, 
+                          name=format_mul_txt(self._name, ' o ', other._name),
+                    latex_name=format_mul_latex(self._latex_name, r'\circ ', 
+                                                other._latex_name))
+
+    def _expression_stamp(self):
+        r"""
+        Return an object that changes whenever the coordinate expressions of
+        ``self`` are modified (cf. :class:`CompositeDiffMapping`).
+        """
+        return self._coord_expression._version
+
     def pullback(self, tensor):
         r""" 
         Pullback operator associated with the differentiable mapping. 
@@ -1165,7 +1296,6 @@ class DiffMapping(SageObject):
 
         """
         from tensorfield import TensorFieldParal
-        from chart import FunctionChart
         dom1 = self._domain
         dom2 = self._codomain
         tdom = tensor._domain
@@ -1187,11 +1317,8 @@ class DiffMapping(SageObject):
             for chart2 in tensor._express:
                 for chart1 in dom1._atlas:
                     if (chart1, chart2) in self._coord_expression:
-                        phi = self._coord_expression[(chart1, chart2)]
-                        coord1 = chart1._xx
                         ff = tensor._express[chart2]
-                        resu_fc.append( FunctionChart(chart1, 
-                                                       ff(*(phi(*coord1)))) )
+                        resu_fc.append( self._substitute(chart1, chart2, ff) )
             dom_resu = resu_fc[0]._chart._domain
             for fc in resu_fc[1:]:
                 dom_resu = dom_resu.union(fc._chart._domain)
@@ -1228,6 +1355,170 @@ class DiffMapping(SageObject):
                         resu._components[frame] = comp                 
         return resu
     
+    def pullbacks(self, tensors):
+        r""" 
+        Pullback of several tensor fields by the differentiable mapping. 
+
+        This is equivalent to applying :meth:`pullback` to each tensor field,
+        the Jacobian matrices of the mapping, the coordinate expressions 
+        of the mapping and the substitutions of the mapping in the 
+        coordinate expressions of the components being computed only once 
+        for all the tensor fields (cf. :meth:`_get_pullback_data`). 
+
+        INPUT:
+        
+        - ``tensors`` -- list (or tuple) of fully covariant tensor fields 
+          (or scalar fields) on the mapping's codomain
+          
+        OUTPUT:
+        
+        - list of the pullbacks of the elements of ``tensors``
+
+        EXAMPLE:
+
+        Pullback on `S^2` of the Euclidean metric and of a 2-form on `R^3`::
+        
+            sage: M = Manifold(2, 'S^2', start_index=1)
+            sage: U = M.open_domain('U') # the complement of a meridian (domain of spherical coordinates)
+            sage: c_spher.<th,ph> = U.chart(r'th:(0,pi):\theta ph:(0,2*pi):\phi') # spherical coord. on U
+            sage: N = Manifold(3, 'R^3', r'\RR^3', start_index=1)
+            sage: c_cart.<x,y,z> = N.chart() # Cartesian coord. on R^3
+            sage: Phi = U.diff_mapping(N, (sin(th)*cos(ph), sin(th)*sin(ph), cos(th)), name='Phi', latex_name=r'\Phi')
+            sage: g = N.sym_bilin_form_field('g')
+            sage: g[1,1], g[2,2], g[3,3] = 1, 1, 1
+            sage: a = N.diff_form(2, 'A')
+            sage: a[1,2] = z
+            sage: pg, pa = Phi.pullbacks([g, a])
+            sage: pg.view()
+            Phi_*(g) = dth*dth + sin(th)^2 dph*dph
+            sage: pa.view()
+            Phi_*(A) = cos(th)^2*sin(th) dth/\dph
+
+        """
+        return [self.pullback(tensor) for tensor in tensors]
+
+    def _get_pullback_data(self, chart1, chart2):
+        r"""
+        Return the data used to pull back fields from a chart on the 
+        codomain to a chart on the domain. 
+
+        The data are computed at the first call and stored in the mapping, 
+        so that they are shared by all the pullbacks.
+
+        INPUT:
+
+        - ``chart1`` -- chart on the mapping's domain
+        - ``chart2`` -- chart on the mapping's codomain, such that the 
+          coordinate expression of the mapping is known in the pair
+          ``(chart1, chart2)``
+
+        OUTPUT:
+
+        - dictionary with the following entries:
+
+          - ``'jacobian'``: Jacobian matrix of the mapping, as a list of 
+            lists of functions of the coordinates of ``chart1``, the 
+            element ``[i][j]`` being the derivative of the `i`-th 
+            coordinate of ``chart2`` with respect to the `j`-th coordinate 
+            of ``chart1``
+          - ``'coord2_1'``: the coordinates of ``chart2`` expressed in terms
+            of those of ``chart1`` via the mapping
+          - ``'column'``: the nonzero elements of the Jacobian matrix, in the
+            format required by 
+            :meth:`~sage.tensor.modules.comp.Components._slot_transform`
+            for the pullback, i.e. a dictionary whose keys are the indices 
+            `j` of the coordinates of ``chart2`` and whose values are the 
+            lists of pairs `(i, \partial y^j/\partial x^i)`, `(x^i)` and 
+            `(y^j)` being the coordinates of ``chart1`` and ``chart2`` 
+            respectively
+          - ``'pushforward_column'``: the same elements in the format 
+            required for the pushforward, i.e. a dictionary whose keys are 
+            the indices `i` and whose values are the lists of pairs 
+            `(j, \partial y^j/\partial x^i)`
+          - ``'subs'``: dictionary of the functions of the coordinates of 
+            ``chart2`` already composed with the mapping (key: string 
+            representation of the expression in ``chart2``, value: 
+            function of the coordinates of ``chart1``)
+
+        EXAMPLE::
+
+            sage: M = Manifold(2, 'M')
+            sage: X.<x,y> = M.chart()
+            sage: N = Manifold(2, 'N')
+            sage: Y.<u,v> = N.chart()
+            sage: Phi = M.diff_mapping(N, (x+y, x*y), name='Phi')
+            sage: data = Phi._get_pullback_data(X, Y)
+            sage: data['coord2_1']
+            (x + y, x*y)
+            sage: data['jacobian']
+            [[1, 1], [y, x]]
+            sage: Phi._get_pullback_data(X, Y) is data
+            True
+
+        """
+        if (chart1, chart2) not in self._pullback_data:
+            # a new computation is necessary
+            phi = self._coord_expression[(chart1, chart2)]
+            jacob = phi._jacobian_data(chart2).jacobian()
+            si1 = chart1._domain._manifold._sindex
+            si2 = chart2._domain._manifold._sindex
+            column = {}
+            push_column = {}
+            for j, row in enumerate(jacob):
+                for i, elt in enumerate(row):
+                    if not elt.is_zero():
+                        column.setdefault(j+si2, []).append((i+si1, elt))
+                        push_column.setdefault(i+si1, []).append((j+si2, elt))
+            data = {'jacobian': jacob, 'column': column, 
+                    'pushforward_column': push_column,
+                    'coord2_1': phi(*(chart1._xx)), 'subs': {}}
+            self._pullback_data[(chart1, chart2)] = data
+        return self._pullback_data[(chart1, chart2)]
+
+    def _substitute(self, chart1, chart2, funct):
+        r"""
+        Compose a function of the coordinates of a chart on the codomain 
+        with the mapping. 
+
+        The result is stored in the pullback data of the pair of charts 
+        (cf. :meth:`_get_pullback_data`), so that identical expressions,
+        even in different tensor fields, are substituted only once.
+
+        INPUT:
+
+        - ``chart1`` -- chart on the mapping's domain
+        - ``chart2`` -- chart on the mapping's codomain, such that the 
+          coordinate expression of the mapping is known in the pair
+          ``(chart1, chart2)``
+        - ``funct`` -- function of the coordinates of ``chart2`` (instance
+          of :class:`~sage.geometry.manifolds.chart.FunctionChart`)
+
+        OUTPUT:
+
+        - function of the coordinates of ``chart1`` (instance of 
+          :class:`~sage.geometry.manifolds.chart.FunctionChart`)
+
+        EXAMPLE::
+
+            sage: M = Manifold(2, 'M')
+            sage: X.<x,y> = M.chart()
+            sage: N = Manifold(2, 'N')
+            sage: Y.<u,v> = N.chart()
+            sage: Phi = M.diff_mapping(N, (x+y, x*y), name='Phi')
+            sage: f = Y.function(u^2 + v)
+            sage: Phi._substitute(X, Y, f)
+            (x + y)^2 + x*y
+            sage: Phi._substitute(X, Y, Y.function(u^2 + v)) is Phi._substitute(X, Y, f)
+            True
+
+        """
+        data = self._get_pullback_data(chart1, chart2)
+        subs = data['subs']
+        key = str(funct._express)
+        if key not in subs:
+            subs[key] = FunctionChart(chart1, funct(*(data['coord2_1'])))
+        return subs[key]
+
     def _pullback_paral(self, tensor):
         r"""
         Pullback on parallelizable domains. 
@@ -1236,7 +1527,6 @@ class DiffMapping(SageObject):
         from sage.tensor.modules.comp import Components, CompWithSym, \
                                                  CompFullySym, CompFullyAntiSym
         dom1 = self._domain
-        dom2 = self._codomain
         ncov = tensor._tensor_type[1]
         resu_name = None ; resu_latex_name = None
         if self._name is not None and tensor._name is not None:
@@ -1247,7 +1537,6 @@ class DiffMapping(SageObject):
         ring1 = fmodule1._ring
         si1 = fmodule1._sindex
         of1 = fmodule1._output_formatter
-        si2 = dom2._manifold._sindex
         resu = fmodule1.tensor((0,ncov), name=resu_name, 
                                latex_name=resu_latex_name, sym=tensor._sym, 
                                antisym=tensor._antisym)
@@ -1277,21 +1566,19 @@ class DiffMapping(SageObject):
                             ptcomp = Components(ring1, frame1, ncov,
                                                 start_index=si1, 
                                                 output_formatter=of1)
-                        phi = self._coord_expression[(chart1, chart2)]
-                        jacob = phi.jacobian()
-                        # X2 coordinates expressed in terms of X1 ones via the mapping:
-                        coord2_1 = phi(*(chart1._xx)) 
-                        for ind_new in ptcomp.non_redundant_index_generator(): 
-                            res = 0 
-                            for ind_old in dom2._manifold.index_generator(ncov): 
-                                ff = tcomp[[ind_old]].function_chart(chart2)
-                                t = FunctionChart(chart1, ff(*coord2_1))
-                                for i in range(ncov):
-                                    t *= jacob[ind_old[i]-si2][ind_new[i]-si1]
-                                res += t
-                            ptcomp[ind_new] = res
+                        column = self._get_pullback_data(chart1, 
+                                                         chart2)['column']
+                        # Old components expressed in terms of the X1 
+                        # coordinates via the mapping:
+                        tcomp_1 = tcomp._new_instance()
+                        for ind_old, val in tcomp._comp.iteritems():
+                            tcomp_1._comp[ind_old] = self._substitute(chart1, 
+                                            chart2, val.function_chart(chart2))
+                        # Contraction with the Jacobian matrix, one slot at 
+                        # a time:
+                        tcomp_1._slot_transform([column]*ncov, ptcomp)
                         resu._components[frame1] = ptcomp
-            return resu
+        return resu
 
 
         
@@ -1743,3 +2030,201 @@ class IdentityMap(Diffeomorphism):
         # no test for efficiency
         return tensor
 
+
+#*****************************************************************************
+
+class CompositeDiffMapping(DiffMapping):
+    r"""
+    Composite of two differentiable mappings.
+
+    Given two differentiable mappings `\Phi: U\rightarrow V` and 
+    `\Psi: V'\rightarrow W`, with `V\subset V'`, this class implements the 
+    composite `\Psi\circ\Phi: U\rightarrow W`. 
+
+    The coordinate expressions of `\Psi\circ\Phi` are computed at the first
+    access to them: for each pair of charts `(X_1, X_3)` such that the 
+    coordinate expressions of `\Phi` in some pair `(X_1, X_2)` and of 
+    `\Psi` in the pair `(X_2, X_3)` (or in `(X'_2, X_3)`, `X_2` being a 
+    restriction of `X'_2`) are known, the expression of `\Psi` is 
+    composed with that of `\Phi` (the coordinate expressions of `X_2` in 
+    terms of `X_1` being those stored in the pullback data of `\Phi`) and 
+    the Jacobian matrix is obtained by the chain rule from those of 
+    `\Psi` and `\Phi`, without any new differentiation. The results are 
+    stored per pair `(X_1, X_3)`. Since they are coordinate expressions of 
+    a genuine differentiable mapping, the pullback along a chain of 
+    mappings is performed in a single pass. The expressions composed from 
+    coordinate expressions of `\Psi` or `\Phi` that have been modified 
+    meanwhile are discarded. 
+
+    The composite is generally obtained by means of the operator ``*`` 
+    (cf. :meth:`DiffMapping.__mul__`).
+
+    INPUT:
+
+    - ``psi`` -- the differentiable mapping `\Psi`
+    - ``phi`` -- the differentiable mapping `\Phi`
+    - ``name`` -- (default: None) name given to the composite mapping
+    - ``latex_name`` -- (default: None) LaTeX symbol to denote the composite 
+      mapping; if none is provided, the LaTeX symbol is set to ``name``
+
+    EXAMPLE:
+
+    Composite of three mappings::
+
+        sage: M = Manifold(1, 'R')
+        sage: T.<t> = M.chart()
+        sage: N = Manifold(2, 'N')
+        sage: X.<x,y> = N.chart()
+        sage: P = Manifold(2, 'P')
+        sage: Y.<u,v> = P.chart()
+        sage: phi = M.diff_mapping(N, (t, t^2), name='phi')
+        sage: psi = N.diff_mapping(P, (x+y, x*y), name='psi')
+        sage: rho = P.diff_mapping(M, u-v, name='rho')
+        sage: chi = rho * psi * phi ; chi
+        differentiable mapping 'rho o psi o phi' from 1-dimensional manifold 'R' to 1-dimensional manifold 'R'
+        sage: chi.multi_function_chart(T, T)[0]
+        -t^3 + t^2 + t
+        sage: chi.multi_function_chart(T, T).jacobian()
+        [[-3*t^2 + 2*t + 1]]
+
+    The composite follows the modifications of its constituents::
+
+        sage: phi.add_expr(T, X, (2*t, t^2))
+        sage: chi.multi_function_chart(T, T)[0]
+        -2*t^3 + t^2 + 2*t
+
+    The codomain of `\Phi` can be a subdomain of the domain of `\Psi`::
+
+        sage: U = N.open_domain('U', coord_def={X: x>0})
+        sage: phi1 = M.diff_mapping(U, (t^2+1, t), chart2=X.restrict(U), 
+        ....:                       name='phi1')
+        sage: (psi * phi1).expr()
+        (t^2 + t + 1, t^3 + t)
+
+    """
+    def __init__(self, psi, phi, name=None, latex_name=None):
+        self._psi = psi
+        self._phi = phi
+        self._sources = {} # coordinate expressions of phi and psi from which
+                           # the coordinate expressions of self have been 
+                           # composed (key: pair of charts)
+        self._stamp = None # stamps of phi and psi at the last update of the
+                           # coordinate expressions of self
+        DiffMapping.__init__(self, phi._domain, psi._codomain, name=name, 
+                             latex_name=latex_name)
+
+    def _get_coord_expression(self):
+        r"""
+        Return the dictionary of coordinate expressions of ``self``, after
+        the composition of all the coordinate expressions of the two 
+        mappings not treated yet.
+
+        The update is performed only if the coordinate expressions of one 
+        of the two mappings have been modified since the previous one. 
+        """
+        express = self._coord_expression_dict
+        phi = self._phi
+        psi = self._psi
+        if (phi._expression_stamp(), psi._expression_stamp()) == self._stamp:
+            return express
+        phi_express = self._phi._coord_expression
+        psi_express = self._psi._coord_expression
+        # The expressions composed from expressions of phi or psi that have
+        # been modified (or deleted) are obsolete:
+        obsolete = []
+        for (chart1, chart3), (chart2, phi_funct, psi_chart, psi_funct) in \
+                                                  self._sources.iteritems():
+            if phi_express.get((chart1, chart2)) is not phi_funct or \
+               psi_express.get((psi_chart, chart3)) is not psi_funct:
+                obsolete.append((chart1, chart3))
+        if obsolete:
+            self._del_derived()
+            for charts in obsolete:
+                del self._sources[charts]
+                if charts in express:
+                    del express[charts]
+        # The expressions of psi grouped by start chart:
+        psi_charts = {}
+        for (chart2, chart3), psi_funct in psi_express.iteritems():
+            psi_charts.setdefault(chart2, []).append((chart3, psi_funct))
+        for (chart1, chart2), phi_funct in phi_express.iteritems():
+            # the expressions of psi in the charts of which chart2 is a 
+            # restriction are valid in chart2:
+            for psi_chart in chart2._supercharts:
+                for chart3, psi_funct in psi_charts.get(psi_chart, []):
+                    if (chart1, chart3) not in express:
+                        express[(chart1, chart3)] = \
+                                    self._composite_expression(chart1, chart2, 
+                                                         chart3, psi_chart)
+                        self._sources[(chart1, chart3)] = (chart2, phi_funct,
+                                                           psi_chart, psi_funct)
+        # the stamps are taken after the update, since the latter may update
+        # the expressions of phi or psi if they are composite mappings:
+        self._stamp = (phi._expression_stamp(), psi._expression_stamp())
+        return express
+
+    def _set_coord_expression(self, express):
+        r"""
+        Set the dictionary of coordinate expressions of ``self``. 
+        """
+        self._coord_expression_dict = CoordExpressionDict(express)
+
+    _coord_expression = property(_get_coord_expression, 
+                                 _set_coord_expression)
+
+    def _expression_stamp(self):
+        r"""
+        Return an object that changes whenever the coordinate expressions of
+        ``self`` or of the two composed mappings are modified.
+        """
+        return (self._phi._expression_stamp(), self._psi._expression_stamp(),
+                self._coord_expression_dict._version)
+
+    def _composite_expression(self, chart1, chart2, chart3, psi_chart=None):
+        r"""
+        Compose the coordinate expressions of the two mappings.
+
+        INPUT:
+
+        - ``chart1`` -- chart on the domain of `\Phi`
+        - ``chart2`` -- chart on the codomain of `\Phi` such that the 
+          coordinate expression of `\Phi` in ``(chart1, chart2)`` is known
+        - ``chart3`` -- chart on the codomain of `\Psi`
+        - ``psi_chart`` -- (default: None) chart on the domain of `\Psi`, 
+          of which ``chart2`` is a restriction, such that the coordinate 
+          expression of `\Psi` in ``(psi_chart, chart3)`` is known; if None,
+          ``chart2`` is assumed
+
+        OUTPUT:
+
+        - instance of :class:`~sage.geometry.manifolds.chart.MultiFunctionChart`
+          representing the coordinate expression of `\Psi\circ\Phi` in 
+          ``(chart1, chart3)``, with its Jacobian matrix already set
+
+        """
+        from sage.matrix.constructor import matrix
+        from utilities import simplify_chain
+        phi = self._phi
+        if psi_chart is None:
+            psi_chart = chart2
+        psi_funct = self._psi._coord_expression[(psi_chart, chart3)]
+        data = phi._get_pullback_data(chart1, chart2)
+        resu = MultiFunctionChart(chart1, *psi_funct(*(data['coord2_1'])))
+        # Jacobian matrix by the chain rule:
+        jacob_phi = data['jacobian']
+        jacob_psi = psi_funct._jacobian_data(chart3).jacobian()
+        n1 = len(chart1._xx)
+        n2 = len(chart2._xx)
+        jacob = []
+        for row_psi in jacob_psi:
+            # the row of the Jacobian matrix of psi, as functions of the 
+            # coordinates of chart1:
+            row_psi_1 = [phi._substitute(chart1, chart2, elt)._express 
+                         for elt in row_psi]
+            jacob.append([FunctionChart(chart1, simplify_chain(
+                          sum(row_psi_1[j] * jacob_phi[j][i]._express 
+                              for j in range(n2)))) for i in range(n1)])
+        resu._jacob = jacob
+        resu._jacob_matrix = matrix([[elt._express for elt in row] 
+                                     for row in jacob])
+        return resu
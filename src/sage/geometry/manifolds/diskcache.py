@@ -0,0 +1,273 @@
+r"""
+Disk cache of geometric quantities
+
+This module implements a persistent cache of the components of the
+quantities derived from a pseudo-Riemannian metric (Christoffel symbols,
+Riemann, Ricci and Weyl tensors), so that they are not recomputed across
+Sage sessions or by concurrent processes.
+
+The components are stored w.r.t. coordinate frames only, as dictionaries
+of symbolic expressions in the frame's chart, which are pickled into files
+of a given directory. Each file is identified by a hash of
+
+- the name of the quantity
+- the manifold's dimension and starting index
+- the coordinates, their ranges and the restrictions of the chart
+- the signature and the components of the metric in the coordinate frame
+
+so that any change in the metric or the chart leads to a different file.
+The files bear a version number and are ignored if they have been written
+by a different version of this module. The total size of the cache
+directory is bounded: when it is exceeded, the least recently used files
+are deleted.
+
+The disk cache is disabled by default; it is activated by
+:func:`set_disk_cache`::
+
+    sage: import os
+    sage: from sage.geometry.manifolds.diskcache import set_disk_cache
+    sage: d = tmp_dir()
+    sage: set_disk_cache(d)
+    sage: M = Manifold(2, 'S^2', start_index=1)
+    sage: U = M.open_domain('U')
+    sage: c_spher.<th,ph> = U.chart(r'th:(0,pi):\theta ph:(0,2*pi):\phi')
+    sage: g = U.metric('g')
+    sage: g[1,1], g[2,2] = 1, sin(th)^2
+    sage: g.christoffel_symbols()[:]
+    [[[0, 0], [0, -cos(th)*sin(th)]], [[0, cos(th)/sin(th)], [cos(th)/sin(th), 0]]]
+    sage: len(os.listdir(d))
+    1
+
+A metric with the same components (here on a different domain) takes
+its Christoffel symbols from the cache::
+
+    sage: V = M.open_domain('V')
+    sage: c_V.<th,ph> = V.chart(r'th:(0,pi):\theta ph:(0,2*pi):\phi')
+    sage: h = V.metric('h')
+    sage: h[1,1], h[2,2] = 1, sin(th)^2
+    sage: h.christoffel_symbols()[:]
+    [[[0, 0], [0, -cos(th)*sin(th)]], [[0, cos(th)/sin(th)], [cos(th)/sin(th), 0]]]
+    sage: len(os.listdir(d))
+    1
+    sage: set_disk_cache(None)  # disables the disk cache
+
+AUTHORS:
+
+- SageManifolds contributors (2026) : initial version
+
+"""
+#******************************************************************************
+#       Copyright (C) 2026 SageManifolds contributors
+#
+#  Distributed under the terms of the GNU General Public License (GPL)
+#  as published by the Free Software Foundation; either version 2 of
+#  the License, or (at your option) any later version.
+#                  http://www.gnu.org/licenses/
+#******************************************************************************
+
+import os
+
+# Version of the file format; files written with another version are ignored:
+_version = 1
+
+# Cache settings:
+_settings = {'directory': None, 'max_size': 2**27}
+
+def set_disk_cache(directory, max_size=2**27):
+    r"""
+    Activate or deactivate the disk cache of geometric quantities.
+
+    INPUT:
+
+    - ``directory`` -- path of the directory where the cached quantities
+      are stored (created if necessary); if None, the disk cache is
+      deactivated
+    - ``max_size`` -- (default: `2^{27}`, i.e. 128 MiB) maximum total size
+      of the cache files, in bytes; the least recently used files are
+      deleted when it is exceeded
+
+    EXAMPLES::
+
+        sage: from sage.geometry.manifolds.diskcache import set_disk_cache, disk_cache_directory
+        sage: d = tmp_dir()
+        sage: set_disk_cache(d, max_size=10^6)
+        sage: disk_cache_directory() == d
+        True
+        sage: set_disk_cache(None)
+        sage: disk_cache_directory() is None
+        True
+
+    """
+    if directory is not None:
+        directory = os.path.abspath(os.path.expanduser(directory))
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+    if max_size <= 0:
+        raise ValueError("The maximum size of the disk cache must be " +
+                         "positive.")
+    _settings['directory'] = directory
+    _settings['max_size'] = max_size
+
+def disk_cache_directory():
+    r"""
+    Return the directory of the disk cache of geometric quantities.
+
+    OUTPUT:
+
+    - path of the cache directory or None if the disk cache is not active
+
+    EXAMPLE::
+
+        sage: from sage.geometry.manifolds.diskcache import disk_cache_directory
+        sage: disk_cache_directory() is None  # the disk cache is not active by default
+        True
+
+    """
+    return _settings['directory']
+
+def _metric_key(metric, frame, quantity):
+    r"""
+    Return the hash identifying a quantity derived from a metric in a
+    coordinate frame.
+
+    INPUT:
+
+    - ``metric`` -- the metric (instance of
+      :class:`~sage.geometry.manifolds.metric.Metric`)
+    - ``frame`` -- coordinate frame (instance of
+      :class:`~sage.geometry.manifolds.vectorframe.CoordFrame`)
+    - ``quantity`` -- string naming the quantity
+
+    OUTPUT:
+
+    - string of hexadecimal digits
+
+    """
+    from hashlib import sha1
+    chart = frame._chart
+    manif = chart._manifold
+    gg = metric.comp(frame)
+    items = [quantity, str(_version), str(manif._dim), str(manif._sindex),
+             str(chart._xx), str(chart._bounds), str(chart._restrictions),
+             str(metric._signature)]
+    for i in manif.irange():
+        for j in manif.irange(start=i):
+            items.append(str(gg[i, j, chart]._express))
+    return sha1('\n'.join(items)).hexdigest()
+
+def _file_name(metric, frame, quantity):
+    r"""
+    Return the path of the file storing a quantity derived from a metric in
+    a coordinate frame, or None if the disk cache is not active or if the
+    frame is not a coordinate frame.
+
+    """
+    from vectorframe import CoordFrame
+    directory = _settings['directory']
+    if directory is None or not isinstance(frame, CoordFrame):
+        return None
+    key = _metric_key(metric, frame, quantity)
+    return os.path.join(directory, quantity + '-' + key + '.pickle')
+
+def load_components(metric, frame, quantity, comp):
+    r"""
+    Set some components from the disk cache, if available.
+
+    INPUT:
+
+    - ``metric`` -- the metric from which the quantity is derived
+    - ``frame`` -- the frame of the components
+    - ``quantity`` -- string naming the quantity
+    - ``comp`` -- the components to be set (instance of
+      :class:`~sage.tensor.modules.comp.Components`), assumed to be zero
+      initially
+
+    OUTPUT:
+
+    - True if the components have been found in the disk cache, False
+      otherwise
+
+    """
+    import cPickle
+    from scalarfield import ScalarField
+    file_name = _file_name(metric, frame, quantity)
+    if file_name is None or not os.path.isfile(file_name):
+        return False
+    try:
+        with open(file_name, 'rb') as f:
+            version, values = cPickle.load(f)
+    except Exception:
+        # unreadable file (e.g. being written by another process)
+        return False
+    if version != _version:
+        return False
+    # the file access time is updated for the LRU eviction:
+    try:
+        os.utime(file_name, None)
+    except OSError:
+        # the file has been evicted meanwhile by another process
+        return False
+    chart = frame._chart
+    for ind, expr in values.iteritems():
+        comp._comp[ind] = ScalarField(frame._domain,
+                                      coord_expression={chart: expr})
+    return True
+
+def save_components(metric, frame, quantity, comp):
+    r"""
+    Store some components in the disk cache, if the latter is active.
+
+    INPUT:
+
+    - ``metric`` -- the metric from which the quantity is derived
+    - ``frame`` -- the frame of the components
+    - ``quantity`` -- string naming the quantity
+    - ``comp`` -- the components to be stored (instance of
+      :class:`~sage.tensor.modules.comp.Components`)
+
+    """
+    import cPickle
+    import tempfile
+    file_name = _file_name(metric, frame, quantity)
+    if file_name is None:
+        return
+    chart = frame._chart
+    values = {}
+    for ind, value in comp._comp.iteritems():
+        values[ind] = value.function_chart(chart)._express
+    # the file is first written under a temporary name and then renamed, so
+    # that concurrent processes never read an incomplete file:
+    directory = _settings['directory']
+    fd, tmp_name = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'wb') as f:
+        cPickle.dump((_version, values), f, 2)
+    os.rename(tmp_name, file_name)
+    _evict(directory, _settings['max_size'])
+
+def _evict(directory, max_size):
+    r"""
+    Delete the least recently used files of the cache directory until their
+    total size does not exceed ``max_size``.
+
+    """
+    files = []
+    total = 0
+    for name in os.listdir(directory):
+        if not name.endswith('.pickle'):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            stat = os.stat(path)
+        except OSError:  # file deleted by another process
+            continue
+        files.append((stat.st_mtime, stat.st_size, path))
+        total += stat.st_size
+    files.sort()
+    for mtime, size, path in files:
+        if total <= max_size:
+            break
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        total -= size
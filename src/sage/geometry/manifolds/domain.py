@@ -165,19 +165,20 @@ class Domain(UniqueRepresentation, Parent):
         Parent.__init__(self, category=Sets())
         self._manifold = manifold
         if self != manifold:
-            for dom in manifold._domains:
-                if name == dom._name:
-                    raise ValueError("The name '" + name + 
-                                     "' is already used for " +
-                                     "another domain on the " + str(manifold))
+            if name in manifold._domain_names:
+                raise ValueError("The name '" + name + 
+                                 "' is already used for " +
+                                 "another domain on the " + str(manifold))
             self._name = name
             manifold._domains.append(self)
+            manifold._domain_names.add(name)
             manifold._subdomains.add(self)
             # set of domains containing self:
             self._superdomains = set([manifold, self]) 
         else: # case where the domain is the full manifold
             self._name = name
             self._superdomains = set([self])
+            self._domain_names = set([name]) # names of all the domains
         if latex_name is None:
             self._latex_name = self._name
         else:
@@ -186,19 +187,24 @@ class Domain(UniqueRepresentation, Parent):
         self._top_subdomains = set([self]) # domains contained in self but not
             # in another strict subdomain of self
         self._intersections = {} # dict. of intersections with other domains
-                                 # (key: domain name)
-        self._unions = {} # dict. of unions with other domains (key: domain 
-                          # name)
+                                 # (key: domain)
+        self._unions = {} # dict. of unions with other domains (key: domain)
         self._atlas = []  # list of charts defined on subdomains of self
+        self._atlas_coords = set() # set of the coordinate tuples of the
+                                   # charts in self._atlas
         self._top_charts = []  # list of charts defined on subdomains of self
                         # that are not subcharts of charts on larger subdomains
         self._def_chart = None  # default chart
         self._coord_changes = {} # dictionary of transition maps 
+        self._coord_change_costs = {} # sizes of the transition maps
+                                      # (key: pair of charts)
         self._frames = []  # list of vector frames defined on subdomains of self
         self._top_frames = []  # list of vector frames defined on subdomains 
                # of self that are not subframes of frames on larger subdomains
         self._def_frame = None  # default frame
         self._frame_changes = {} # dictionary of changes of frames
+        self._frame_change_der = {} # derivatives of the changes of frames
+                                    # (key: pair of frames)
         self._coframes = []  # list of coframes defined on subdomains of self
         self._parallelizable_parts = set() # parallelizable domains contained in self
 
@@ -477,6 +483,7 @@ class Domain(UniqueRepresentation, Parent):
         for sd in self._subdomains:
             sd._superdomains.add(res)
         res._atlas = list(self._atlas)
+        res._atlas_coords = set(self._atlas_coords)
         res._top_charts = list(self._top_charts)
         res._coord_changes = dict(self._coord_changes)
         res._frames = list(self._frames)
@@ -561,9 +568,9 @@ class Domain(UniqueRepresentation, Parent):
         if other in self._subdomains:
             return other
         # Generic case:
-        if other._name in self._intersections:
+        if other in self._intersections:
             # the intersection has already been created:
-            return self._intersections[other._name]
+            return self._intersections[other]
         else:
             # the intersection must be created:
             if latex_name is None:
@@ -581,8 +588,8 @@ class Domain(UniqueRepresentation, Parent):
             for sd in other._superdomains:
                 sd._subdomains.add(res)
             other._top_subdomains.add(res)
-            self._intersections[other._name] = res
-            other._intersections[self._name] = res
+            self._intersections[other] = res
+            other._intersections[self] = res
             return res
         
     def union(self, other, name=None, latex_name=None):
@@ -656,9 +663,9 @@ class Domain(UniqueRepresentation, Parent):
         if other in self._subdomains:
             return self
         # Generic case:
-        if other._name in self._unions:
+        if other in self._unions:
             # the union has already been created:
-            return self._unions[other._name]
+            return self._unions[other]
         else:
             # the union must be created:
             if latex_name is None:
@@ -676,25 +683,20 @@ class Domain(UniqueRepresentation, Parent):
             res._top_subdomains.add(other)
             for sd in other._subdomains:
                 sd._superdomains.add(res)
-            for chart in other._atlas:
-                if chart not in res._atlas:
-                    res._atlas.append(chart)
-            for chart in other._top_charts:
-                if chart not in res._top_charts:
-                    res._top_charts.append(chart)
+            # the sets below avoid quadratic membership tests in lists:
+            for attr in ['_atlas', '_top_charts', '_frames', '_top_frames',
+                         '_coframes']:
+                res_list = getattr(res, attr)
+                known = set(res_list)
+                for item in getattr(other, attr):
+                    if item not in known:
+                        res_list.append(item)
+                        known.add(item)
+            res._atlas_coords.update(other._atlas_coords)
             res._coord_changes.update(other._coord_changes)
-            for frame in other._frames:
-                if frame not in res._frames:
-                    res._frames.append(frame)
-            for frame in other._top_frames:
-                if frame not in res._top_frames:
-                    res._top_frames.append(frame)
             res._frame_changes.update(other._frame_changes)
-            for coframe in other._coframes:
-                if coframe not in res._coframes:
-                    res._coframes.append(coframe)
-            self._unions[other._name] = res
-            other._unions[self._name] = res
+            self._unions[other] = res
+            other._unions[self] = res
             return res
         
     def declare_union(self, dom1, dom2):
@@ -729,8 +731,8 @@ class Domain(UniqueRepresentation, Parent):
         if not dom2.is_subdomain(self):
             raise TypeError("The " + str(dom2) + " is not a subdomain of " + 
                             "the " + str(self) + ".")
-        dom1._unions[dom2._name] = self
-        dom2._unions[dom1._name] = self
+        dom1._unions[dom2] = self
+        dom2._unions[dom1] = self
 
     def is_subdomain(self, other):
         r"""
@@ -764,14 +766,16 @@ class Domain(UniqueRepresentation, Parent):
         """
         if point.parent().is_subdomain(self):
             return True
-        for chart in self._atlas:
-            if chart in point._coordinates:
-                if chart.valid_coordinates( *(point._coordinates[chart]) ):
-                    return True
-        for chart in point._coordinates:
+        # A chart belongs to self._atlas iff its domain is a subdomain of 
+        # self, which is tested in constant time:
+        for chart, coords in point._coordinates.iteritems():
+            if chart._domain.is_subdomain(self) and \
+                                            chart.valid_coordinates(*coords):
+                return True
+        for chart, coords in point._coordinates.iteritems():
             for schart in chart._subcharts:
-                if schart in self._atlas and schart.valid_coordinates( 
-                                          *(point._coordinates[chart]) ):
+                if schart._domain.is_subdomain(self) and \
+                                            schart.valid_coordinates(*coords):
                     return True
         return False
 
@@ -822,6 +826,46 @@ class Domain(UniqueRepresentation, Parent):
 
         """
         return self.element_class(self, coords, chart, name, latex_name)
+
+    def point_array(self, coords, chart=None):
+        r"""
+        Define an array of points in the domain, given by their numerical
+        coordinates.
+
+        See :class:`~sage.geometry.manifolds.point.PointArray` for a complete 
+        documentation. 
+
+        INPUT:
+
+        - ``coords`` -- array-like object of shape `(N, n)` containing the 
+          coordinates of the `N` points in the chart specified by ``chart``
+        - ``chart`` -- (default: None) chart in which the point coordinates are
+          given; if none is provided, the coordinates are assumed to refer to 
+          the domain's default chart
+
+        OUTPUT:
+
+        - instance of :class:`~sage.geometry.manifolds.point.PointArray` 
+
+        EXAMPLE::
+
+            sage: Manifold._clear_cache_() # for doctests only
+            sage: M = Manifold(2, 'M')
+            sage: c_xy.<x,y> = M.chart()
+            sage: c_uv.<u,v> = M.chart()
+            sage: ch = c_xy.transition_map(c_uv, (x+y, x-y))
+            sage: pts = M.point_array([(1,2), (3,4), (5,6)]) ; pts
+            array of 3 points on 2-dimensional manifold 'M'
+            sage: pts.coord(c_uv)
+            array([[  3.,  -1.],
+                   [  7.,  -1.],
+                   [ 11.,  -1.]])
+            sage: pts[2].coord(c_uv)
+            (11.0, -1.0)
+
+        """
+        from point import PointArray
+        return PointArray(self, coords, chart)
         
     def default_chart(self):
         r"""
@@ -924,13 +968,190 @@ class Domain(UniqueRepresentation, Parent):
             sage: M.coord_change(c_xy, c_uv) # returns the coordinate change defined above
             coordinate change from chart (M, (x, y)) to chart (M, (u, v))
 
+        If no transition map from chart 1 to chart 2 has been defined, but
+        the two charts are connected by a chain of transition maps, the
+        latter are composed (see :meth:`coord_change_path`) and the result
+        is stored for future use::
+
+            sage: c_wz.<w,z> = M.chart()
+            sage: c_uv.transition_map(c_wz, (u^3, v^3))
+            coordinate change from chart (M, (u, v)) to chart (M, (w, z))
+            sage: ch = M.coord_change(c_xy, c_wz) ; ch
+            coordinate change from chart (M, (x, y)) to chart (M, (w, z))
+            sage: ch(x,y)
+            (x^3 + 3*x^2*y + 3*x*y^2 + y^3, x^3 - 3*x^2*y + 3*x*y^2 - y^3)
+            sage: M.coord_change(c_xy, c_wz) is ch
+            True
+
         """
         if (chart1, chart2) not in self._coord_changes:
-            raise TypeError("The change of coordinates from " + str(chart1) + 
-                            " to " + str(chart2) + " has not been " + 
-                            "defined on the " + str(self))
+            path = self._coord_change_route([chart1], [chart2])
+            if path is None:
+                raise TypeError("The change of coordinates from " + 
+                                str(chart1) + " to " + str(chart2) + 
+                                " has not been defined on the " + str(self))
+            return self._compose_coord_changes(path)
         return self._coord_changes[(chart1, chart2)]
 
+    def coord_change_path(self, chart1, chart2, weighted=False):
+        r"""
+        Return the cheapest chain of transition maps leading from one chart
+        to another one.
+
+        The charts of the domain are considered as the vertices of a
+        directed graph, whose edges are the changes of coordinates stored
+        in :attr:`_coord_changes`. The cheapest path from ``chart1`` to
+        ``chart2`` is searched by Dijkstra's algorithm.
+
+        INPUT:
+
+        - ``chart1`` -- initial chart
+        - ``chart2`` -- final chart
+        - ``weighted`` -- (default: False) determines the cost of each
+          change of coordinates: if False, all changes of coordinates have
+          the same cost, so that the path with the fewest steps is returned;
+          if True, the cost of a change of coordinates is the size of the
+          symbolic expressions of its coordinate transformations, so that
+          the path involving the simplest formulas is returned
+
+        OUTPUT:
+
+        - list of instances of
+          :class:`~sage.geometry.manifolds.chart.CoordChange`, the first one
+          starting from ``chart1`` and the last one ending at ``chart2``
+          (empty list if ``chart1`` and ``chart2`` coincide)
+
+        EXAMPLES:
+
+        Path through a third chart::
+
+            sage: Manifold._clear_cache_() # for doctests only
+            sage: M = Manifold(2, 'M')
+            sage: c_xy.<x,y> = M.chart()
+            sage: c_uv.<u,v> = M.chart()
+            sage: c_wz.<w,z> = M.chart()
+            sage: ch1 = c_xy.transition_map(c_uv, (x+y, x-y))
+            sage: ch2 = c_uv.transition_map(c_wz, (u^3, v^3))
+            sage: M.coord_change_path(c_xy, c_wz)
+            [coordinate change from chart (M, (x, y)) to chart (M, (u, v)),
+             coordinate change from chart (M, (u, v)) to chart (M, (w, z))]
+            sage: M.coord_change_path(c_xy, c_xy)
+            []
+
+        With ``weighted=True``, a path with more steps but simpler formulas
+        may be preferred::
+
+            sage: c_st.<s,t> = M.chart()
+            sage: ch3 = c_xy.transition_map(c_st, (x^3+y^3, x^3-y^3))
+            sage: ch4 = c_uv.transition_map(c_st, (u, v))
+            sage: M.coord_change_path(c_xy, c_st)
+            [coordinate change from chart (M, (x, y)) to chart (M, (s, t))]
+            sage: M.coord_change_path(c_xy, c_st, weighted=True)
+            [coordinate change from chart (M, (x, y)) to chart (M, (u, v)),
+             coordinate change from chart (M, (u, v)) to chart (M, (s, t))]
+
+        """
+        path = self._coord_change_route([chart1], [chart2], weighted=weighted)
+        if path is None:
+            raise ValueError("No chain of coordinate changes from the " + 
+                             str(chart1) + " to the " + str(chart2) + 
+                             " has been found on the " + str(self))
+        return path
+
+    def _coord_change_route(self, charts1, charts2, weighted=False):
+        r"""
+        Search for the cheapest chain of transition maps starting from any
+        chart of a given list and ending at any chart of another list.
+
+        INPUT:
+
+        - ``charts1`` -- list of initial charts
+        - ``charts2`` -- list of final charts
+        - ``weighted`` -- (default: False) see :meth:`coord_change_path`
+
+        OUTPUT:
+
+        - list of instances of
+          :class:`~sage.geometry.manifolds.chart.CoordChange` forming the
+          cheapest chain (empty list if ``charts1`` and ``charts2`` have a
+          chart in common), or None if no chain exists
+
+        """
+        import heapq
+        targets = set(charts2)
+        # Graph of the changes of coordinates:
+        edges = {}
+        for (chart1, chart2), change in self._coord_changes.iteritems():
+            edges.setdefault(chart1, []).append((chart2, change))
+        # Dijkstra's algorithm (the counter avoids comparing charts):
+        heap = []
+        count = 0
+        best = {}
+        for chart in charts1:
+            best[chart] = 0
+            heap.append((0, count, chart, []))
+            count += 1
+        heapq.heapify(heap)
+        while heap:
+            cost, _, chart, path = heapq.heappop(heap)
+            if chart in targets:
+                return path
+            if cost > best[chart]:
+                continue
+            for chart2, change in edges.get(chart, []):
+                if weighted:
+                    new_cost = cost + self._coord_change_cost(change)
+                else:
+                    new_cost = cost + 1
+                if chart2 not in best or new_cost < best[chart2]:
+                    best[chart2] = new_cost
+                    heapq.heappush(heap, (new_cost, count, chart2, 
+                                          path + [change]))
+                    count += 1
+        return None
+
+    def _coord_change_cost(self, change):
+        r"""
+        Return the cost of a change of coordinates, as the total size of
+        the symbolic expressions of its coordinate transformations.
+
+        """
+        key = (change._chart1, change._chart2)
+        cached = self._coord_change_costs.get(key)
+        if cached is not None and cached[0] is change:
+            return cached[1]
+        cost = sum(len(str(funct._express)) 
+                   for funct in change._transf._functions)
+        self._coord_change_costs[key] = (change, cost)
+        return cost
+
+    def _compose_coord_changes(self, path):
+        r"""
+        Compose a chain of changes of coordinates.
+
+        INPUT:
+
+        - ``path`` -- nonempty list of changes of coordinates, as returned by
+          :meth:`coord_change_path`
+
+        OUTPUT:
+
+        - the change of coordinates from the initial chart of the first
+          element of ``path`` to the final chart of the last one; since it
+          is automatically stored in :attr:`_coord_changes`, it is obtained
+          without any search at the next request
+
+        """
+        chart1 = path[0]._chart1
+        result = path[0]
+        for change in path[1:]:
+            key = (chart1, change._chart2)
+            if key in self._coord_changes:
+                result = self._coord_changes[key]
+            else:
+                result = change * result
+        return result
+
 
     def default_frame(self):
         r"""
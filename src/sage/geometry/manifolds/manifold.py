@@ -365,6 +365,9 @@ class Manifold(OpenDomain):
         OpenDomain.__init__(self, self, name, latex_name)
         self._sindex = start_index
         self._domains = [self]
+        self._nproc = 1  # number of processes for component computations
+        self._deferred_coord_changes = None # list of the changes of 
+                        # coordinates created during a bulk atlas construction
         
     def _repr_(self):
         r"""
@@ -412,6 +415,174 @@ class Manifold(OpenDomain):
         """
         return self._domains
 
+    def build_atlas(self, domains=None, charts=None, transition_maps=None):
+        r"""
+        Construct at once a set of open domains, charts and transition maps. 
+
+        This is more efficient than constructing the atlas piece by piece 
+        when the number of charts is large: the changes of coordinate frames
+        induced by the transition maps (which involve the inversion of the
+        Jacobian matrices) are not computed when the transition maps are 
+        created, but in a single pass at the end of the construction. 
+
+        INPUT:
+
+        - ``domains`` -- (default: None) list of pairs ``(name, parent)``, 
+          where ``name`` is the name of an open domain to be created and 
+          ``parent`` the name of the open domain in which it is created 
+          (None for the manifold itself); a parent must appear in the list 
+          before its subdomains
+        - ``charts`` -- (default: None) list of pairs ``(domain, coordinates)``,
+          where ``domain`` is the name of an open domain (None for the 
+          manifold itself; if the name does not appear in ``domains``, the 
+          domain is created as an open subdomain of the manifold) and 
+          ``coordinates`` the string defining the 
+          coordinates, as in 
+          :meth:`~sage.geometry.manifolds.domain.OpenDomain.chart`
+        - ``transition_maps`` -- (default: None) list of tuples 
+          ``(i1, i2, transformations)`` or 
+          ``(i1, i2, transformations, inverse)``, where ``i1`` and ``i2`` are
+          the positions in the list ``charts`` of the two charts, 
+          ``transformations`` is a function returning the coordinates of 
+          chart ``i2`` in terms of those of chart ``i1`` and ``inverse`` 
+          (optional) is a function returning the coordinates of chart ``i1`` 
+          in terms of those of chart ``i2`` (cf. 
+          :meth:`~sage.geometry.manifolds.chart.CoordChange.set_inverse`)
+
+        OUTPUT:
+
+        - list of the created charts, in the same order as ``charts``
+
+        EXAMPLE:
+
+        A 1-dimensional manifold covered by two charts::
+
+            sage: M = Manifold(1, 'M')
+            sage: X, Y = M.build_atlas(domains=[('U', None), ('V', None)],
+            ....:                      charts=[('U', 'x'), ('V', 'y')],
+            ....:                      transition_maps=[(0, 1, lambda x: 2*x, 
+            ....:                                        lambda y: y/2)])
+            sage: X, Y
+            (chart (U, (x,)), chart (V, (y,)))
+            sage: M.atlas()
+            [chart (U, (x,)), chart (V, (y,)), chart (U_inter_V, (x,)),
+             chart (U_inter_V, (y,))]
+            sage: W = M.domains()[3] ; W
+            open domain 'U_inter_V' on the 1-dimensional manifold 'M'
+            sage: W.frame_change(X.restrict(W).frame(), Y.restrict(W).frame())[:]
+            [1/2]
+
+        If a transition map cannot be constructed, the transition maps 
+        created before it are completed with their changes of frame::
+
+            sage: M = Manifold(1, 'M')
+            sage: X, Y = M.build_atlas(charts=[(None, 'x'), (None, 'y'), 
+            ....:                              (None, 'z')],
+            ....:                      transition_maps=[(0, 1, lambda x: 2*x), 
+            ....:                                       (0, 2, lambda x: (x, x))])
+            Traceback (most recent call last):
+            ...
+            ValueError: 1 coordinate transformations must be provided.
+            sage: X, Y, Z = M.atlas()
+            sage: M.frame_change(X.frame(), Y.frame())[:]
+            [1/2]
+
+        """
+        if domains is None:
+            domains = []
+        if charts is None:
+            charts = []
+        if transition_maps is None:
+            transition_maps = []
+        doms = {None: self}
+        for name, parent in domains:
+            doms[name] = doms[parent].open_domain(name)
+        for name in [dom for dom, coordinates in charts]:
+            if name not in doms:
+                doms[name] = self.open_domain(name)
+        self._deferred_coord_changes = []
+        try:
+            resu = [doms[dom].chart(coordinates) for dom, coordinates in charts]
+            for trans in transition_maps:
+                chart1 = resu[trans[0]]
+                chart2 = resu[trans[1]]
+                transf = trans[2](*chart1._xx)
+                if not isinstance(transf, (tuple, list)):
+                    transf = [transf]
+                chg = chart1.transition_map(chart2, transf)
+                if len(trans) > 3:
+                    inv = trans[3](*chg._chart2._xx)
+                    if not isinstance(inv, (tuple, list)):
+                        inv = [inv]
+                    chg.set_inverse(*inv, check=False)
+        finally:
+            deferred = self._deferred_coord_changes
+            self._deferred_coord_changes = None
+            # Final pass: the changes of frames are computed in the order in 
+            # which the changes of coordinates have been created, which leads
+            # to the same result as a piecewise construction; it is performed
+            # even if the construction has been interrupted by an error, 
+            # so that each registered change of coordinates is accompanied by
+            # the corresponding change of frames:
+            for chg in deferred:
+                chg._register_frame_changes()
+        return resu
+
+    def set_parallel(self, nproc=None):
+        r"""
+        Set the number of processes used for the computation of the
+        components of tensor fields on the manifold.
+
+        When ``nproc`` is larger than 1, the independent components of the
+        Christoffel symbols, the Riemann tensor, the Ricci tensor and the
+        Weyl tensor are distributed over ``nproc`` forked processes (via
+        Sage's :func:`~sage.parallel.decorate.parallel` decorator) and the
+        results are gathered in the parent process.
+
+        INPUT:
+
+        - ``nproc`` -- (default: None) number of processes; if none, the
+          number of available CPUs is used; ``nproc = 1`` restores the
+          sequential computation
+
+        EXAMPLES::
+
+            sage: M = Manifold(2, 'M')
+            sage: M.parallel()
+            1
+            sage: M.set_parallel(4)
+            sage: M.parallel()
+            4
+            sage: M.set_parallel(1)  # back to the sequential computation
+            sage: M.parallel()
+            1
+
+        """
+        from sage.rings.integer import Integer
+        if nproc is None:
+            from sage.parallel.ncpus import ncpus
+            nproc = ncpus()
+        if not isinstance(nproc, (int, Integer)):
+            raise TypeError("The number of processes must be an integer.")
+        if nproc < 1:
+            raise ValueError("The number of processes must be at least 1.")
+        self._nproc = nproc
+
+    def parallel(self):
+        r"""
+        Return the number of processes used for the computation of the
+        components of tensor fields on the manifold.
+
+        See :meth:`set_parallel` for details.
+
+        EXAMPLE::
+
+            sage: M = Manifold(3, 'M')
+            sage: M.parallel()  # sequential computation by default
+            1
+
+        """
+        return self._nproc
 
     def irange(self, start=None):
         r"""
@@ -17,6 +17,9 @@ values on a parallelizable open subset of a differentiable manifold:
   * :class:`RiemannMetricParal`
   * :class:`LorentzMetricParal`
 
+The Hodge star operator associated with a metric is implemented by the class
+:class:`HodgeOperator`.
+
 See the documentation of class :class:`Metric` for an introduction. 
 
 AUTHORS:
@@ -34,6 +37,7 @@ AUTHORS:
 #                  http://www.gnu.org/licenses/
 #******************************************************************************
 
+from sage.structure.sage_object import SageObject
 from tensorfield import TensorField, TensorFieldParal
 from sage.rings.integer import Integer
 
@@ -356,6 +360,9 @@ class Metric(TensorField):
         self._determinants = {} # determinants in various frames
         self._sqrt_abs_dets = {} # sqrt(abs(det g)) in various frames
         self._vol_forms = [] # volume form and associated tensors
+        self._hodge_operator = None # Hodge star operator (not set yet)
+        self._curvature_invariants = {} # curvature invariants (key: name)
+        self._curvature_aux = {} # tensors shared by the curvature invariants
 
     def _del_derived(self):
         r"""
@@ -374,6 +381,13 @@ class Metric(TensorField):
         self._sqrt_abs_dets.clear()
         # The volume form and the associated tensors is deleted:
         del self._vol_forms[:]
+        # The Hodge star operator may be held by the user: it is kept, but 
+        # the data derived from the former components are deleted:
+        if self._hodge_operator is not None:
+            self._hodge_operator._frame_data.clear()
+        # The curvature invariants and the tensors they share are deleted:
+        self._curvature_invariants.clear()
+        self._curvature_aux.clear()
 
     def _del_inverse(self):
         r"""
@@ -869,7 +883,21 @@ class Metric(TensorField):
             sage: C == 0 
             True
 
+        The same computation, with the components of the Christoffel 
+        symbols, Riemann, Ricci and Weyl tensors distributed over 2 
+        processes::
+        
+            sage: M.set_parallel(2)
+            sage: h = U.metric('h')
+            sage: h[1,1], h[2,2], h[3,3] = b^2, (b*sinh(rh))^2, (b*sinh(rh)*sin(th))^2
+            sage: h.weyl() == 0
+            True
+            sage: h.ricci() == -2/b^2 * h
+            True
+            sage: M.set_parallel(1)
+
         """
+        from diskcache import disk_cache_directory
         if self._weyl is None:
             n = self._ambient_domain._manifold._dim
             if n < 3:
@@ -878,12 +906,19 @@ class Metric(TensorField):
             delta = self._domain.tangent_identity_field(dest_map=
                                                        self._vmodule._dest_map)
             riem = self.riemann()
-            ric = self.ricci()
-            rscal = self.ricci_scalar()
-            # First index of the Ricci tensor raised with the metric
-            ricup = ric.up(self, 0) 
-            aux = self*ricup + ric*delta - rscal/(n-1)* self*delta
-            self._weyl = riem + 2/(n-2)* aux.antisymmetrize(2,3) 
+            if (self._ambient_domain._manifold._nproc > 1 or 
+                disk_cache_directory() is not None) and \
+                                         isinstance(riem, TensorFieldParal):
+                # component computation, possibly in parallel or from the 
+                # disk cache:
+                self._weyl = self._weyl_comp(riem)
+            else:
+                ric = self.ricci()
+                rscal = self.ricci_scalar()
+                # First index of the Ricci tensor raised with the metric
+                ricup = ric.up(self, 0) 
+                aux = self*ricup + ric*delta - rscal/(n-1)* self*delta
+                self._weyl = riem + 2/(n-2)* aux.antisymmetrize(2,3) 
             if name is None:
                 name = "C(" + self._name + ")"
             if latex_name is None:
@@ -891,6 +926,257 @@ class Metric(TensorField):
             self._weyl.set_name(name=name, latex_name=latex_name)
         return self._weyl
 
+    def _weyl_comp(self, riem):
+        r"""
+        Compute the Weyl tensor component by component, in each frame in 
+        which the Riemann tensor is known. 
+        
+        The independent components are distributed over the processes set
+        by :meth:`~sage.geometry.manifolds.manifold.Manifold.set_parallel`;
+        they are taken from the disk cache if available (see
+        :mod:`~sage.geometry.manifolds.diskcache`). The Ricci tensor and
+        the Ricci scalar are computed only if the components in some frame
+        are not in the disk cache.
+        
+        INPUT:
+        
+        - ``riem`` -- Riemann tensor of ``self``
+        
+        OUTPUT:
+        
+        - the Weyl tensor, as an instance of 
+          :class:`~sage.geometry.manifolds.tensorfield.TensorFieldParal`
+
+        """
+        from utilities import compute_components
+        from diskcache import load_components, save_components
+        manif = self._ambient_domain._manifold
+        n = manif._dim
+        resu = self._vmodule.tensor((1,3), antisym=(2,3))
+        ric = None
+        for frame in riem._components:
+            cweyl = resu.add_comp(frame)
+            if load_components(self, frame, 'weyl', cweyl):
+                continue  # the components were in the disk cache
+            if ric is None:
+                ric = self.ricci()
+                rscal = self.ricci_scalar()
+                # First index of the Ricci tensor raised with the metric
+                ricup = ric.up(self, 0) 
+            criem = riem.comp(frame)
+            cg = self.comp(frame)
+            cric = ric.comp(frame)
+            cricup = ricup.comp(frame)
+            rs = rscal.restrict(frame._domain) / (n-1)
+            def weyl_comp(ind):
+                i, j, k, l = ind
+                aux = cg[[j,k]]*cricup[[i,l]] - cg[[j,l]]*cricup[[i,k]]
+                if i == l:
+                    aux += cric[[j,k]] - rs*cg[[j,k]]
+                if i == k:
+                    aux -= cric[[j,l]] - rs*cg[[j,l]]
+                return criem[[i,j,k,l]] + aux / (n-2)
+            # antisymmetry of the Weyl tensor taken into account by l>k: 
+            indices = [(i,j,k,l) for i in manif.irange() 
+                                 for j in manif.irange()
+                                 for k in manif.irange()
+                                 for l in manif.irange(start=k+1)]
+            for ind, value in compute_components(weyl_comp, indices, 
+                                         frame._domain, nproc=manif._nproc):
+                cweyl[[ind]] = value
+            save_components(self, frame, 'weyl', cweyl)
+        return resu
+
+    def curvature_invariants(self, invariants=None, timings=None):
+        r"""
+        Return some scalar invariants built on the curvature of the metric.
+
+        The invariants are computed in a single pass, which shares the
+        tensors involved in several of them, namely the mixed Riemann tensor
+        `R^{ij}_{\ \ \, kl}` and the mixed Ricci tensor `R^i_{\ \, j}`. All
+        the quantities are cached, so that they are not recomputed when other
+        invariants are requested later on.
+
+        The available invariants are
+
+        - ``'ricci_scalar'`` -- the Ricci scalar `r = R^i_{\ \, i}` (see
+          :meth:`ricci_scalar`)
+        - ``'ricci_squared'`` -- `R_{ij} R^{ij} = R^i_{\ \, j} R^j_{\ \, i}`
+        - ``'kretschmann'`` -- the Kretschmann scalar
+          `K = R_{ijkl} R^{ijkl} = R^{ij}_{\ \ \, kl} R^{kl}_{\ \ \, ij}`
+        - ``'weyl_squared'`` -- `C_{ijkl} C^{ijkl}`, `C` being the Weyl
+          conformal tensor; it is obtained from the previous invariants via
+
+          .. MATH::
+
+              C_{ijkl} C^{ijkl} = K - \frac{4}{n-2} R_{ij} R^{ij}
+                + \frac{2}{(n-1)(n-2)} r^2
+
+          (defined only for `n\geq 3`, `n` being the manifold's dimension)
+        - ``'chern_pontryagin'`` -- the Chern-Pontryagin scalar
+          `{}^*\!R_{ijkl} R^{ijkl} = \frac{1}{2} \epsilon^{ij}_{\ \ \, mp}
+          R^{mp}_{\ \ \ \, kl} R^{kl}_{\ \ \, ij}`, `\epsilon` being the
+          volume form associated with the metric (see :meth:`volume_form`);
+          it is equal to the Weyl invariant `{}^*C_{ijkl} C^{ijkl}` (defined
+          only for `n=4`)
+
+        INPUT:
+
+        - ``invariants`` -- (default: None) list of the names of the
+          invariants to be computed; if none, all the invariants defined in
+          the manifold's dimension are computed
+        - ``timings`` -- (default: None) if a dictionary is provided, it is
+          updated with the CPU time (in seconds) spent in each stage of the
+          computation, with the stage names as keys
+
+        OUTPUT:
+
+        - dictionary of the invariants, as instances of
+          :class:`~sage.geometry.manifolds.scalarfield.ScalarField`, with
+          their names as keys
+
+        EXAMPLES:
+
+        Curvature invariants of the standard metric on the 2-sphere::
+
+            sage: Manifold._clear_cache_() # for doctests only
+            sage: M = Manifold(2, 'S^2', start_index=1)
+            sage: U = M.open_domain('U') # the complement of a meridian (domain of spherical coordinates)
+            sage: c_spher.<th,ph> = U.chart(r'th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: a = var('a') # the sphere radius
+            sage: g = U.metric('g')
+            sage: g[1,1], g[2,2] = a^2, a^2*sin(th)^2
+            sage: t = {}
+            sage: inv = g.curvature_invariants(timings=t)
+            sage: sorted(inv)
+            ['kretschmann', 'ricci_scalar', 'ricci_squared']
+            sage: inv['kretschmann']
+            scalar field 'K(g)' on the open domain 'U' on the 2-dimensional manifold 'S^2'
+            sage: inv['kretschmann'].expr()
+            4/a^4
+            sage: inv['ricci_squared'].expr()
+            2/a^4
+            sage: inv['ricci_scalar'] is g.ricci_scalar()
+            True
+            sage: sorted(t)
+            ['kretschmann', 'ricci', 'ricci_mixed', 'ricci_scalar', 'ricci_squared', 'riemann', 'riemann_mixed']
+
+        The invariants are cached::
+
+            sage: g.curvature_invariants(['kretschmann'])['kretschmann'] is inv['kretschmann']
+            True
+
+        Curvature invariants of the Schwarzschild metric::
+
+            sage: M = Manifold(4, 'M')
+            sage: c_BL.<t,r,th,ph> = M.chart(r't r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi') # Boyer-Lindquist coordinates
+            sage: g = M.metric('g', signature=2)
+            sage: m = var('m')  # mass in Schwarzschild metric
+            sage: g[0,0], g[1,1] = -(1-2*m/r), 1/(1-2*m/r)
+            sage: g[2,2], g[3,3] = r^2, (r*sin(th))^2
+            sage: inv = g.curvature_invariants()
+            sage: sorted(inv)
+            ['chern_pontryagin', 'kretschmann', 'ricci_scalar', 'ricci_squared', 'weyl_squared']
+            sage: inv['kretschmann'].expr()
+            48*m^2/r^6
+            sage: inv['weyl_squared'] == inv['kretschmann']  # since Ric(g) = 0
+            True
+            sage: inv['chern_pontryagin'] == 0
+            True
+
+        """
+        from sage.misc.misc import cputime
+        n = self._ambient_domain._manifold._dim
+        all_invariants = ['ricci_scalar', 'ricci_squared', 'kretschmann']
+        if n >= 3:
+            all_invariants.append('weyl_squared')
+        if n == 4:
+            all_invariants.append('chern_pontryagin')
+        if invariants is None:
+            invariants = all_invariants
+        elif isinstance(invariants, str):
+            invariants = [invariants]
+        for inv in invariants:
+            if inv not in all_invariants:
+                raise ValueError("The invariant '" + str(inv) + "' is not " +
+                                 "available in dimension " + str(n) + ".")
+        # Planning: the invariants required by the Weyl ones are computed
+        # first and the tensors they involve are computed only once
+        plan = []
+        for inv in ['ricci_scalar', 'ricci_squared', 'kretschmann']:
+            if inv in invariants or 'weyl_squared' in invariants:
+                plan.append(inv)
+        for inv in ['weyl_squared', 'chern_pontryagin']:
+            if inv in invariants:
+                plan.append(inv)
+        stages = ['riemann']
+        if 'kretschmann' in plan or 'chern_pontryagin' in plan:
+            stages.append('riemann_mixed')
+        if 'ricci_scalar' in plan or 'ricci_squared' in plan:
+            stages.append('ricci')
+        if 'ricci_squared' in plan:
+            stages.append('ricci_mixed')
+        stages += plan
+        if timings is None:
+            timings = {}
+        aux = self._curvature_aux
+        resu = self._curvature_invariants
+        for stage in stages:
+            t0 = cputime()
+            if stage == 'riemann':
+                riem = self.riemann()
+            elif stage == 'riemann_mixed':
+                # R^{ij}_{kl}, shared by K and by the Chern-Pontryagin scalar
+                if 'riemann_mixed' not in aux:
+                    aux['riemann_mixed'] = riem.up(self, 1)
+            elif stage == 'ricci':
+                ric = self.ricci()
+            elif stage == 'ricci_mixed':
+                # R^i_j
+                if 'ricci_mixed' not in aux:
+                    aux['ricci_mixed'] = ric.up(self, 0)
+            elif stage not in resu:
+                # computation of a scalar invariant
+                if stage == 'ricci_scalar':
+                    resu[stage] = self.ricci_scalar()
+                elif stage == 'ricci_squared':
+                    ricm = aux['ricci_mixed']
+                    resu[stage] = ricm.contract(0, 1, ricm, 1, 0)
+                    self._set_invariant_name(resu[stage], 'Ric2', r'Ric^2')
+                elif stage == 'kretschmann':
+                    riemm = aux['riemann_mixed']
+                    resu[stage] = riemm.contract(0, 1, 2, 3,
+                                                 riemm, 2, 3, 0, 1)
+                    self._set_invariant_name(resu[stage], 'K', r'K')
+                elif stage == 'weyl_squared':
+                    rscal = resu['ricci_scalar']
+                    resu[stage] = resu['kretschmann'] \
+                            - Integer(4)/(n-2) * resu['ricci_squared'] \
+                            + Integer(2)/((n-1)*(n-2)) * rscal*rscal
+                    self._set_invariant_name(resu[stage], 'C2', r'C^2')
+                elif stage == 'chern_pontryagin':
+                    riemm = aux['riemann_mixed']
+                    eps2 = self.volume_form(2)
+                    dual = eps2.contract(2, 3, riemm, 0, 1)
+                    resu[stage] = dual.contract(0, 1, 2, 3,
+                                                riemm, 2, 3, 0, 1) / 2
+                    self._set_invariant_name(resu[stage], 'P',
+                                             r'{}^*\!R R')
+            timings[stage] = cputime(t0)
+        return dict([(inv, resu[inv]) for inv in invariants])
+
+    def _set_invariant_name(self, scalar, name, latex_name):
+        r"""
+        Set the name of a curvature invariant, in the form "name(g)", where
+        "g" is the metric's name.
+
+        """
+        if scalar is scalar._domain._zero_scalar_field:
+            return  # the zero scalar field is shared and keeps its name
+        scalar._name = name + "(" + self._name + ")"
+        scalar._latex_name = latex_name + r"\left(" + self._latex_name + \
+                             r"\right)"
+
     def determinant(self, frame=None):
         r"""
         Determinant of the metric components in the specified frame.
@@ -1181,6 +1467,46 @@ class Metric(TensorField):
                 self._vol_forms.append(epsk)
         return self._vol_forms[contra]
 
+    def hodge_operator(self):
+        r"""
+        Hodge star operator associated with the metric.
+
+        OUTPUT:
+
+        - instance of :class:`HodgeOperator`; it is computed only once and
+          stores the data (metric determinant, inverse metric, signs of 
+          permutations) used to compute the Hodge duals of forms
+
+        EXAMPLE::
+
+            sage: M = Manifold(3, 'M', start_index=1)
+            sage: X.<x,y,z> = M.chart()
+            sage: g = M.metric('g')
+            sage: g[1,1], g[2,2], g[3,3] = 1, 1, 1
+            sage: star = g.hodge_operator() ; star
+            Hodge operator associated with the Riemannian metric 'g' on the 3-dimensional manifold 'M'
+            sage: star is g.hodge_operator()
+            True
+            sage: a = M.one_form('A')
+            sage: a[:] = [1, 2, 3]
+            sage: star(a).view()
+            *A = 3 dx/\dy - 2 dx/\dz + dy/\dz
+            sage: star(a) == a.hodge_star(g)
+            True
+
+        The operator remains valid after a modification of the metric::
+
+            sage: g[1,1] = 4
+            sage: star is g.hodge_operator()
+            True
+            sage: star(a).view()
+            *A = 6 dx/\dy - 4 dx/\dz + 1/2 dy/\dz
+
+        """
+        if self._hodge_operator is None:
+            self._hodge_operator = HodgeOperator(self)
+        return self._hodge_operator
+
 #*****************************************************************************
 
 class RiemannMetric(Metric):
@@ -1802,3 +2128,282 @@ class LorentzMetricParal(MetricParal):
                               signature=signature_type,
                               latex_name=r'\mbox{unnamed metric}')
 
+
+#******************************************************************************
+
+class HodgeOperator(SageObject):
+    r"""
+    Hodge star operator associated with a pseudo-Riemannian metric.
+
+    Given a pseudo-Riemannian metric `g` on a `n`-dimensional manifold, 
+    the Hodge dual of a `p`-form `A` is the `(n-p)`-form `*A` whose 
+    components in a given vector frame are
+
+    .. MATH::
+
+        *A_{j_1\ldots j_{n-p}} = \sqrt{|\det g|} \, 
+            \varepsilon_{k_1\ldots k_p j_1\ldots j_{n-p}} \, 
+            A^{k_1\ldots k_p}
+
+    where `j_1<\cdots<j_{n-p}` and `(k_1,\ldots,k_p)` is the increasing 
+    sequence of the complementary indices, `\varepsilon` being the sign of 
+    the permutation `(k_1,\ldots,k_p,j_1,\ldots,j_{n-p})` and the indices 
+    `k_1,\ldots,k_p` being raised with `g`. 
+
+    For each vector frame, `\sqrt{|\det g|}` and the components of the 
+    inverse metric are computed once and stored, together with the 
+    factors `\sqrt{|\det g|}\,\varepsilon_{k_1\ldots k_p j_1\ldots j_{n-p}}` 
+    for each degree `p`. Applying the operator to a form then amounts to 
+    raising its indices and scaling each component. If the metric is 
+    diagonal in the frame, the index raising is also a scaling, which is 
+    included in the stored factors.
+
+    The Hodge operator is generally obtained by the method 
+    :meth:`Metric.hodge_operator`; it is also used by the methods
+    :meth:`~sage.geometry.manifolds.diffform.DiffFormParal.hodge_star` and
+    :meth:`~sage.geometry.manifolds.scalarfield.ScalarField.hodge_star`.
+
+    INPUT:
+
+    - ``metric`` -- the pseudo-Riemannian metric `g` (instance of 
+      :class:`Metric`)
+
+    EXAMPLES:
+
+    Hodge operator of the Euclidean metric in spherical coordinates::
+
+        sage: M = Manifold(3, 'R^3', start_index=1)
+        sage: U = M.open_domain('U') # the complement of the half-plane (y=0, x>=0)
+        sage: c_spher.<r,th,ph> = U.chart(r'r:(0,+oo) th:(0,pi):\theta ph:(0,2*pi):\phi')
+        sage: g = U.metric('g')
+        sage: g[1,1], g[2,2], g[3,3] = 1, r^2, (r*sin(th))^2
+        sage: star = g.hodge_operator() ; star
+        Hodge operator associated with the Riemannian metric 'g' on the open domain 'U' on the 3-dimensional manifold 'R^3'
+        sage: star(c_spher.coframe()[1]).view()
+        *dr = r^2*sin(th) dth/\dph
+        sage: star(c_spher.coframe()[3]).view()
+        *dph = 1/sin(th) dr/\dth
+        sage: star(U.scalar_field(1)).view()
+        r^2*sin(th) dr/\dth/\dph
+
+    A non-diagonal metric::
+
+        sage: M = Manifold(2, 'M')
+        sage: X.<x,y> = M.chart()
+        sage: h = M.metric('h')
+        sage: h[0,0], h[0,1], h[1,1] = 2, 1, 1
+        sage: a = M.one_form('a')
+        sage: a[:] = [1, 0]
+        sage: h.hodge_operator()(a)[:]
+        [1, 1]
+        sage: h.hodge_operator()(a) == a.contract(0, h.volume_form(1), 0)
+        True
+
+    """
+    def __init__(self, metric):
+        self._metric = metric
+        manif = metric._ambient_domain._manifold
+        self._dim = manif._dim
+        self._sindex = manif._sindex
+        self._sign_tables = {} # signs of the complementary index sets 
+                               # (key: degree)
+        self._frame_data = {} # sqrt(abs(det g)), inverse metric and 
+                              # scaling factors (key: frame)
+
+    def _repr_(self):
+        r"""
+        String representation of the object.
+        """
+        return "Hodge operator associated with the " + str(self._metric)
+
+    def _sign_table(self, p):
+        r"""
+        Return the table of the complementary index sets for a given 
+        degree. 
+
+        INPUT:
+
+        - ``p`` -- the degree
+
+        OUTPUT:
+
+        - dictionary whose keys are the strictly increasing sequences 
+          `(k_1,\ldots,k_p)` and whose values are the pairs 
+          `((j_1,\ldots,j_{n-p}), \varepsilon)`, where 
+          `(j_1,\ldots,j_{n-p})` is the increasing sequence of the 
+          complementary indices and `\varepsilon` is the sign of the 
+          permutation `(k_1,\ldots,k_p,j_1,\ldots,j_{n-p})`
+
+        EXAMPLE::
+
+            sage: M = Manifold(3, 'M')
+            sage: X.<x,y,z> = M.chart()
+            sage: g = M.metric('g')
+            sage: g[0,0], g[1,1], g[2,2] = 1, 1, 1
+            sage: sorted(g.hodge_operator()._sign_table(1).items())
+            [((0,), ((1, 2), 1)), ((1,), ((0, 2), -1)), ((2,), ((0, 1), 1))]
+
+        """
+        from itertools import combinations
+        if p not in self._sign_tables:
+            indices = range(self._sindex, self._sindex + self._dim)
+            table = {}
+            for ind_k in combinations(indices, p):
+                ind_j = tuple(i for i in indices if i not in ind_k)
+                # the sign is (-1)^N, N being the number of pairs (k, j) 
+                # with k > j:
+                nb_inv = sum(1 for k in ind_k for j in ind_j if k > j)
+                table[ind_k] = (ind_j, (-1)**nb_inv)
+            self._sign_tables[p] = table
+        return self._sign_tables[p]
+
+    def _get_frame_data(self, frame):
+        r"""
+        Return the data associated with a given vector frame. 
+
+        INPUT:
+
+        - ``frame`` -- vector frame
+
+        OUTPUT:
+
+        - dictionary with the following entries:
+
+          - ``'columns'``: the nonzero components `g^{ij}` of the inverse 
+            metric, in the format required by 
+            :meth:`~sage.tensor.modules.comp.Components._slot_transform`, 
+            or None if the metric is diagonal in ``frame``
+          - ``'factors'``: dictionary of the scaling factors (key: degree), 
+            initially empty
+          - ``'sqrt_abs_det'``: `\sqrt{|\det g|}` in ``frame``
+          - ``'diag'``: dictionary of the diagonal components `g^{ii}` of 
+            the inverse metric if the metric is diagonal in ``frame``
+
+        """
+        if frame not in self._frame_data:
+            # a new computation is necessary
+            gr = self._metric.restrict(frame._domain)
+            ginv = gr.inverse().comp(frame)._full_comp()
+            data = {'sqrt_abs_det': gr.sqrt_abs_det(frame), 'factors': {}}
+            if all(ind[0] == ind[1] for ind in ginv):
+                data['columns'] = None
+                data['diag'] = dict((ind[0], val) 
+                                    for ind, val in ginv.iteritems())
+            else:
+                columns = {}
+                for ind, val in ginv.iteritems():
+                    columns.setdefault(ind[1], []).append((ind[0], val))
+                data['columns'] = columns
+            self._frame_data[frame] = data
+        return self._frame_data[frame]
+
+    def _factors(self, frame, p):
+        r"""
+        Return the scaling factors for `p`-forms in a given vector frame. 
+
+        INPUT:
+
+        - ``frame`` -- vector frame
+        - ``p`` -- the degree
+
+        OUTPUT:
+
+        - dictionary whose keys are the strictly increasing sequences 
+          `(k_1,\ldots,k_p)` and whose values are the pairs 
+          `((j_1,\ldots,j_{n-p}), c)`, where `(j_1,\ldots,j_{n-p})` is 
+          the increasing sequence of the complementary indices and 
+          `c = \sqrt{|\det g|}\, \varepsilon_{k_1\ldots k_p j_1\ldots j_{n-p}}`
+          if the metric is not diagonal in ``frame`` and 
+          `c = \sqrt{|\det g|}\, \varepsilon_{k_1\ldots k_p j_1\ldots j_{n-p}}
+          \, g^{k_1k_1}\cdots g^{k_pk_p}` if it is diagonal
+
+        """
+        data = self._get_frame_data(frame)
+        factors = data['factors']
+        if p not in factors:
+            sqrtg = data['sqrt_abs_det']
+            diag = data.get('diag')
+            factors_p = {}
+            for ind_k, (ind_j, sign) in self._sign_table(p).iteritems():
+                fact = sign * sqrtg
+                if diag is not None:
+                    for k in ind_k:
+                        fact = fact * diag[k]
+                factors_p[ind_k] = (ind_j, fact)
+            factors[p] = factors_p
+        return factors[p]
+
+    def __call__(self, form):
+        r"""
+        Apply the Hodge operator to a differential form. 
+
+        INPUT:
+
+        - ``form`` -- a `p`-form `A` (instance of 
+          :class:`~sage.geometry.manifolds.diffform.DiffFormParal`) or a 
+          scalar field (`p=0`)
+
+        OUTPUT:
+
+        - the `(n-p)`-form `*A` (a scalar field if `p=n`)
+
+        EXAMPLE::
+
+            sage: M = Manifold(2, 'M')
+            sage: X.<x,y> = M.chart('x:(0,+oo) y')
+            sage: g = M.metric('g')
+            sage: g[0,0], g[1,1] = 1, x^2
+            sage: a = M.one_form('A')
+            sage: a[:] = [y, 1]
+            sage: sa = g.hodge_operator()(a) ; sa
+            1-form '*A' on the 2-dimensional manifold 'M'
+            sage: sa.view()
+            *A = -1/x dx + x*y dy
+
+        """
+        from sage.tensor.modules.comp import CompFullyAntiSym
+        from scalarfield import ScalarField
+        from utilities import format_unop_txt, format_unop_latex
+        metric = self._metric
+        if isinstance(form, ScalarField):
+            # the Hodge dual is the product by the volume form, which is
+            # computed only once by the metric
+            eps = metric.volume_form()
+            dom_resu = form._domain.intersection(eps._domain)
+            resu = form.restrict(dom_resu) * eps.restrict(dom_resu)
+        else:
+            dom_resu = form._domain.intersection(metric._domain)
+            form = form.restrict(dom_resu)
+            fmodule = form._fmodule
+            if fmodule._def_basis in form._components:
+                frame = fmodule._def_basis
+            else:
+                frame = form._components.keys()[0]
+            p = form._tensor_rank
+            comp = form._components[frame]
+            factors = self._factors(frame, p)
+            columns = self._get_frame_data(frame)['columns']
+            if columns is None:
+                # diagonal metric: the index raising is included in factors
+                values = comp._comp
+            else:
+                raised = CompFullyAntiSym(fmodule._ring, frame, p, 
+                                          start_index=fmodule._sindex, 
+                                    output_formatter=fmodule._output_formatter)
+                comp._slot_transform([columns]*p, raised)
+                values = raised._comp
+            if p == self._dim:
+                ind = tuple(range(self._sindex, self._sindex + self._dim))
+                if ind in values:
+                    resu = factors[ind][1] * values[ind]
+                else:
+                    resu = dom_resu.scalar_field(0)
+            else:
+                resu = fmodule.alternating_form(self._dim - p)
+                rcomp = resu.add_comp(frame)
+                for ind_k, val in values.iteritems():
+                    ind_j, fact = factors[ind_k]
+                    rcomp._comp[ind_j] = fact * val
+        resu.set_name(name=format_unop_txt('*', form._name),
+                     latex_name=format_unop_latex(r'\star ', form._latex_name))
+        return resu
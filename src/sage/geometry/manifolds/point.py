@@ -6,6 +6,10 @@ coordinate independent manner: a :class:`Point` object can have coordinates in
 various charts defined on the manifold. Two points are declared equal if they 
 have the same coordinates in the same chart. 
 
+The class :class:`PointArray` implements large sets of points given by 
+numerical coordinates, the changes of coordinates being performed on all the
+points at once.
+
 AUTHORS:
 
 - Eric Gourgoulhon, Michal Bejger (2013) : initial version
@@ -57,6 +61,7 @@ Listing all the coordinates of a point in different charts::
 #                  http://www.gnu.org/licenses/
 #*****************************************************************************
 
+from sage.structure.sage_object import SageObject
 from sage.structure.element import Element   
 
 class Point(Element):
@@ -244,6 +249,27 @@ class Point(Element):
             sage: p._coordinates # random (dictionary output)
             {chart (M, (u, v)): (a - b, a + b), chart (M, (w, z)): (a^3 - 3*a^2*b + 3*a*b^2 - b^3, a^3 + 3*a^2*b + 3*a*b^2 + b^3)}
 
+        If the coordinates are known in none of the charts directly connected
+        to the required one, a chain of changes of coordinates is used; the 
+        composed change of coordinates is stored, so that it is directly 
+        available for subsequent computations::
+
+            sage: p.set_coord((a, b), c_xy)
+            sage: p.coord(c_wz)
+            (a^3 - 3*a^2*b + 3*a*b^2 - b^3, a^3 + 3*a^2*b + 3*a*b^2 + b^3)
+            sage: (c_xy, c_wz) in M._coord_changes
+            True
+
+        If the coordinates are numerical, they can be computed by inverting 
+        numerically a change of coordinates, the inverse of which is not 
+        known::
+
+            sage: c_st.<s,t> = M.chart()
+            sage: ch = c_st.transition_map(c_xy, (s + sin(s)/2, t))
+            sage: q = M.point((1.5, 2), chart=c_xy)
+            sage: [round(c, 8) for c in q.coord(c_st)]
+            [1.06307313, 2.0]
+
         """
         if chart is None:
             dom = self._domain 
@@ -300,6 +326,37 @@ class Point(Element):
                                 break
                         if old_chart is not None:
                             break
+            if old_chart is None:
+                # Search for a chain of changes of coordinates, the 
+                # composition of which is stored in dom._coord_changes:
+                known = {}
+                for ochart in self._coordinates:
+                    for subchart in ochart._subcharts:
+                        known[subchart] = ochart
+                path = dom._coord_change_route(known.keys(), 
+                                               chart._subcharts)
+                if path:
+                    chcoord = dom._compose_coord_changes(path)
+                    old_chart = known[chcoord._chart1]
+                    self._coordinates[chart] = \
+                                    chcoord(*self._coordinates[old_chart])
+                    return self._coordinates[chart]
+                # Last resort: numerical inversion of a change of 
+                # coordinates from chart to a chart of known numerical 
+                # coordinates: 
+                for schart in chart._subcharts:
+                    for subchart, ochart in known.iteritems():
+                        if (schart, subchart) not in dom._coord_changes:
+                            continue
+                        try:
+                            coords = [float(x) for x in 
+                                      self._coordinates[ochart]]
+                        except TypeError: # symbolic coordinates
+                            continue
+                        chcoord = dom._coord_changes[(schart, subchart)]
+                        self._coordinates[chart] = \
+                                            chcoord.numerical_inverse(*coords)
+                        return self._coordinates[chart]
             if old_chart is None:
                 raise ValueError("The coordinates of " + str(self) + \
                     " in the " + str(chart) + " cannot be computed" + \
@@ -595,3 +652,207 @@ class Point(Element):
             resu += point3d(xp, color=color, size=size) + \
                     text3d(label, xlab, fontsize=fontsize, color=label_color)
         return resu
+
+#******************************************************************************
+
+class PointArray(SageObject):
+    r"""
+    Array of points on a manifold, given by numerical coordinates.
+
+    Instead of being made of :class:`Point` objects, a point array stores, 
+    for each chart in which the coordinates are known, a single NumPy 
+    array of shape `(N, n)`, where `N` is the number of points and `n` the 
+    manifold's dimension. The coordinates in a new chart are computed for 
+    all the points at once, by means of the changes of coordinates compiled 
+    into numerical functions (cf. 
+    :meth:`~sage.geometry.manifolds.chart.MultiFunctionChart.numerical_functions`).
+    Individual :class:`Point` objects are created only on request, by 
+    indexing the array. 
+
+    INPUT:
+
+    - ``domain`` -- the manifold domain to which the points belong (can be 
+      the entire manifold)
+    - ``coords`` -- array-like object of shape `(N, n)` (e.g. a list of 
+      coordinate tuples or a NumPy array) containing the coordinates of the
+      `N` points
+    - ``chart`` -- (default: None) chart in which the coordinates are given; 
+      if none is provided, the coordinates are assumed to refer to the 
+      domain's default chart
+
+    EXAMPLES:
+
+    Array of points on `\RR^2`, given by their polar coordinates::
+
+        sage: import numpy
+        sage: M = Manifold(2, 'R^2')
+        sage: c_pol.<r,ph> = M.chart(r'r:(0,+oo) ph:(0,2*pi):\phi')
+        sage: c_cart.<x,y> = M.chart()
+        sage: ch = c_pol.transition_map(c_cart, (r*cos(ph), r*sin(ph)))
+        sage: pts = M.point_array([(1, 0), (2, pi/2), (1, pi)]) ; pts
+        array of 3 points on 2-dimensional manifold 'R^2'
+        sage: len(pts)
+        3
+
+    Cartesian coordinates of all the points::
+
+        sage: xy = pts.coord(c_cart)
+        sage: xy.shape
+        (3, 2)
+        sage: [[round(c, 10) for c in p] for p in xy]
+        [[1.0, 0.0], [0.0, 2.0], [-1.0, 0.0]]
+
+    Individual points::
+
+        sage: p = pts[1] ; p
+        point on 2-dimensional manifold 'R^2'
+        sage: [round(c, 10) for c in p.coord(c_cart)]
+        [0.0, 2.0]
+
+    A large array of points::
+
+        sage: pts = M.point_array(numpy.random.uniform(0.1, 6., (10^6, 2)))
+        sage: pts.coord(c_cart).shape
+        (1000000, 2)
+
+    """
+    def __init__(self, domain, coords, chart=None):
+        import numpy
+        self._manifold = domain._manifold
+        self._domain = domain
+        if chart is None: 
+            chart = domain._def_chart
+        elif chart not in domain._atlas: 
+            raise ValueError("The " + str(chart) +
+                             " has not been defined on the " + str(domain))
+        coords = numpy.array(coords, dtype=numpy.float64)
+        if coords.ndim != 2 or coords.shape[1] != self._manifold._dim:
+            raise ValueError("The coordinates must form an array of shape " + 
+                             "(N, " + str(self._manifold._dim) + ").")
+        self._coordinates = {}
+        for schart in chart._supercharts:
+            self._coordinates[schart] = coords
+
+    def _repr_(self):
+        r"""
+        Special Sage function for the string representation of the object.
+        """
+        return "array of " + str(len(self)) + " points on " + \
+               str(self._manifold)
+
+    def __len__(self):
+        r"""
+        Number of points in the array.
+        """
+        return self._coordinates.itervalues().next().shape[0]
+
+    def __getitem__(self, index):
+        r"""
+        Return a point of the array, as an instance of :class:`Point`, the 
+        coordinates of which are those known in the array.
+        """
+        import numpy
+        point = self._domain.point()
+        for chart, coords in self._coordinates.iteritems():
+            if not numpy.isnan(coords[index]).any():
+                point._coordinates[chart] = tuple(coords[index].tolist())
+        return point
+
+    def __iter__(self):
+        r"""
+        Iterate over the points of the array.
+        """
+        for i in range(len(self)):
+            yield self[i]
+
+    def coord(self, chart=None):
+        r"""
+        Return the coordinates of the points in a given chart.
+
+        If these coordinates are not already known, they are computed, for all
+        the points at once, from known ones by means of a chain of changes of
+        coordinates or, as a last resort, by the numerical inversion of a 
+        change of coordinates (cf. 
+        :meth:`~sage.geometry.manifolds.chart.CoordChange.numerical_inverse`). 
+
+        INPUT:
+
+        - ``chart`` -- (default: None) chart in which the coordinates are 
+          required; if none is provided, the coordinates are assumed to 
+          refer to the domain's default chart
+
+        OUTPUT:
+
+        - NumPy array of shape `(N, n)`, the row `i` of which contains the 
+          coordinates of the `i`-th point; the coordinates of the points
+          that do not belong to the chart domain are set to ``NaN``
+
+        EXAMPLE::
+
+            sage: M = Manifold(2, 'M')
+            sage: X.<x,y> = M.chart()
+            sage: Y.<u,v> = M.chart()
+            sage: ch = X.transition_map(Y, (x + sin(x)/2, y))
+            sage: pts = M.point_array([(0, 1), (1.5, 2)], chart=Y)
+            sage: [[round(c, 8) for c in p] for p in pts.coord(X)]
+            [[0.0, 1.0], [1.06307313, 2.0]]
+
+        Coordinates in the restriction of a chart to a subdomain, the points
+        lying outside the subdomain being discarded::
+
+            sage: import numpy
+            sage: U = M.open_domain('U', coord_def={X: x>1/2})
+            sage: xy = pts.coord(X.restrict(U))
+            sage: round(xy[1][0], 8), xy[1][1]
+            (1.06307313, 2.0)
+            sage: numpy.isnan(xy[0]).all()
+            True
+
+        """
+        import numpy
+        if chart is None:
+            dom = self._domain 
+            chart = dom._def_chart
+        else:
+            dom = chart._domain
+        if chart in self._coordinates:
+            return self._coordinates[chart]
+        known = {}
+        for ochart in self._coordinates:
+            for subchart in ochart._subcharts:
+                known[subchart] = ochart
+        path = dom._coord_change_route(known.keys(), chart._subcharts)
+        if path == []:
+            # chart has a subchart in which the coordinates are known:
+            for schart in chart._subcharts:
+                if schart in known:
+                    coords = self._coordinates[known[schart]].copy()
+                    break
+        elif path is not None:
+            coords = self._coordinates[known[path[0]._chart1]].T
+            with numpy.errstate(all='ignore'):
+                for chcoord in path:
+                    functions = chcoord._transf.numerical_functions()
+                    coords = [funct(*coords) for funct in functions]
+            coords = numpy.array(coords).T
+        else:
+            # Numerical inversion of a change of coordinates from chart to
+            # a chart of known coordinates:
+            coords = None
+            for schart in chart._subcharts:
+                for subchart, ochart in known.iteritems():
+                    if (schart, subchart) in dom._coord_changes:
+                        chcoord = dom._coord_changes[(schart, subchart)]
+                        coords = numpy.array(chcoord.numerical_inverse(
+                                          *self._coordinates[ochart].T)).T
+                        break
+                if coords is not None:
+                    break
+            if coords is None:
+                raise ValueError("The coordinates in the " + str(chart) + 
+                                 " cannot be computed by means of known " + 
+                                 "changes of charts.")
+        valid = chart.valid_coordinates_numerical(*coords.T, tolerance=1e-13)
+        coords[~valid] = numpy.nan
+        self._coordinates[chart] = coords
+        return coords
@@ -344,6 +344,9 @@ class ScalarField(CommutativeAlgebraElement):
             self._latex_name = self._name
         else:
             self._latex_name = latex_name
+        self._restriction_source = None # scalar field of which self is a 
+                                        # restriction view (cf. method 
+                                        # restrict())
         self._express = {} # dict of coordinate expressions (FunctionChart
                            # instances) with charts as keys
         if coord_expression is not None:
@@ -364,6 +367,44 @@ class ScalarField(CommutativeAlgebraElement):
                                                         coord_expression)
         self._init_derived()   # initialization of derived quantities
 
+    def _get_express(self):
+        r"""
+        Return the dictionary of coordinate expressions of ``self``. 
+
+        If ``self`` is a restriction view of another scalar field (cf. 
+        :meth:`restrict`), the dictionary is completed at this stage with all
+        the expressions of the latter and ``self`` becomes an independent 
+        scalar field. 
+        """
+        if self._restriction_source is not None:
+            self._materialize()
+        return self._express_dict
+
+    def _set_express(self, express):
+        r"""
+        Set the dictionary of coordinate expressions of ``self``. 
+        """
+        self._express_dict = express
+
+    _express = property(_get_express, _set_express)
+
+    def _materialize(self):
+        r"""
+        Turn a restriction view into an independent scalar field, by copying 
+        the coordinate expressions of the scalar field of which it is the 
+        restriction. 
+        """
+        source = self._restriction_source
+        self._restriction_source = None
+        express = self._express_dict
+        dom = self._domain
+        for chart, funct in source._express.iteritems():
+            # the subcharts of chart belonging to the atlas of dom are those
+            # whose domain is included in dom:
+            for schart in chart._subcharts:
+                if schart._domain.is_subdomain(dom) and schart not in express:
+                    express[schart] = FunctionChart(schart, funct._express)
+
     ####### Required methods for an algebra element (beside arithmetic) #######
     
     def __nonzero__(self):
@@ -446,6 +487,11 @@ class ScalarField(CommutativeAlgebraElement):
         r"""
         Delete the derived quantities
         """
+        # The restriction views of self are turned into independent scalar 
+        # fields, since they must not reflect the forthcoming changes of self:
+        for rst in self._restrictions.itervalues():
+            if rst._restriction_source is self:
+                rst._materialize()
         self._restrictions.clear()
         self._differential = None 
         # First deletes any reference to self in the vectors' dictionary:
@@ -631,6 +677,17 @@ class ScalarField(CommutativeAlgebraElement):
             sage: f.function_chart(o2)
             -T^2 + X^2
 
+        Expression via a chain of changes of coordinates::
+
+            sage: o3.<a,b> = M.chart()
+            sage: o3.coord_change(o2, a+b, a-b)
+            coordinate change from chart (M, (a, b)) to chart (M, (T, X))
+            sage: g = M.scalar_field(x^2 - t^2, chart=o1)
+            sage: g.function_chart(o3)
+            -4*a*b
+            sage: (o3, o1) in M._coord_changes  # the composed change of coordinates is stored
+            True
+
         """
         if isinstance(self, ZeroScalarField):
             # to ensure that the ZeroScalarField version is called in case
@@ -642,6 +699,17 @@ class ScalarField(CommutativeAlgebraElement):
             if chart not in self._domain._atlas:
                 raise TypeError("The " + str(chart) + " has not " + \
                       " been defined on the domain " + str(self._domain))
+        if self._restriction_source is not None:
+            # Restriction view: the expression is taken from the source 
+            # scalar field, without any copy of the other expressions:
+            express = self._express_dict
+            if chart in express:
+                return express[chart]
+            for known_chart, funct in \
+                            self._restriction_source._express.iteritems():
+                if chart in known_chart._subcharts:
+                    express[chart] = FunctionChart(chart, funct._express)
+                    return express[chart]
         if chart not in self._express:
             # Check whether chart corresponds to a subchart of a chart
             # where the expression of self is known:
@@ -669,6 +737,24 @@ class ScalarField(CommutativeAlgebraElement):
                             break
                     if found:
                         break
+                if not found:
+                    # Search for a chain of changes of coordinates, the 
+                    # composition of which is stored in 
+                    # self._domain._coord_changes:
+                    known = {}
+                    for kchart in known_express:
+                        for skchart in kchart._subcharts:
+                            known[skchart] = kchart
+                    path = self._domain._coord_change_route([chart], 
+                                                            known.keys())
+                    if path:
+                        change = self._domain._compose_coord_changes(path)
+                        from_chart = change._chart2
+                        if from_chart not in self._express:
+                            kchart = known[from_chart]
+                            self._express[from_chart] = FunctionChart(
+                                      from_chart, self._express[kchart].expr())
+                        found = True
                 if not found:
                     raise ValueError("No starting chart could be found to " + 
                            "compute the expression in the " + str(chart))
@@ -677,8 +763,8 @@ class ScalarField(CommutativeAlgebraElement):
             coords = [ change._transf._functions[i]._express 
                        for i in range(self._manifold._dim) ]
             new_expr = self._express[from_chart](*coords)
-            self._express[chart] = FunctionChart(chart, new_expr)
             self._del_derived()
+            self._express[chart] = FunctionChart(chart, new_expr)
         return self._express[chart]
 
 
@@ -770,9 +856,9 @@ class ScalarField(CommutativeAlgebraElement):
         """
         if chart is None:
             chart = self._domain._def_chart
+        self._del_derived()
         self._express.clear()
         self._express[chart] = FunctionChart(chart, coord_expression)
-        self._del_derived()
 
     def add_expr(self, coord_expression, chart=None):
         r"""
@@ -814,8 +900,8 @@ class ScalarField(CommutativeAlgebraElement):
         """
         if chart is None:
             chart = self._domain._def_chart
-        self._express[chart] = FunctionChart(chart, coord_expression)
         self._del_derived()
+        self._express[chart] = FunctionChart(chart, coord_expression)
 
     def add_expr_by_continuation(self, chart, subdomain):
         r"""
@@ -881,8 +967,122 @@ class ScalarField(CommutativeAlgebraElement):
             raise ValueError("The chart is not defined on a subdomain of " + 
                              "the scalar field domain.")
         schart = chart.restrict(subdomain)
-        self._express[chart] = FunctionChart(chart, self.expr(schart))
+        new_expr = self.expr(schart)
         self._del_derived()
+        self._express[chart] = FunctionChart(chart, new_expr)
+
+    def extend_to_atlas(self):
+        r"""
+        Set the coordinate expressions of the scalar field in all the charts
+        of its domain, by continuation of the known expressions.
+        
+        This performs in one call the continuations that 
+        :meth:`add_expr_by_continuation` would perform chart by chart: the 
+        charts that can be reached from the charts of the known 
+        expressions via the transition maps on the chart overlaps are 
+        determined first; the corresponding substitutions are then 
+        performed in batches (each batch gathering the charts reached from 
+        the charts of the previous batches), possibly in parallel (cf. 
+        :meth:`~sage.geometry.manifolds.manifold.Manifold.set_parallel`). 
+
+        OUTPUT:
+
+        - list of the charts of the domain's atlas (except for the 
+          restrictions of other charts) in which no coordinate expression 
+          could be set; this list is empty if the scalar field has 
+          been extended to the whole atlas
+
+        EXAMPLE:
+
+        Scalar field on the sphere `S^2`, initially defined in terms of
+        the stereographic coordinates from the North pole::
+
+            sage: M = Manifold(2, 'S^2')
+            sage: U = M.open_domain('U') ; V = M.open_domain('V') # the complement of resp. N pole and S pole
+            sage: M.declare_union(U,V)   # S^2 is the union of U and V
+            sage: c_xy.<x,y> = U.chart() ; c_uv.<u,v> = V.chart() # stereographic coordinates
+            sage: xy_to_uv = c_xy.transition_map(c_uv, (x/(x^2+y^2), y/(x^2+y^2)), \
+                                             intersection_name='W', restrictions1= x^2+y^2!=0, \
+                                             restrictions2= u^2+v^2!=0)
+            sage: uv_to_xy = xy_to_uv.inverse()
+            sage: f = M.scalar_field(atan(x^2+y^2), chart=c_xy, name='f')
+            sage: f.extend_to_atlas()
+            []
+            sage: f.view()
+            f: S^2 --> R
+            on U: (x, y) |--> arctan(x^2 + y^2)
+            on V: (u, v) |--> arctan(1/(u^2 + v^2))
+
+        A chart that does not overlap the charts of the known expressions is
+        reported::
+
+            sage: A = M.open_domain('A')
+            sage: c_ab.<a,b> = A.chart()
+            sage: f.extend_to_atlas()
+            [chart (A, (a, b))]
+
+        """
+        from utilities import compute_components
+        if isinstance(self, ZeroScalarField):
+            return []
+        dom = self._domain
+        self._del_derived()
+        express = self._express
+        # Charts in which the expression of self is known or can be obtained
+        # by restriction, with the chart of the known expression: 
+        known = {}
+        for chart in express:
+            for schart in chart._subcharts:
+                known[schart] = chart
+        targets = [chart for chart in dom._top_charts if chart not in known]
+        # Transition maps from the subcharts of each target chart:
+        transitions = dict([(chart, []) for chart in targets])
+        for chart_pair, change in dom._coord_changes.iteritems():
+            for chart in chart_pair[0]._supercharts:
+                if chart in transitions:
+                    transitions[chart].append((chart_pair[1], change))
+        nproc = self._manifold._nproc
+        while targets:
+            # Planning of the next batch of continuations; each of them is
+            # described by (target chart, transition map, chart of the known
+            # expression), the transition map being None if the expression
+            # is known in a subchart of the target chart:
+            batch = []
+            for chart in targets:
+                for schart in chart._subcharts:
+                    if schart in known:
+                        batch.append((chart, None, known[schart]))
+                        break
+                else:
+                    for chart2, change in transitions[chart]:
+                        if chart2 in known:
+                            batch.append((chart, change, known[chart2]))
+                            break
+            if not batch:
+                break
+            def continuation(i):
+                chart, change, kchart = batch[i]
+                funct = express[kchart]
+                if change is None:
+                    expr = funct._express
+                else:
+                    # old coordinates expressed in terms of the new ones:
+                    coords = [func._express for func in change._transf._functions]
+                    expr = funct(*coords)
+                return ScalarField(dom, coord_expression={chart: expr})
+            # The substitutions are possibly performed in parallel:
+            for i, value in compute_components(continuation, 
+                                               range(len(batch)), dom, 
+                                               nproc=nproc):
+                chart = batch[i][0]
+                if chart in value._express:
+                    express[chart] = value._express[chart]
+                else: # vanishing expression
+                    express[chart] = chart._zero_function
+                for schart in chart._subcharts:
+                    known[schart] = chart
+            targets = [chart for chart in targets if chart not in express]
+        return targets
 
     def _display_expression(self, chart, result):
         r"""
@@ -1012,6 +1212,40 @@ class ScalarField(CommutativeAlgebraElement):
             sage: f_U.restrict(U) is f_U
             True
 
+        The restriction is a view of the original scalar field: the 
+        coordinate expressions of the latter are not copied until the 
+        restriction is modified or involved in some computation. The 
+        restriction of such a view is taken directly from the original 
+        scalar field, whatever the depth of the chain of subdomains::
+
+            sage: V = U.open_domain('V')
+            sage: X_V = X_U.restrict(V, x>0)
+            sage: h = M.scalar_field(x+y, name='h')
+            sage: h_V = h.restrict(U).restrict(V)
+            sage: h_V._restriction_source is h
+            True
+            sage: h_V.expr()
+            x + y
+            sage: h_V.set_expr(x-y)  # the view becomes an independent field
+            sage: h_V._restriction_source is None
+            True
+            sage: h_V.expr()
+            x - y
+            sage: h.expr()
+            x + y
+
+        A modification of the original scalar field is not reflected in its
+        restriction views::
+
+            sage: h_U = h.restrict(U)
+            sage: h.set_expr(x-y)
+            sage: h_U.expr()
+            x + y
+            sage: h_U = h.restrict(U)
+            sage: h.add_expr(2*x)
+            sage: h_U.expr()
+            x - y
+
         """
         if subdomain == self._domain:
             return self
@@ -1020,19 +1254,56 @@ class ScalarField(CommutativeAlgebraElement):
                 raise ValueError("The specified domain is not a subdomain " + 
                                  "of the domain of definition of the scalar " + 
                                  "field.")
-            # First one tries to get the restriction from a tighter domain:
+            source = self._restriction_source
+            if source is not None:
+                # self is a restriction view: the restriction is taken 
+                # directly from the source scalar field
+                self._restrictions[subdomain] = source.restrict(subdomain)
+                return self._restrictions[subdomain]
+            # First one tries to get the restriction from a tighter domain
+            # (the views of self being skipped, since they do not provide 
+            # any information beyond self):
             for dom, rst in self._restrictions.iteritems():
-                if subdomain.is_subdomain(dom):
+                if subdomain.is_subdomain(dom) and \
+                                         rst._restriction_source is not self:
                     self._restrictions[subdomain] = rst.restrict(subdomain)
                     break
             else:
-            # If this fails, the restriction is obtained via coercion
-                resu = subdomain.scalar_field_algebra()(self)
-                resu._name = self._name
-                resu._latex_name = self._latex_name
-                self._restrictions[subdomain] = resu
+            # If this fails, the restriction is a view of self
+                self._restrictions[subdomain] = \
+                                            self._restriction_view(subdomain)
         return self._restrictions[subdomain]
 
+    def _restriction_view(self, subdomain):
+        r"""
+        Construct a restriction of ``self`` to ``subdomain`` that shares the
+        coordinate expressions of ``self``.
+
+        The coordinate expressions of the restriction in the subcharts of the
+        charts of ``self`` are created one by one, when required by 
+        :meth:`function_chart`; they are all created as soon as the 
+        dictionary of expressions of the restriction is accessed directly 
+        (e.g. in arithmetic operations or when the restriction is modified), 
+        the restriction becoming then independent from ``self``.
+
+        INPUT:
+
+        - ``subdomain`` -- the subdomain (instance of
+          :class:`~sage.geometry.manifolds.domain.OpenDomain`)
+
+        OUTPUT:
+
+        - instance of :class:`ScalarField`
+
+        """
+        if self.is_zero():
+            return subdomain._zero_scalar_field
+        resu = subdomain.scalar_field_algebra().element_class(subdomain,
+                                                  name=self._name, 
+                                                  latex_name=self._latex_name)
+        resu._restriction_source = self
+        return resu
+
     def common_charts(self, other):
         r"""
         Find common charts for the expressions of ``self`` and ``other``. 
@@ -1640,20 +1911,7 @@ class ScalarField(CommutativeAlgebraElement):
             True
         
         """
-        from utilities import format_unop_txt, format_unop_latex
-        eps = metric.volume_form()
-        dom_resu = self._domain.intersection(eps._domain) # result domain
-        resu = self.restrict(dom_resu) * eps.restrict(dom_resu)
-        if self._name is None:
-            resu_name = None
-        else:
-            resu_name = format_unop_txt('*', self._name)
-        if self._latex_name is None:
-            resu_latex_name = None
-        else:
-            resu_latex_name = format_unop_latex(r'\star ', self._latex_name)
-        resu.set_name(name=resu_name, latex_name=resu_latex_name)
-        return resu
+        return metric.hodge_operator()(self)
 
 
 #******************************************************************************
@@ -170,13 +170,24 @@ class Submanifold(Manifold):
            in terms of which the embedding is defined; if none is provided, the 
            ambient manifold default chart is assumed. 
          - ``**kwds`` -- (default: None) keywords passed to Sage graphic 
-           routines
+           routines; the keyword ``plot_points`` sets the number of points 
+           along the curve (default: 400) or, for a surface, the number of 
+           points along each of the two coordinates, either as a single 
+           integer or as a pair of integers (default: 40); a surface is thus 
+           drawn on a grid of ``plot_points[0]`` times ``plot_points[1]`` 
+           points
            
         OUTPUT:
         
           - Graphics3d object (ambient manifold = `\RR^3`) or Graphics object
             (ambient manifold = `\RR^2`)
 
+        The points where the embedding is not defined are skipped: a curve in
+        `\RR^2` is a single line primitive interrupted at these points, while 
+        a curve in `\RR^3` is made of one line per portion of at least 2 
+        points, and the faces of a surface having a vertex at such a point
+        are removed.
+
         EXAMPLES:
 
         Plot of a torus embedded in `\RR^3`::
@@ -189,6 +200,14 @@ class Submanifold(Manifold):
             sage: T.def_embedding(T.diff_mapping(M, [(2+cos(u))*cos(v),(2+cos(u))*sin(v),sin(u)]))
             sage: T.plot([(0,2*pi), (0,2*pi)], aspect_ratio=1)
 
+        The grid of the surface is set by ``plot_points``::
+
+            sage: g = T.plot([(0,2*pi), (0,2*pi)], plot_points=(60,30))
+            sage: len(g.vertex_list())
+            1800
+            sage: len(g.face_list())
+            1711
+
         Plot of a helix embedded in `\RR^3`::
             
             sage: H = M.submanifold(1, 'H')
@@ -206,7 +225,11 @@ class Submanifold(Manifold):
             sage: S.plot([0,40])
 
         """
-        from sage.plot.plot import parametric_plot
+        import numpy
+        from sage.plot.graphics import Graphics
+        from sage.plot.line import line
+        from sage.plot.plot3d.index_face_set import IndexFaceSet
+        from utilities import valid_runs
         if local_chart is None:
             local_chart = self._def_chart
         if ambient_chart is None:
@@ -214,17 +237,64 @@ class Submanifold(Manifold):
         if self._dim > 2:
             raise ValueError("The dimension must be at most 2 " + 
                              "for plotting.")
-        coord_functions = \
-          self._embedding._coord_expression[(local_chart, ambient_chart)]._functions
-        coord_express = [coord_functions[i]._express for i in 
-                                             range(self._ambient_manifold._dim)]
+        # The embedding is compiled once and evaluated on the whole grid 
+        # of coordinate values at once:
+        functions = self._embedding._coord_expression[(local_chart, 
+                                      ambient_chart)].numerical_functions()
         if self._dim == 1:
-            urange = (local_chart._xx[0], coord_ranges[0], coord_ranges[1])
-            graph = parametric_plot(coord_express, urange, **kwds)
+            plot_points = kwds.pop('plot_points', 400)
+            uu = numpy.linspace(float(coord_ranges[0]), float(coord_ranges[1]),
+                                plot_points)
+            yy = [funct(uu) for funct in functions]
+            valid = numpy.ones(uu.shape, dtype=bool)
+            for y in yy:
+                valid &= numpy.isfinite(y)
+            # the curve is split at the points where it is not defined:
+            runs = valid_runs(valid)
+            if len(functions) == 2:
+                # single 2D line, the portions of the curve being separated
+                # by NaN values (never the first one, so that the bounding 
+                # box is not altered):
+                points = []
+                for start, stop in runs:
+                    if points:
+                        points.append((numpy.nan, numpy.nan))
+                    points.extend(zip(*[y[start:stop] for y in yy]))
+                graph = line(points, **kwds) if points else Graphics()
+            else:
+                # a 3D line is a single polyline, which cannot be interrupted
+                # and requires at least 2 points:
+                graph = Graphics()
+                for start, stop in runs:
+                    if stop - start > 1:
+                        graph += line(zip(*[y[start:stop] for y in yy]), 
+                                      **kwds)
         else:   # self._dim = 2
-            urange = (local_chart._xx[0], coord_ranges[0][0], coord_ranges[0][1])
-            vrange = (local_chart._xx[1], coord_ranges[1][0], coord_ranges[1][1])
-            graph = parametric_plot(coord_express, urange, vrange, **kwds)
+            if len(functions) != 3:
+                raise ValueError("The ambient manifold must be of " + 
+                                 "dimension 3 to plot a surface.")
+            plot_points = kwds.pop('plot_points', 40)
+            if not isinstance(plot_points, (list, tuple)):
+                plot_points = (plot_points, plot_points)
+            uu = numpy.linspace(float(coord_ranges[0][0]), 
+                                float(coord_ranges[0][1]), plot_points[0])
+            vv = numpy.linspace(float(coord_ranges[1][0]), 
+                                float(coord_ranges[1][1]), plot_points[1])
+            uu, vv = numpy.meshgrid(uu, vv, indexing='ij')
+            yy = [funct(uu, vv).ravel() for funct in functions]
+            valid = numpy.ones(yy[0].shape, dtype=bool)
+            for y in yy:
+                valid &= numpy.isfinite(y)
+            # quadrilateral faces of the mesh, the faces having a vertex 
+            # where the embedding is not defined being removed:
+            ind = numpy.arange(uu.size).reshape(uu.shape)
+            faces = numpy.array([ind[:-1,:-1].ravel(), ind[:-1,1:].ravel(), 
+                                 ind[1:,1:].ravel(), ind[1:,:-1].ravel()]).T
+            faces = faces[valid[faces].all(axis=1)]
+            new_ind = numpy.cumsum(valid) - 1
+            points = numpy.array(yy).T[valid]
+            graph = IndexFaceSet(new_ind[faces].tolist(), points.tolist(), 
+                                 **kwds)
         return graph
 
     def pushforward(self, tensor):
@@ -323,7 +393,7 @@ class Submanifold(Manifold):
         if chart2 is None:
             # It is not possible to have def_chart2 as chart for 
             # expressing the result; any other chart is then looked for:
-            for (chart1n, chart2n) in self._coord_expression:
+            for (chart1n, chart2n) in embed._coord_expression:
                 if chart1n._frame in tensor._components:
                     chart1 = chart1n
                     chart2 = chart2n
@@ -353,20 +423,221 @@ class Submanifold(Manifold):
         else:
             ptcomp = Components(ring2, frame2, ncon, start_index=si2, 
                                 output_formatter=of2)
-        phi = embed._coord_expression[(chart1, chart2)]
-        jacob = phi.jacobian()
-        # X2 coordinates expressed in terms of X1 ones via the mapping:
-        # coord2_1 = phi(*(chart1._xx)) 
-        si1 = self._sindex
-        si2 = self._ambient_manifold._sindex
-        for ind_new in ptcomp.non_redundant_index_generator(): 
-            res = 0 
-            for ind_old in self.index_generator(ncon): 
-                t = tcomp[[ind_old]].function_chart(chart1)
-                for i in range(ncon):
-                    t *= jacob[ind_new[i]-si2][ind_old[i]-si1]
-                res += t
-            ptcomp[ind_new] = res
+        # The Jacobian matrix of the embedding is taken from the pullback 
+        # data stored in the embedding, which are thus shared by all the
+        # pushforwards and pullbacks:
+        column = embed._get_pullback_data(chart1, 
+                                          chart2)['pushforward_column']
+        # Components of the tensor as functions of the X1 coordinates:
+        tcomp_1 = tcomp._new_instance()
+        for ind, val in tcomp._comp.iteritems():
+            tcomp_1._comp[ind] = val.function_chart(chart1)
+        # Contraction with the Jacobian matrix, one slot at a time:
+        tcomp_1._slot_transform([column]*ncon, ptcomp)
         resu = fmodule2.tensor_from_comp((ncon, 0), ptcomp, name=resu_name, 
                                          latex_name=resu_latex_name)
         return resu
+
+    def pushforwards(self, tensors):
+        r""" 
+        Pushforward of several tensor fields by the embedding. 
+
+        This is equivalent to applying :meth:`pushforward` to each tensor 
+        field, the Jacobian matrix of the embedding being computed only once
+        for all the tensor fields.
+
+        INPUT:
+        
+        - ``tensors`` -- list (or tuple) of fully contravariant tensor fields
+          on the submanifold
+          
+        OUTPUT:
+        
+        - list of the pushforwards of the elements of ``tensors``
+
+        EXAMPLE:
+
+        Pushforward of the coordinate frame of `S^2` to `\RR^3`::
+
+            sage: M = Manifold(3, 'R^3', r'\RR^3', start_index=1)
+            sage: c_cart.<x,y,z> = M.chart() # Cartesian coordinates on R^3
+            sage: S = M.submanifold(2, 'S^2', start_index=1)
+            sage: U = S.open_domain('U') # U = S minus two poles
+            sage: c_spher.<th,ph> = U.chart(r'th:(0,pi):\theta ph:(0,2*pi):\phi') # spherical coordinates on U
+            sage: S.def_embedding( S.diff_mapping(M, [sin(th)*cos(ph), sin(th)*sin(ph), cos(th)], name='i', latex_name=r'\iota') )
+            sage: e = c_spher.frame()
+            sage: ie1, ie2 = S.pushforwards([e[1], e[2]])
+            sage: ie1.view()
+            i_*(d/dth) = cos(ph)*cos(th) d/dx + cos(th)*sin(ph) d/dy - sin(th) d/dz
+            sage: ie2.view()
+            i_*(d/dph) = -sin(ph)*sin(th) d/dx + cos(ph)*sin(th) d/dy
+
+        """
+        return [self.pushforward(tensor) for tensor in tensors]
+
+    def induced_geometry(self, metric, normal_norm=1):
+        r"""
+        Induced metric, second fundamental form and mean curvature of a 
+        hypersurface.
+
+        The three quantities are computed together, from the Jacobian matrix 
+        of the embedding `\iota` and the coordinate expressions of the 
+        metric `g` and of its Christoffel symbols composed with `\iota`, 
+        which are computed only once. Denoting by `(x^a)` the coordinates on
+        the submanifold, by `(y^\mu)` those on the ambient manifold and by 
+        `n` the unit normal 1-form, the second fundamental form is
+
+        .. MATH::
+
+            K_{ab} = n_\mu \left( \frac{\partial^2 y^\mu}{\partial x^a 
+                \partial x^b} + \Gamma^\mu_{\ \, \nu\rho} 
+                \frac{\partial y^\nu}{\partial x^a} 
+                \frac{\partial y^\rho}{\partial x^b} \right)
+
+        and the mean curvature is `H = h^{ab} K_{ab}`, `h` being the induced
+        metric. The normal `n` is oriented such that 
+        `n_\mu \propto \det(e_\mu, \partial y/\partial x^1, \ldots, 
+        \partial y/\partial x^{n-1})`, `e_\mu` being the `\mu`-th element
+        of the canonical basis of `\RR^n`. 
+
+        INPUT:
+
+        - ``metric`` -- the metric `g` of the ambient manifold (instance of
+          :class:`~sage.geometry.manifolds.metric.Metric`)
+        - ``normal_norm`` -- (default: 1) the value of `g(n,n)`, i.e. 1 for a
+          hypersurface with a spacelike normal and -1 for a hypersurface 
+          with a timelike normal (e.g. a spacelike hypersurface of a 
+          Lorentzian manifold)
+
+        OUTPUT:
+
+        - triple `(h, K, H)`, where `h` is the induced metric, `K` the 
+          second fundamental form and `H` the mean curvature, all defined 
+          on the domain of a chart of the submanifold
+
+        EXAMPLE:
+
+        A cylinder in the Euclidean space `\RR^3`::
+
+            sage: M = Manifold(3, 'R^3', r'\RR^3', start_index=1)
+            sage: c_cart.<x,y,z> = M.chart() # Cartesian coordinates on R^3
+            sage: g = M.metric('g')
+            sage: g[1,1], g[2,2], g[3,3] = 1, 1, 1
+            sage: C = M.submanifold(2, 'C', start_index=1)
+            sage: c_cyl.<ph,t> = C.chart(r'ph:(0,2*pi):\phi t')
+            sage: C.def_embedding( C.diff_mapping(M, [cos(ph), sin(ph), t], name='i') )
+            sage: h, K, H = C.induced_geometry(g)
+            sage: h.view()
+            i_*(g) = dph*dph + dt*dt
+            sage: K.view()
+            K = -dph*dph
+            sage: H.view()
+            H: C --> R
+               (ph, t) |--> -1
+
+        """
+        from sage.matrix.constructor import matrix
+        from sage.functions.other import sqrt
+        from sage.symbolic.ring import SR
+        from sage.tensor.modules.comp import CompFullySym
+        from chart import FunctionChart
+        from utilities import simple_determinant, simplify_chain
+        embed = self._embedding
+        if embed is None:
+            raise ValueError("The embedding of the " + str(self) + 
+                             " has not been defined.")
+        n1 = self._dim
+        n2 = self._ambient_manifold._dim
+        if n2 - n1 != 1:
+            raise NotImplementedError("The second fundamental form is " + 
+                                      "implemented only for hypersurfaces.")
+        # A pair of charts (chart1, chart2) for the computation is chosen, 
+        # privileging the default charts:
+        dom = embed._domain
+        def_chart2 = embed._codomain._def_chart 
+        if (dom._def_chart, def_chart2) in embed._coord_expression:
+            chart1 = dom._def_chart
+            chart2 = def_chart2
+        else:
+            (chart1, chart2) = embed._coord_expression.keys()[0]
+        dom1 = chart1._domain
+        frame1 = chart1._frame
+        frame2 = chart2._frame
+        si1 = self._sindex
+        si2 = self._ambient_manifold._sindex
+        # Data shared by all the quantities:
+        data = embed._get_pullback_data(chart1, chart2)
+        jacob = data['jacobian']
+        column = data['column']
+        def subs(field):
+            # scalar field on the ambient manifold as a function of the 
+            # coordinates of chart1:
+            return embed._substitute(chart1, chart2, 
+                                     field.function_chart(chart2))
+        # 1/ Induced metric:
+        if embed._name is not None and metric._name is not None:
+            h_name = embed._name + '_*(' + metric._name + ')'
+        else:
+            h_name = 'h'
+        if embed._latex_name is not None and metric._latex_name is not None:
+            h_latex_name = embed._latex_name + '_*' + metric._latex_name
+        else:
+            h_latex_name = None
+        h = dom1.metric(h_name, signature=metric._signature - normal_norm, 
+                        latex_name=h_latex_name)
+        gcomp = metric.comp(frame2)
+        gcomp_1 = gcomp._new_instance()
+        for ind, val in gcomp._comp.iteritems():
+            gcomp_1._comp[ind] = subs(val)
+        gcomp_1._slot_transform([column, column], h.add_comp(frame1))
+        # 2/ Unit normal 1-form, from the cofactors of the Jacobian matrix:
+        normal = []
+        for mu in range(n2):
+            minor = matrix([[jacob[nu][a]._express for a in range(n1)] 
+                            for nu in range(n2) if nu != mu])
+            normal.append((-1)**mu * simple_determinant(minor))
+        norm2 = SR(0)
+        for ind, val in metric.inverse().comp(frame2)._full_comp().iteritems():
+            norm2 += subs(val)._express * normal[ind[0]-si2] * \
+                     normal[ind[1]-si2]
+        norm = simplify_chain(sqrt(normal_norm * norm2))
+        normal = [simplify_chain(nmu / norm) for nmu in normal]
+        # 3/ Second fundamental form; first the Christoffel symbol part, 
+        # computed as the pullback of n_mu Gamma^mu_{nu rho}:
+        fmodule1 = dom1.vector_field_module()
+        ring1 = fmodule1._ring
+        gam_n = CompFullySym(ring1, frame2, 2, start_index=si2)
+        for ind, val in metric.christoffel_symbols(chart2)._comp.iteritems():
+            nmu = normal[ind[0]-si2]
+            if nmu.is_zero():
+                continue
+            term = FunctionChart(chart1, nmu * subs(val)._express)
+            ind_s = ind[1:]  # ordered, owing to the symmetry of Gamma
+            if ind_s in gam_n._comp:
+                gam_n._comp[ind_s] = gam_n._comp[ind_s] + term
+            else:
+                gam_n._comp[ind_s] = term
+        kgam = CompFullySym(ring1, frame1, 2, start_index=si1, 
+                            output_formatter=fmodule1._output_formatter)
+        gam_n._slot_transform([column, column], kgam)
+        # then the second derivatives of the embedding:
+        K = dom1.sym_bilin_form_field(name='K', latex_name='K')
+        kcomp = K.add_comp(frame1)
+        for a in range(n1):
+            for b in range(a, n1):
+                expr = SR(0)
+                for mu in range(n2):
+                    expr += normal[mu] * jacob[mu][b].diff(a+si1)._express
+                expr = simplify_chain(expr)
+                kcomp[a+si1, b+si1] = kgam[[a+si1, b+si1]] + \
+                                      FunctionChart(chart1, expr).scalar_field()
+        # 4/ Mean curvature:
+        kfull = kcomp._full_comp()
+        expr = SR(0)
+        for ind, val in h.inverse().comp(frame1)._full_comp().iteritems():
+            if ind in kfull:
+                expr += val.function_chart(chart1)._express * \
+                        kfull[ind].function_chart(chart1)._express
+        H = dom1.scalar_field(simplify_chain(expr), chart=chart1, name='H', 
+                              latex_name='H')
+        return (h, K, H)
@@ -306,6 +306,7 @@ as follows::
 #******************************************************************************
 
 from sage.rings.integer import Integer
+from sage.structure.sage_object import SageObject
 from sage.structure.element import ModuleElement  
 from sage.tensor.modules.free_module_tensor import FreeModuleTensor
 from sage.tensor.modules.tensor_with_indices import TensorWithIndices
@@ -1031,6 +1032,109 @@ class TensorField(ModuleElement):
         resu = self.add_comp(frame) # _del_derived is performed here
         for ind in resu.non_redundant_index_generator():
             resu[[ind]] = dom.scalar_field({chart: scomp[[ind]].expr(schart)})
+
+    def _known_frames(self):
+        r"""
+        Return the set of vector frames in which some components of 
+        ``self`` are stored (in ``self`` or in its restrictions to 
+        subdomains).
+        """
+        frames = set()
+        for rst in self._restrictions.itervalues():
+            frames.update(rst._known_frames())
+        return frames
+
+    def extend_to_atlas(self):
+        r"""
+        Set the components of the tensor field in the coordinate frames of 
+        all the charts of its domain, by continuation of the known 
+        components. 
+
+        This performs in one call the continuations that 
+        :meth:`add_comp_by_continuation` would perform frame by frame: 
+        the coordinate frames that can be reached from the frames of the 
+        known components via the transition maps on the chart overlaps 
+        are determined batch by batch (each batch gathering the frames 
+        reached from the frames of the previous batches); the 
+        coordinate substitutions on the components are possibly performed 
+        in parallel (cf. 
+        :meth:`~sage.geometry.manifolds.manifold.Manifold.set_parallel`). 
+
+        OUTPUT:
+
+        - list of the charts of the domain's atlas (except for the 
+          restrictions of other charts) for which no components could 
+          be set in the coordinate frame; this list is empty if the tensor 
+          field has been extended to the whole atlas
+
+        EXAMPLE:
+
+        Vector field on the sphere `S^2`, initially defined by its 
+        components in the stereographic frame associated with the North 
+        pole::
+
+            sage: Manifold._clear_cache_() # for doctests only
+            sage: M = Manifold(2, 'S^2', start_index=1)
+            sage: U = M.open_domain('U') ; V = M.open_domain('V')
+            sage: M.declare_union(U,V)   # S^2 is the union of U and V
+            sage: c_xy.<x,y> = U.chart() ; c_uv.<u,v> = V.chart() # stereographic coordinates
+            sage: transf = c_xy.transition_map(c_uv, (x/(x^2+y^2), y/(x^2+y^2)), intersection_name='W', restrictions1= x^2+y^2!=0, restrictions2= u^2+v^2!=0)
+            sage: inv = transf.inverse()
+            sage: eU = c_xy.frame() ; eV = c_uv.frame()
+            sage: a = M.vector_field('a')
+            sage: a[eU,:] = [x, 2+y]
+            sage: a.extend_to_atlas()
+            []
+            sage: a.view(eV)
+            a = (-4*u*v - u) d/du + (2*u^2 - 2*v^2 - v) d/dv
+
+        """
+        from utilities import compute_components
+        manif = self._domain._manifold
+        dom0 = self._domain
+        nproc = manif._nproc
+        while True:
+            known = self._known_frames()
+            targets = []
+            for chart in dom0._top_charts:
+                frame = chart._frame
+                for kframe in known:
+                    if frame in kframe._subframes:
+                        break
+                else:
+                    targets.append(chart)
+            if not targets:
+                break
+            # Planning of the next batch of continuations; each of them is 
+            # described by (target chart, subchart on the overlap with a 
+            # chart of known components):
+            batch = []
+            for chart in targets:
+                for chart_pair in dom0._coord_changes:
+                    schart = chart_pair[0]
+                    if schart is chart or schart not in chart._subcharts:
+                        continue
+                    for kframe in known:
+                        if chart_pair[1]._frame in kframe._subframes:
+                            batch.append((chart, schart))
+                            break
+                    else:
+                        continue
+                    break
+            if not batch:
+                break
+            for chart, schart in batch:
+                dom = chart._domain
+                scomp = self.comp(schart._frame)
+                resu = self.add_comp(chart._frame) # _del_derived is performed here
+                indices = list(resu.non_redundant_index_generator())
+                def continuation(ind):
+                    return dom.scalar_field({chart: scomp[[ind]].expr(schart)})
+                # The substitutions are possibly performed in parallel:
+                for ind, value in compute_components(continuation, indices, 
+                                                     dom, nproc=nproc):
+                    resu[[ind]] = value
+        return targets
         
     def comp(self, basis=None, from_basis=None):
         r"""
@@ -2710,6 +2814,9 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
         #     being self._components, which is initialized by 
         #     FreeModuleTensor.__init__ ); accordingly self._restrictions is
         #     initialized by _init_derived() and cleared by _del_derived(). 
+        self._restriction_source = None # tensor field of which self is a 
+                                        # restriction view (cf. method 
+                                        # restrict())
         # Initialization of derived quantities:
         self._init_derived() 
 
@@ -2728,6 +2835,17 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
         return self.__class__(self._fmodule, self._tensor_type, sym=self._sym, 
                                 antisym=self._antisym)
 
+    def _known_frames(self):
+        r"""
+        Return the set of vector frames in which some components of 
+        ``self`` are stored (in ``self`` or in its restrictions to 
+        subdomains).
+        """
+        frames = set(self._components)
+        for rst in self._restrictions.itervalues():
+            frames.update(rst._known_frames())
+        return frames
+
     def _init_derived(self):
         r"""
         Initialize the derived quantities
@@ -2736,6 +2854,7 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
         TensorField._init_derived(self)
         self._restrictions = {} # dict. of restrictions of self on subdomains  
                                 # of self._domain, with the subdomains as keys
+        self._lie_der_operator = None # Lie derivative operator (not set yet)
 
     def _del_derived(self, del_restrictions=True):
         r"""
@@ -2749,8 +2868,19 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
         """
         FreeModuleTensor._del_derived(self) 
         TensorField._del_derived(self)
+        if self._lie_der_operator is not None:
+            # the operator may be held by the user: it is kept, but the 
+            # data derived from the former components are deleted
+            self._lie_der_operator._frame_data.clear()
         if del_restrictions:
+            # The restriction views of self become independent tensor fields,
+            # since they must not be derived from self anymore:
+            for rst in self._restrictions.itervalues():
+                if rst._restriction_source is self:
+                    rst._restriction_source = None
             self._restrictions.clear()
+        # self is modified, hence it is no longer a restriction view:
+        self._restriction_source = None
         
     def set_comp(self, basis=None):
         r"""
@@ -3040,50 +3170,53 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
             True
         
         """
-        if vector._tensor_type != (1,0):
-            raise TypeError("The argument must be a vector field.")
-        if id(vector) not in self._lie_derivatives:
-            # A new computation must be performed
-            #
-            # 1/ Search for a common coordinate frame:
-            coord_frame = self.common_coord_frame(vector)
-            if coord_frame is None:
-                raise TypeError("No common coordinate frame found.")
-            chart = coord_frame._chart
-            #
-            # 2/ Component computation:
-            tc = self._components[coord_frame]
-            vc = vector._components[coord_frame]
-            # the result has the same tensor type and same symmetries as self:
-            resc = self._new_comp(coord_frame) 
-            n_con = self._tensor_type[0]
-            vf_module = vector._fmodule
-            for ind in resc.non_redundant_index_generator():
-                rsum = 0
-                for i in vf_module.irange():
-                    rsum += vc[[i]].function_chart(chart) * \
-                           tc[[ind]].function_chart(chart).diff(i)
-                # loop on contravariant indices:
-                for k in range(n_con): 
-                    for i in vf_module.irange():
-                        indk = list(ind)
-                        indk[k] = i  
-                        rsum -= tc[[indk]].function_chart(chart) * \
-                                vc[[ind[k]]].function_chart(chart).diff(i)
-                # loop on covariant indices:
-                for k in range(n_con, self._tensor_rank): 
-                    for i in vf_module.irange():
-                        indk = list(ind)
-                        indk[k] = i  
-                        rsum += tc[[indk]].function_chart(chart) * \
-                                vc[[i]].function_chart(chart).diff(ind[k])
-                resc[[ind]] = rsum.scalar_field()
-            #
-            # 3/ Final result (the tensor)
-            res = vf_module.tensor_from_comp(self._tensor_type, resc)
-            self._lie_derivatives[id(vector)] = (vector, res)
-            vector._lie_der_along_self[id(self)] = self
-        return self._lie_derivatives[id(vector)][1]
+        return self.lie_der_operator()(vector)
+
+    def lie_der_operator(self):
+        r"""
+        Return the Lie derivative operator associated with ``self``.
+
+        OUTPUT:
+
+        - instance of :class:`LieDerivativeOperator`, i.e. the operator 
+          `X\mapsto \mathcal{L}_X T`, where `T` is ``self``; it is 
+          computed only once and stores the partial derivatives of the 
+          components of ``self``
+
+        EXAMPLE:
+
+        Killing vectors of the Euclidean plane::
+
+            sage: M = Manifold(2, 'M', start_index=1)
+            sage: c_xy.<x,y> = M.chart()
+            sage: g = M.metric('g')
+            sage: g[1,1], g[2,2] = 1, 1
+            sage: L = g.lie_der_operator() ; L
+            Lie derivative operator associated with the Riemannian metric 'g' on the 2-dimensional manifold 'M'
+            sage: L is g.lie_der_operator()
+            True
+            sage: v = M.vector_field('v')
+            sage: v[:] = (-y, x)   # rotation generator
+            sage: L.is_killing(v)
+            True
+            sage: w = M.vector_field('w')
+            sage: w[:] = (x, y)   # dilation generator
+            sage: L.is_killing(w)
+            False
+
+        The operator remains valid after a modification of the tensor 
+        field::
+
+            sage: g[1,1] = 1 + x^2
+            sage: L is g.lie_der_operator()
+            True
+            sage: L.is_killing(v)
+            False
+
+        """
+        if self._lie_der_operator is None:
+            self._lie_der_operator = LieDerivativeOperator(self)
+        return self._lie_der_operator
 
     def restrict(self, subdomain, dest_map=None):
         r"""
@@ -3139,6 +3272,18 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
             sage: v_D[[1]] == v[[1]]
             False
 
+        The restriction of a restriction is taken directly from the original
+        vector field, the components of the restrictions being views of 
+        the original ones (cf. 
+        :meth:`~sage.geometry.manifolds.scalarfield.ScalarField.restrict`)::
+
+            sage: D1 = D.open_domain('D1')
+            sage: c_cart_D1 = c_cart_D.restrict(D1, x>0)
+            sage: v_D.restrict(D1) is v.restrict(D1)
+            True
+            sage: v.restrict(D1)[[1]]._restriction_source is v[[1]]
+            True
+
         The restriction of the vector field to its own domain is of course 
         itself::
         
@@ -3152,6 +3297,12 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
             if not subdomain.is_subdomain(self._domain):
                 raise ValueError("The provided domain is not a subdomain of " + 
                                  "the current field's domain.")
+            source = self._restriction_source
+            if source is not None and dest_map is None:
+                # self is a restriction view: the restriction is taken 
+                # directly from the source tensor field
+                self._restrictions[subdomain] = source.restrict(subdomain)
+                return self._restrictions[subdomain]
             if dest_map is None:
                 dest_map = self._fmodule._dest_map.restrict(subdomain)
             elif not dest_map._codomain.is_subdomain(self._ambient_domain):
@@ -3170,16 +3321,22 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
                                   antisym=self._antisym, 
                                   specific_type=self.__class__)
             for frame in self._components:
-                for sframe in subdomain._covering_frames:
-                    if sframe in frame._subframes:
-                        comp_store = self._components[frame]._comp
-                        scomp = resu._new_comp(sframe)
-                        scomp_store = scomp._comp
-                        # the components of the restriction are evaluated 
-                        # index by index:
-                        for ind, value in comp_store.iteritems():
-                            scomp_store[ind] = value.restrict(subdomain)
-                        resu._components[sframe] = scomp
+                # the restriction of frame to subdomain, if any, is looked 
+                # for in the dictionary of its restrictions, instead of 
+                # among the frames covering subdomain:
+                if subdomain in frame._restrictions:
+                    sframe = frame._restrictions[subdomain]
+                    comp_store = self._components[frame]._comp
+                    scomp = resu._new_comp(sframe)
+                    scomp_store = scomp._comp
+                    # the components of the restriction are evaluated 
+                    # index by index, as views of the components of self
+                    # (cf. ScalarField.restrict):
+                    for ind, value in comp_store.iteritems():
+                        scomp_store[ind] = value.restrict(subdomain)
+                    resu._components[sframe] = scomp
+            # resu is a view of self until one of them is modified:
+            resu._restriction_source = self
             self._restrictions[subdomain] = resu
         return self._restrictions[subdomain]
 
@@ -3339,20 +3496,312 @@ class TensorFieldParal(FreeModuleTensor, TensorField):
                 comp_resu._comp[ind] = val(point) 
         return resu
 
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
-            
+
+#******************************************************************************
+
+class LieDerivativeOperator(SageObject):
+    r"""
+    Lie derivative operator associated with a tensor field.
+
+    Given a tensor field `T` of type `(k,l)` on a parallelizable domain, 
+    this class implements the operator `X\mapsto \mathcal{L}_X T`, 
+    `X` being a vector field. In a coordinate frame, 
+
+    .. MATH::
+
+        (\mathcal{L}_X T)^{i_1\ldots i_k}_{\ \ \ \ \ \ \ j_1\ldots j_l}
+        = X^m \partial_m T^{i_1\ldots i_k}_{\ \ \ \ \ \ \ j_1\ldots j_l}
+        - \sum_{p=1}^k T^{i_1\ldots m\ldots i_k}_{\ \ \ \ \ \ \ \ \ \ 
+          j_1\ldots j_l} \partial_m X^{i_p}
+        + \sum_{p=1}^l T^{i_1\ldots i_k}_{\ \ \ \ \ \ \ j_1\ldots m
+          \ldots j_l} \partial_{j_p} X^m
+
+    The partial derivatives of the components of `T` are computed once for
+    each coordinate frame and stored in the operator, so that they are
+    shared by the evaluations for different vector fields. Only the 
+    non-redundant components of `\mathcal{L}_X T`, which has the same 
+    symmetries as `T`, are computed, and only the nonzero components of 
+    `T`, of `X` and of the partial derivatives of `X` are involved. 
+
+    The operator is generally obtained by the method 
+    :meth:`TensorFieldParal.lie_der_operator`, which is used by 
+    :meth:`TensorFieldParal.lie_der`. 
+
+    INPUT:
+
+    - ``tensor`` -- the tensor field `T` (instance of 
+      :class:`TensorFieldParal`)
+
+    EXAMPLE:
+
+    Lie derivatives of the Euclidean metric of the plane along several 
+    vector fields::
+
+        sage: M = Manifold(2, 'M', start_index=1)
+        sage: c_xy.<x,y> = M.chart()
+        sage: g = M.metric('g')
+        sage: g[1,1], g[2,2] = 1, 1
+        sage: L = g.lie_der_operator()
+        sage: v = M.vector_field('v')
+        sage: v[:] = (-y, x)
+        sage: w = M.vector_field('w')
+        sage: w[:] = (x, y)
+        sage: lv, lw = L.batch([v, w])
+        sage: lv == 0
+        True
+        sage: lw.view()
+        2 dx*dx + 2 dy*dy
+        sage: lw is g.lie_der(w)  # the results are stored in the tensor field
+        True
+
+    """
+    def __init__(self, tensor):
+        self._tensor = tensor
+        self._frame_data = {} # components of the tensor and their partial
+                              # derivatives (key: coordinate frame)
+
+    def _repr_(self):
+        r"""
+        String representation of the object.
+        """
+        return "Lie derivative operator associated with the " + \
+               str(self._tensor)
+
+    def _common_frame(self, vector):
+        r"""
+        Return a coordinate frame in which the Lie derivative along 
+        ``vector`` is computed.
+        """
+        if vector._tensor_type != (1,0):
+            raise TypeError("The argument must be a vector field.")
+        frame = self._tensor.common_coord_frame(vector)
+        if frame is None:
+            raise TypeError("No common coordinate frame found.")
+        return frame
+
+    def _get_frame_data(self, frame):
+        r"""
+        Return the components of the tensor and their partial derivatives
+        in a given coordinate frame.
+
+        INPUT:
+
+        - ``frame`` -- coordinate frame in which the components of the 
+          tensor are known
+
+        OUTPUT:
+
+        - pair ``(tfunc, dtfunc)``, where ``tfunc`` is the dictionary of 
+          the coordinate expressions of the nonzero components of the 
+          tensor, with all the indices (and not only the non-redundant ones)
+          as keys, and ``dtfunc`` is the dictionary of the lists of the 
+          partial derivatives of the non-redundant nonzero components, with 
+          the indices of the latter as keys 
+
+        """
+        if frame not in self._frame_data:
+            # a new computation is necessary
+            chart = frame._chart
+            tc = self._tensor._components[frame]
+            tfunc = {}
+            for ind, val in tc._full_comp().iteritems():
+                tfunc[ind] = val.function_chart(chart)._express
+            dtfunc = {}
+            for ind, val in tc._comp.iteritems():
+                funct = val.function_chart(chart)
+                dtfunc[ind] = [funct.diff(i)._express 
+                               for i in self._tensor._fmodule.irange()]
+            self._frame_data[frame] = (tfunc, dtfunc)
+        return self._frame_data[frame]
+
+    def _vector_data(self, vector, frame):
+        r"""
+        Return the nonzero components of a vector field and of their 
+        partial derivatives in a given coordinate frame.
+
+        OUTPUT:
+
+        - pair ``(vfunc, dvfunc)``, where ``vfunc`` is the dictionary of 
+          the coordinate expressions of the nonzero components `X^j` and 
+          ``dvfunc[j]`` is the dictionary of the nonzero partial 
+          derivatives `\partial_i X^j` (key: `i`)
+
+        """
+        chart = frame._chart
+        vfunc = {}
+        dvfunc = {}
+        for ind, val in vector.comp(frame)._comp.iteritems():
+            funct = val.function_chart(chart)
+            j = ind[0]
+            vfunc[j] = funct._express
+            dvfunc[j] = {}
+            for i in self._tensor._fmodule.irange():
+                dexpr = funct.diff(i)._express
+                if not dexpr.is_zero():
+                    dvfunc[j][i] = dexpr
+        return (vfunc, dvfunc)
+
+    def _component(self, ind, frame_data, vector_data):
+        r"""
+        Return the coordinate expression of a component of the Lie 
+        derivative.
+
+        INPUT:
+
+        - ``ind`` -- the indices of the component
+        - ``frame_data`` -- data returned by :meth:`_get_frame_data`
+        - ``vector_data`` -- data returned by :meth:`_vector_data`
+
+        OUTPUT:
+
+        - symbolic expression
+
+        """
+        from sage.symbolic.ring import SR
+        from utilities import simplify_chain
+        tfunc, dtfunc = frame_data
+        vfunc, dvfunc = vector_data
+        si = self._tensor._fmodule._sindex
+        n_con = self._tensor._tensor_type[0]
+        rsum = SR(0)
+        # derivative term:
+        if ind in dtfunc:
+            dt = dtfunc[ind]
+            for i, vi in vfunc.iteritems():
+                rsum += vi * dt[i-si]
+        # contravariant indices:
+        for k in range(n_con):
+            for i, dvi in dvfunc.get(ind[k], {}).iteritems():
+                indk = ind[:k] + (i,) + ind[k+1:]
+                if indk in tfunc:
+                    rsum -= tfunc[indk] * dvi
+        # covariant indices:
+        for k in range(n_con, self._tensor._tensor_rank):
+            for i, dv in dvfunc.iteritems():
+                if ind[k] in dv:
+                    indk = ind[:k] + (i,) + ind[k+1:]
+                    if indk in tfunc:
+                        rsum += tfunc[indk] * dv[ind[k]]
+        return simplify_chain(rsum)
+
+    def __call__(self, vector):
+        r"""
+        Lie derivative of the tensor field along a vector field. 
+
+        The result is stored in the tensor field, as for 
+        :meth:`TensorFieldParal.lie_der`.
+
+        INPUT:
+
+        - ``vector`` -- vector field `X`
+
+        OUTPUT:
+
+        - the tensor field `\mathcal{L}_X T`
+
+        EXAMPLE::
+
+            sage: M = Manifold(2, 'M')
+            sage: c_xy.<x,y> = M.chart()
+            sage: om = M.one_form()
+            sage: om[:] = (y, 0)
+            sage: v = M.vector_field()
+            sage: v[:] = (0, x)
+            sage: om.lie_der_operator()(v).view()
+            x dx
+
+        """
+        from chart import FunctionChart
+        tensor = self._tensor
+        if id(vector) not in tensor._lie_derivatives:
+            # A new computation must be performed
+            frame = self._common_frame(vector)
+            chart = frame._chart
+            frame_data = self._get_frame_data(frame)
+            vector_data = self._vector_data(vector, frame)
+            # the result has the same tensor type and same symmetries as 
+            # the tensor:
+            resc = tensor._new_comp(frame) 
+            for ind in resc.non_redundant_index_generator():
+                expr = self._component(ind, frame_data, vector_data)
+                if not expr.is_zero():
+                    resc._comp[ind] = FunctionChart(chart, expr).scalar_field()
+            resu = vector._fmodule.tensor_from_comp(tensor._tensor_type, resc)
+            tensor._lie_derivatives[id(vector)] = (vector, resu)
+            vector._lie_der_along_self[id(tensor)] = tensor
+        return tensor._lie_derivatives[id(vector)][1]
+
+    def batch(self, vectors):
+        r"""
+        Lie derivatives of the tensor field along several vector fields.
+
+        The partial derivatives of the components of the tensor field are 
+        computed once for all the vector fields. 
+
+        INPUT:
+
+        - ``vectors`` -- list (or tuple) of vector fields
+
+        OUTPUT:
+
+        - list of the Lie derivatives of the tensor field along the elements
+          of ``vectors``
+
+        EXAMPLE:
+
+        See :class:`LieDerivativeOperator`. 
+
+        """
+        return [self(vector) for vector in vectors]
+
+    def is_killing(self, vector):
+        r"""
+        Check whether the Lie derivative of the tensor field along a vector 
+        field vanishes.
+
+        For a metric, this amounts to check whether the vector field is a
+        Killing vector. The components of the Lie derivative are computed 
+        one after the other and the computation stops at the first nonzero 
+        one; the Lie derivative is therefore not stored, unless it has 
+        already been computed.
+
+        INPUT:
+
+        - ``vector`` -- vector field `X`
+
+        OUTPUT:
+
+        - True if `\mathcal{L}_X T = 0` and False otherwise
+
+        EXAMPLE:
+
+        Killing vectors of the 2-sphere::
+
+            sage: M = Manifold(2, 'S^2', start_index=1)
+            sage: U = M.open_domain('U')
+            sage: c_spher.<th,ph> = U.chart(r'th:(0,pi):\theta ph:(0,2*pi):\phi')
+            sage: g = U.metric('g')
+            sage: g[1,1], g[2,2] = 1, sin(th)^2
+            sage: L = g.lie_der_operator()
+            sage: v = U.vector_field('v')
+            sage: v[:] = (0, 1)
+            sage: L.is_killing(v)
+            True
+            sage: v[:] = (-sin(ph), -cos(ph)*cos(th)/sin(th))
+            sage: L.is_killing(v)
+            True
+            sage: v[:] = (1, 0)
+            sage: L.is_killing(v)
+            False
+
+        """
+        tensor = self._tensor
+        if id(vector) in tensor._lie_derivatives:
+            return tensor._lie_derivatives[id(vector)][1] == 0
+        frame = self._common_frame(vector)
+        frame_data = self._get_frame_data(frame)
+        vector_data = self._vector_data(vector, frame)
+        for ind in tensor._new_comp(frame).non_redundant_index_generator():
+            if not self._component(ind, frame_data, vector_data).is_zero():
+                return False
+        return True
@@ -422,6 +422,174 @@ def simplify_chain(expr):
     expr = expr.simplify_trig()
     return expr
 
+def compute_components(function, indices, domain, nproc=1):
+    r"""
+    Evaluate a function returning a scalar field for each element of a list
+    of indices, possibly in parallel.
+
+    If ``nproc`` is larger than 1, the list of indices is split into
+    ``nproc`` chunks, which are processed in forked processes by means of
+    Sage's :func:`~sage.parallel.decorate.parallel` decorator. The worker
+    processes send back only the coordinate expressions of the scalar
+    fields, the latter being reconstructed in the parent process. A scalar
+    field expressed in a chart created by a worker process, which does not
+    exist in the parent process, is computed again in the parent process.
+
+    INPUT:
+
+    - ``function`` -- function of a single argument (an element of
+      ``indices``) returning a scalar field on ``domain``
+    - ``indices`` -- list of indices (typically tuples of integers)
+    - ``domain`` -- domain on which the scalar fields are defined (instance
+      of :class:`~sage.geometry.manifolds.domain.OpenDomain`)
+    - ``nproc`` -- (default: 1) number of processes; if 1, the computation
+      is sequential
+
+    OUTPUT:
+
+    - list of pairs ``(ind, value)``, where ``value`` is the scalar field
+      returned by ``function(ind)``
+
+    EXAMPLES::
+
+        sage: from sage.geometry.manifolds.utilities import compute_components
+        sage: M = Manifold(2, 'M')
+        sage: X.<x,y> = M.chart()
+        sage: f = lambda i: M.scalar_field(x^i*y)
+        sage: res = compute_components(f, [1, 2, 3], M, nproc=2)
+        sage: sorted((i, s.expr()) for i, s in res)
+        [(1, x*y), (2, x^2*y), (3, x^3*y)]
+
+    """
+    if nproc <= 1 or len(indices) < 2:
+        return [(ind, function(ind)) for ind in indices]
+    from sage.parallel.decorate import parallel
+    from scalarfield import ScalarField
+    atlas = list(domain._atlas)
+    def worker(chunk):
+        # the charts are sent back by their position in the atlas, since the
+        # chart objects live in the parent process; if a chart has been 
+        # created in the child process, it is unknown to the parent and the
+        # component is flagged to be computed in the parent process:
+        resu = []
+        for ind in chunk:
+            value = function(ind)
+            if value.is_zero():
+                resu.append((ind, None))
+            elif any(chart not in atlas for chart in value._express):
+                resu.append((ind, False))
+            else:
+                resu.append((ind, [(atlas.index(chart), funct._express)
+                            for chart, funct in value._express.iteritems()]))
+        return resu
+    nchunks = min(nproc, len(indices))
+    chunks = [indices[i::nchunks] for i in range(nchunks)]
+    resu = []
+    for args, output in parallel(p_iter='fork', ncpus=nproc)(worker)(chunks):
+        if not isinstance(output, list):
+            raise RuntimeError("The parallel computation of the components " +
+                               "failed: " + str(output))
+        for ind, expressions in output:
+            if expressions is None:
+                resu.append((ind, domain._zero_scalar_field))
+            elif expressions is False:
+                resu.append((ind, function(ind)))
+            else:
+                resu.append((ind, ScalarField(domain, coord_expression=
+                              dict([(atlas[i], expr)
+                                    for i, expr in expressions]))))
+    return resu
+
+def numerical_function(expr, variables):
+    r"""
+    Compile a symbolic expression into a numerical function acting on NumPy
+    arrays.
+
+    The expression is translated once for all into a NumPy expression
+    (via SymPy's ``lambdify``), so that its evaluation on arrays of
+    values of the variables is performed without any Python loop. If the
+    translation fails, a compiled scalar function (obtained by
+    :func:`~sage.ext.fast_callable.fast_callable`) is vectorized instead.
+
+    INPUT:
+
+    - ``expr`` -- symbolic expression
+    - ``variables`` -- list of the symbolic variables on which ``expr``
+      depends (other symbolic variables are not allowed)
+
+    OUTPUT:
+
+    - function taking as many arguments as ``variables``, each of them
+      being a number or a NumPy array (arrays of different shapes being
+      broadcast together), and returning a NumPy array of floats
+
+    EXAMPLES::
+
+        sage: import numpy
+        sage: from sage.geometry.manifolds.utilities import numerical_function
+        sage: x, y = var('x y')
+        sage: f = numerical_function(x^2 + cos(y), [x, y])
+        sage: f(numpy.array([0., 1., 2.]), 0.)
+        array([ 1.,  2.,  5.])
+        sage: f = numerical_function(SR(3), [x, y])  # constant expression
+        sage: f(numpy.array([0., 1.]), numpy.array([2., 3.]))
+        array([ 3.,  3.])
+
+    """
+    import numpy
+    from sage.symbolic.ring import SR
+    expr = SR(expr)
+    try:
+        from sympy import lambdify
+        func = lambdify([SR(var)._sympy_() for var in variables], 
+                        expr._sympy_(), modules='numpy')
+    except Exception:  # no SymPy/NumPy translation of expr
+        from sage.ext.fast_callable import fast_callable
+        from sage.rings.real_double import RDF
+        func = numpy.vectorize(fast_callable(expr, vars=variables, 
+                                             domain=RDF), 
+                               otypes=[numpy.float64])
+    def numerical(*values):
+        values = numpy.broadcast_arrays(*[numpy.asarray(val, 
+                                        dtype=numpy.float64) for val in values])
+        with numpy.errstate(all='ignore'):
+            resu = numpy.asarray(func(*values), dtype=numpy.float64)
+        if resu.shape != values[0].shape:  # case of a constant expression
+            resu = resu + numpy.zeros(values[0].shape)
+        return resu
+    return numerical
+
+def valid_runs(mask):
+    r"""
+    Return the runs of consecutive True values in a one-dimensional array of
+    booleans.
+
+    This is used to split a curve at the points where it is not defined.
+
+    INPUT:
+
+    - ``mask`` -- one-dimensional NumPy array of booleans
+
+    OUTPUT:
+
+    - list of pairs ``(start, stop)`` such that ``mask[start:stop]`` is a
+      maximal run of True values
+
+    EXAMPLE::
+
+        sage: import numpy
+        sage: from sage.geometry.manifolds.utilities import valid_runs
+        sage: valid_runs(numpy.array([True, True, False, True, False, True]))
+        [(0, 2), (3, 4), (5, 6)]
+
+    """
+    import numpy
+    edges = numpy.diff(numpy.concatenate(([0], numpy.asarray(mask, 
+                                                dtype=numpy.int8), [0])))
+    starts = numpy.nonzero(edges == 1)[0]
+    stops = numpy.nonzero(edges == -1)[0]
+    return [(int(start), int(stop)) for start, stop in zip(starts, stops)]
+
 def set_axes_labels(graph, xlabel, ylabel, zlabel, **kwds):
     r"""
     Set axes labels for a 3D graphics object.
@@ -1597,6 +1597,132 @@ class Components(SageObject):
         for ind in self.index_generator():
             yield ind
 
+    def _full_comp(self):
+        r"""
+        Return a dictionary of all the nonzero components, with all the 
+        indices (and not only the non-redundant ones) as keys.
+        
+        In the absence of symmetries, this is the dictionary ``self._comp``
+        itself, which must not be modified. 
+
+        EXAMPLE::
+
+            sage: from sage.tensor.modules.comp import Components
+            sage: V = VectorSpace(QQ, 3)
+            sage: c = Components(QQ, V.basis(), 2)
+            sage: c[0,1], c[2,0] = 3, -1
+            sage: c._full_comp()  # random (dictionary output)
+            {(0, 1): 3, (2, 0): -1}
+
+        """
+        return self._comp
+
+    def _slot_transform(self, columns, result):
+        r"""
+        Apply a linear transformation separately on each index slot.
+        
+        The components `R` of ``result`` are set to 
+        
+        .. MATH::
+        
+            R_{i_1\ldots i_p} = \sum_{j_1,\ldots,j_p} a^{(1)}_{i_1 j_1} 
+                \cdots a^{(p)}_{i_p j_p} T_{j_1\ldots j_p}
+        
+        where `T` stands for the components of ``self``. The sum is 
+        performed one slot at a time, i.e. as `p` successive 
+        contractions, each of them involving only the nonzero entries of the 
+        matrix `a^{(k)}` and the nonzero components obtained at the previous 
+        step. If ``result`` has some symmetries, the intermediate components
+        whose already transformed indices are not ordered as in the 
+        non-redundant components of ``result`` are not computed. 
+        For `n`-dimensional components, this requires at most
+        `O(p\, n^{p+1})` operations, instead of `O(n^{2p})` for a direct 
+        summation. The matrices `a^{(k)}` need not be square, i.e. the 
+        indices of ``result`` may range over a set different from that of the
+        indices of ``self``. 
+
+        INPUT:
+
+        - ``columns`` -- list of `p` dictionaries, `p` being the number of 
+          indices of ``self``; the dictionary ``columns[k]`` has the 
+          values `j` of the `(k+1)`-th index of ``self`` as keys and the 
+          lists of pairs `(i, a^{(k+1)}_{ij})` as values, where only the 
+          nonzero coefficients `a^{(k+1)}_{ij}` are listed
+        - ``result`` -- components with `p` indices (instance of 
+          :class:`Components`), assumed to be zero initially, which 
+          receive the result of the transformation; they may have 
+          symmetries, which the transformation is assumed to preserve
+          
+        EXAMPLE::
+
+            sage: from sage.tensor.modules.comp import Components
+            sage: V = VectorSpace(QQ, 3)
+            sage: c = Components(QQ, V.basis(), 2)
+            sage: c[0,1], c[2,2] = 3, 1
+            sage: a = {0: [(0, 2)], 1: [(1, 1), (2, 1)], 2: [(2, -1)]}
+            sage: r = Components(QQ, V.basis(), 2)
+            sage: c._slot_transform([a, a], r)
+            sage: r[:]
+            [0 6 6]
+            [0 0 0]
+            [0 0 1]
+
+        Transformation to antisymmetric components of lower dimension::
+
+            sage: from sage.tensor.modules.comp import CompFullyAntiSym
+            sage: W = VectorSpace(QQ, 2)
+            sage: c = CompFullyAntiSym(QQ, V.basis(), 2)
+            sage: c[0,1], c[1,2] = 1, 2
+            sage: a = {0: [(0, 1)], 1: [(1, 1)], 2: [(0, 1), (1, 1)]}
+            sage: r = CompFullyAntiSym(QQ, W.basis(), 2)
+            sage: c._slot_transform([a, a], r)
+            sage: r[:]
+            [ 0 -1]
+            [ 1  0]
+
+        """
+        nid = self._nid
+        current = self._full_comp()
+        needed = set(result.non_redundant_index_generator())
+        # In the non-redundant components of result, the indices at two 
+        # consecutive positions a, b of a symmetry (resp. antisymmetry) 
+        # satisfy ind[a] <= ind[b] (resp. ind[a] < ind[b]); this is checked
+        # at the step max(a,b), i.e. as soon as both indices are transformed:
+        checks = [[] for k in range(nid)]
+        if isinstance(result, CompWithSym):
+            groups = [(isym, False) for isym in result._sym] + \
+                     [(isym, True) for isym in result._antisym]
+            for isym, strict in groups:
+                for a, b in zip(isym[:-1], isym[1:]):
+                    checks[max(a, b)].append((a, b, strict))
+        for k in range(nid):
+            column = columns[k]
+            last = (k == nid - 1)
+            checks_k = checks[k]
+            transformed = {}
+            for ind, val in current.iteritems():
+                for i, coef in column.get(ind[k], ()):
+                    new_ind = ind[:k] + (i,) + ind[k+1:]
+                    if last:
+                        if new_ind not in needed:
+                            continue
+                    elif checks_k:
+                        redundant = False
+                        for a, b, strict in checks_k:
+                            if new_ind[a] > new_ind[b] or \
+                                        (strict and new_ind[a] == new_ind[b]):
+                                redundant = True
+                                break
+                        if redundant:
+                            continue
+                    if new_ind in transformed:
+                        transformed[new_ind] += val * coef
+                    else:
+                        transformed[new_ind] = val * coef
+            current = transformed
+        for ind, val in current.iteritems():
+            result[ind] = val
+
 
     def symmetrize(self, *pos):
         r"""
@@ -2880,6 +3006,31 @@ class CompWithSym(Components):
                         ind[pos] = si
                         ret = 1
 
+    def _full_comp(self):
+        r"""
+        Return a dictionary of all the nonzero components, with all the 
+        indices (and not only the non-redundant ones) as keys.
+
+        EXAMPLE::
+
+            sage: from sage.tensor.modules.comp import CompFullyAntiSym
+            sage: V = VectorSpace(QQ, 3)
+            sage: c = CompFullyAntiSym(QQ, V.basis(), 2)
+            sage: c[0,1] = 3
+            sage: c._full_comp()  # random (dictionary output)
+            {(0, 1): 3, (1, 0): -3}
+
+        """
+        resu = {}
+        for ind in self.index_generator():
+            sign, oind = self._ordered_indices(ind)
+            if sign != 0 and oind in self._comp:
+                if sign == 1:
+                    resu[ind] = self._comp[oind]
+                else:
+                    resu[ind] = -self._comp[oind]
+        return resu
+
     def symmetrize(self, *pos):
         r"""
         Symmetrization over the given index positions
@@ -395,6 +395,9 @@ class FiniteRankFreeModule(UniqueRepresentation, Parent):
         self._known_bases = []  # List of known bases on the free module
         self._def_basis = None # default basis
         self._basis_changes = {} # Dictionary of the changes of bases
+        self._derived_basis_changes = set() # keys of the changes of bases 
+                                            # obtained by inversion or 
+                                            # composition of other ones
         # Zero element:
         if not hasattr(self, '_zero_element'):
             self._zero_element = self._element_constructor_(name='zero', 
@@ -1452,11 +1455,52 @@ class FiniteRankFreeModule(UniqueRepresentation, Parent):
             [ 3/5 -2/5]
             [ 1/5  1/5]
 
+        If the change of basis has not been defined, but the inverse 
+        change of basis has, the former is computed as the inverse of the 
+        latter; otherwise, it is computed by composing the changes of basis 
+        along a chain of bases. In both cases, the result is stored::
+
+            sage: b = M.automorphism()
+            sage: b[:] = [[0, 1], [1, 0]]
+            sage: g = f.new_basis(b, 'g')
+            sage: (e, g) in M._basis_changes
+            False
+            sage: M.basis_change(e,g)[:]
+            [-1  3]
+            [ 1  2]
+            sage: (e, g) in M._basis_changes
+            True
+            sage: g[1].view(e)
+            g_1 = -e_1 + e_2
+
+        The stored changes of basis are deleted if one of the changes of 
+        basis they derive from is redefined by :meth:`set_basis_change`::
+
+            sage: c = M.automorphism()
+            sage: c[:] = [[2, 0], [0, 1]]
+            sage: M.set_basis_change(f, g, c)
+            sage: (e, g) in M._basis_changes
+            False
+            sage: M.basis_change(e,g)[:]
+            [ 2  4]
+            [-1  3]
+
         """
         if (basis1, basis2) not in self._basis_changes:
-            raise TypeError("The change of basis from '" + repr(basis1) + 
-                            "' to '" + repr(basis2) + "' has not been " + 
-                            "defined on the " + repr(self))
+            if (basis2, basis1) in self._basis_changes:
+                change = self._basis_changes[(basis2, basis1)]
+                self._basis_changes[(basis1, basis2)] = change.inverse()
+                self._derived_basis_changes.add((basis1, basis2))
+            else:
+                path = self._basis_change_path([basis1], basis2)
+                if path is None:
+                    raise TypeError("The change of basis from '" + 
+                                    repr(basis1) + "' to '" + repr(basis2) + 
+                                    "' has not been defined on the " + 
+                                    repr(self))
+                self._basis_changes[(basis1, basis2)] = \
+                                           self._compose_basis_changes(path)
+                self._derived_basis_changes.add((basis1, basis2))
         return self._basis_changes[(basis1, basis2)]
 
     def set_basis_change(self, basis1, basis2, change_of_basis, 
@@ -1464,7 +1508,9 @@ class FiniteRankFreeModule(UniqueRepresentation, Parent):
         r"""
         Relates two bases by an automorphism.
         
-        This updates the internal dictionary ``self._basis_changes``. 
+        This updates the internal dictionary ``self._basis_changes``, from 
+        which the changes of basis previously obtained by inversion or 
+        composition (cf. :meth:`basis_change`) are deleted. 
         
         INPUT:
         
@@ -1510,7 +1556,251 @@ class FiniteRankFreeModule(UniqueRepresentation, Parent):
         if not isinstance(change_of_basis, FreeModuleAutomorphism):
             raise TypeError("The argument change_of_basis must be some " +
                             "instance of FreeModuleAutomorphism.")
+        self._del_derived_basis_changes()
         self._basis_changes[(basis1, basis2)] = change_of_basis
         if compute_inverse:
             self._basis_changes[(basis2, basis1)] = change_of_basis.inverse()
+
+    def _del_derived_basis_changes(self):
+        r"""
+        Delete the changes of basis that have been obtained by inversion or 
+        composition of other changes of basis, since they may be obsolete 
+        after the modification of the latter. 
+        """
+        for key in self._derived_basis_changes:
+            if key in self._basis_changes:
+                del self._basis_changes[key]
+        self._derived_basis_changes.clear()
+
+    def _basis_change_path(self, bases, basis):
+        r"""
+        Search for the shortest chain of changes of basis leading from one
+        basis of a given list to a given basis.
+
+        The changes of basis that are known in a single direction are 
+        considered as well, their inverses being computed if necessary by 
+        :meth:`basis_change`. 
+
+        INPUT:
+
+        - ``bases`` -- list of initial bases
+        - ``basis`` -- final basis
+
+        OUTPUT:
+
+        - list of bases, starting with an element of ``bases`` and ending
+          with ``basis``, any two successive elements being related by a
+          change of basis; None if no such list exists
+
+        EXAMPLE::
+
+            sage: M = FiniteRankFreeModule(QQ, 2, name='M')
+            sage: e = M.basis('e')
+            sage: a = M.automorphism() ; a[:] = [[1, 2], [-1, 3]]
+            sage: f = e.new_basis(a, 'f')
+            sage: b = M.automorphism() ; b[:] = [[0, 1], [1, 0]]
+            sage: g = f.new_basis(b, 'g')
+            sage: M._basis_change_path([e], g)
+            [basis (e_0,e_1) on the rank-2 free module M over the Rational Field,
+             basis (f_0,f_1) on the rank-2 free module M over the Rational Field,
+             basis (g_0,g_1) on the rank-2 free module M over the Rational Field]
+
+        """
+        # Graph of the changes of basis:
+        edges = self._basis_change_graph()
+        # Breadth-first search:
+        previous = {}
+        for basis1 in bases:
+            previous[basis1] = None
+        queue = list(bases)
+        while queue:
+            next_queue = []
+            for basis1 in queue:
+                if basis1 == basis:
+                    path = [basis1]
+                    while previous[path[-1]] is not None:
+                        path.append(previous[path[-1]])
+                    path.reverse()
+                    return path
+                for basis2 in edges.get(basis1, []):
+                    if basis2 not in previous:
+                        previous[basis2] = basis1
+                        next_queue.append(basis2)
+            queue = next_queue
+        return None
+
+    def _basis_change_graph(self):
+        r"""
+        Return the graph of the known changes of basis, as a dictionary 
+        whose keys are the bases and whose values are the sets of bases 
+        related to them by a change of basis (in any direction). 
+        """
+        edges = {}
+        for (basis1, basis2) in self._basis_changes:
+            edges.setdefault(basis1, set()).add(basis2)
+            edges.setdefault(basis2, set()).add(basis1)
+        return edges
+
+    def _compose_basis_changes(self, path):
+        r"""
+        Compose the changes of basis along a chain of bases. 
+
+        INPUT:
+
+        - ``path`` -- list of bases, any two successive elements being 
+          related by a change of basis (in any direction), as returned by 
+          :meth:`_basis_change_path`
+
+        OUTPUT:
+
+        - instance of 
+          :class:`~sage.tensor.modules.free_module_tensor_spec.FreeModuleAutomorphism`
+          describing the change of basis from ``path[0]`` to ``path[-1]``;
+          the changes of basis between successive elements of ``path`` that
+          were known only in the reverse direction are stored as well
+
+        EXAMPLE::
+
+            sage: M = FiniteRankFreeModule(QQ, 2, name='M')
+            sage: e = M.basis('e')
+            sage: a = M.automorphism() ; a[:] = [[1, 2], [-1, 3]]
+            sage: f = e.new_basis(a, 'f')
+            sage: b = M.automorphism() ; b[:] = [[0, 1], [1, 0]]
+            sage: g = f.new_basis(b, 'g')
+            sage: M._compose_basis_changes([g, f, e])[:]
+            [-2/5  3/5]
+            [ 1/5  1/5]
+
+        """
+        # Nonzero entries of the matrix of the composite change of basis, 
+        # the matrix of a change of basis being the same in the two bases:
+        current = None
+        for k in range(len(path)-1):
+            basis1 = path[k] ; basis2 = path[k+1]
+            if (basis1, basis2) in self._basis_changes:
+                change = self._basis_changes[(basis1, basis2)]
+            else:
+                change = self._basis_changes[(basis2, basis1)].inverse()
+                self._basis_changes[(basis1, basis2)] = change
+                self._derived_basis_changes.add((basis1, basis2))
+            if basis1 in change._components:
+                entries = change._components[basis1]._full_comp()
+            elif basis2 in change._components:
+                entries = change._components[basis2]._full_comp()
+            else:
+                entries = change.comp(basis1)._full_comp()
+            if current is None:
+                current = dict(entries)
+                continue
+            # matrix product current * entries:
+            rows = {}
+            for ind, val in entries.iteritems():
+                rows.setdefault(ind[0], []).append((ind[1], val))
+            product = {}
+            for ind, val in current.iteritems():
+                for j, val2 in rows.get(ind[1], ()):
+                    ind_p = (ind[0], j)
+                    if ind_p in product:
+                        product[ind_p] += val * val2
+                    else:
+                        product[ind_p] = val * val2
+            current = product
+        resu = self.automorphism()
+        for basis in (path[0], path[-1]):
+            comp = resu.add_comp(basis)
+            for ind, val in current.iteritems():
+                comp[ind] = val
+        return resu
+
+    def _basis_change_source(self, bases, basis, nb_indices):
+        r"""
+        Choose, among a list of bases, the most favorable one for 
+        transforming the components of a tensor to a given basis. 
+
+        The cost of the transformation from a basis `b` is estimated as 
+        the number of multiplications of the slot-wise transformation 
+        (cf. :meth:`~sage.tensor.modules.comp.Components._slot_transform`),
+        i.e. `p\, N_b\, c` where `p` is the number of indices, `N_b` the 
+        number of nonzero components in `b` and `c \leq n` the mean number 
+        of nonzero entries per column of the change-of-basis matrix from 
+        `b` (estimated by the product of those of the changes of basis 
+        along the shortest chain of bases between `b` and ``basis``), plus 
+        `n^3` for each matrix product required to compose that chain, if the
+        composite change of basis is not known already. 
+
+        INPUT:
+
+        - ``bases`` -- dictionary of the tensor components (instances of 
+          :class:`~sage.tensor.modules.comp.Components`), with bases as 
+          keys
+        - ``basis`` -- the basis in which the components are required
+        - ``nb_indices`` -- number of indices of the components
+
+        OUTPUT:
+
+        - the basis of lowest cost, or None if no basis of ``bases`` is 
+          related to ``basis`` by some chain of changes of basis
+
+        EXAMPLE::
+
+            sage: M = FiniteRankFreeModule(QQ, 2, name='M')
+            sage: e = M.basis('e')
+            sage: a = M.automorphism() ; a[:] = [[1, 2], [-1, 3]]
+            sage: f = e.new_basis(a, 'f')
+            sage: b = M.automorphism() ; b[:] = [[0, 1], [1, 0]]
+            sage: g = f.new_basis(b, 'g')
+            sage: t = M.tensor((0,2))
+            sage: t[e,:] = [[1, 2], [3, 4]]
+            sage: t.add_comp(g)[0,0] = 1
+            sage: M._basis_change_source(t._components, f, 2) is g
+            True
+
+        """
+        n = self._rank
+        edges = self._basis_change_graph()
+        # Breadth-first search from basis, recording for each basis the 
+        # next basis towards basis: 
+        towards = {basis: None}
+        queue = [basis]
+        while queue:
+            next_queue = []
+            for basis1 in queue:
+                for basis2 in edges.get(basis1, ()):
+                    if basis2 not in towards:
+                        towards[basis2] = basis1
+                        next_queue.append(basis2)
+            queue = next_queue
+        def fill(basis1, basis2):
+            # mean number of nonzero entries per column of the matrix of 
+            # the change of basis between basis1 and basis2:
+            change = self._basis_changes.get((basis1, basis2))
+            if change is None:
+                change = self._basis_changes[(basis2, basis1)]
+            # (the matrix is the same in the two bases, but not in others)
+            for basis3 in (basis1, basis2):
+                if basis3 in change._components:
+                    nnz = len(change._components[basis3]._full_comp())
+                    return min(n, max(1, nnz/float(n)))
+            return n
+        best = None
+        for basis1, comp in bases.iteritems():
+            if basis1 not in towards:
+                continue
+            if (basis1, basis) in self._basis_changes:
+                fill_path = fill(basis1, basis)
+                composition = 0
+            else:
+                fill_path = 1
+                composition = -1
+                basis2 = basis1
+                while basis2 != basis:
+                    fill_path = min(n, fill_path*fill(basis2, towards[basis2]))
+                    basis2 = towards[basis2]
+                    composition += 1
+            cost = nb_indices*len(comp._comp)*fill_path + composition*n**3
+            if best is None or cost < best[0]:
+                best = (cost, basis1)
+        if best is None:
+            return None
+        return best[1]
  
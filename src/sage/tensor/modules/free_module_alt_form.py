@@ -329,6 +329,16 @@ class FreeModuleAltForm(FreeModuleTensor):
             True
             sage: d.wedge(c) == c.wedge(d)
             True
+
+        Third exterior power of a symplectic form on a rank-6 module::
+
+            sage: N = FiniteRankFreeModule(QQ, 6, name='N')
+            sage: f = N.basis('f')
+            sage: om = N.alternating_form(2, 'om')
+            sage: om[0,1], om[2,3], om[4,5] = 1, 1, 1
+            sage: om3 = om.wedge(om).wedge(om)
+            sage: om3[0,1,2,3,4,5]
+            6
         
         """
         from format_utilities import is_atomic
@@ -349,11 +359,40 @@ class FreeModuleAltForm(FreeModuleTensor):
         cmp_r = CompFullyAntiSym(fmodule._ring, basis, rank_r, 
                                  start_index=fmodule._sindex,
                                  output_formatter=fmodule._output_formatter)
+        # Only the pairs of stored (i.e. strictly increasing) index sets with
+        # disjoint supports contribute; the sign of the shuffle of ind_s and
+        # ind_o is (-1)^N, N being the number of pairs (a,b), a in ind_s and 
+        # b in ind_o, with a > b. For each ind_s, the number of elements of
+        # ind_s greater than b is tabulated for all indices b:
+        si = fmodule._sindex
+        nsi = si + fmodule._rank
+        comp_o = [(ind_o, frozenset(ind_o), val_o) 
+                  for ind_o, val_o in cmp_o._comp.iteritems()]
+        terms = {}
         for ind_s, val_s in cmp_s._comp.iteritems():
-            for ind_o, val_o in cmp_o._comp.iteritems():
-                ind_r = ind_s + ind_o
-                if len(ind_r) == len(set(ind_r)): # all indices are different
-                    cmp_r[[ind_r]] += val_s * val_o
+            supp_s = frozenset(ind_s)
+            nb_greater = {}
+            nb = len(ind_s)
+            pos = 0
+            for b in range(si, nsi):
+                while pos < len(ind_s) and ind_s[pos] <= b:
+                    pos += 1
+                    nb -= 1
+                nb_greater[b] = nb
+            for ind_o, supp_o, val_o in comp_o:
+                if supp_s.isdisjoint(supp_o):
+                    ind_r = tuple(sorted(ind_s + ind_o))
+                    if sum(nb_greater[b] for b in ind_o) % 2 == 0:
+                        prod = val_s * val_o
+                    else:
+                        prod = - val_s * val_o
+                    if ind_r in terms:
+                        terms[ind_r] += prod
+                    else:
+                        terms[ind_r] = prod
+        for ind_r, val_r in terms.iteritems():
+            if val_r != 0:
+                cmp_r._comp[ind_r] = val_r
         result = fmodule.alternating_form(rank_r)
         result._components[basis] = cmp_r
         if self._name is not None and other._name is not None:
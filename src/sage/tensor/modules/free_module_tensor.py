@@ -662,6 +662,19 @@ class FreeModuleTensor(ModuleElement):
             [ 0  0  0]
             [ 0  2  0]
             [-3  0  0]
+
+        Components computed via a chain of changes of basis::
+
+            sage: b = M.automorphism()
+            sage: b[:] = [[0,1,0], [1,0,0], [0,0,-1]]
+            sage: g = f.new_basis(b, 'g')
+            sage: del t._components[f]
+            sage: t.comp(g)[:]
+            [2 0 0]
+            [0 0 0]
+            [0 3 0]
+            sage: (e, g) in M._basis_changes  # the composite change of basis has been stored
+            True
             
         """
         fmodule = self._fmodule
@@ -671,50 +684,55 @@ class FreeModuleTensor(ModuleElement):
             # The components must be computed from 
             # those in the basis from_basis
             if from_basis is None: 
-                for known_basis in self._components:
-                    if (known_basis, basis) in self._fmodule._basis_changes \
-                        and (basis, known_basis) in self._fmodule._basis_changes:
-                        from_basis = known_basis
-                        break
+                # The most favorable basis is selected by the free module, 
+                # the changes of basis along chains of bases being composed 
+                # (and stored) by fmodule.basis_change():
+                from_basis = fmodule._basis_change_source(self._components,
+                                                     basis, self._tensor_rank)
                 if from_basis is None:
-                    raise ValueError("No basis could be found for computing " + 
-                                     "the components in the " + str(basis))
+                    raise ValueError("No basis could be found for " + 
+                                     "computing the components in the " + 
+                                     str(basis))
             elif from_basis not in self._components:
                 raise ValueError("The tensor components are not known in the " +
                                  "basis "+ str(from_basis))
             (n_con, n_cov) = self._tensor_type
             if n_cov > 0:
-                if (from_basis, basis) not in fmodule._basis_changes:
+                try:
+                    change = fmodule.basis_change(from_basis, basis)
+                except TypeError:
                     raise ValueError("The change-of-basis matrix from the " + 
                                      str(from_basis) + " to the " + str(basis) 
                                      + " has not been set.")
-                pp = \
-                  fmodule._basis_changes[(from_basis, basis)].comp(from_basis)
+                pp = change.comp(from_basis)
                 # pp not used if n_cov = 0 (pure contravariant tensor)
             if n_con > 0:
-                if (basis, from_basis) not in fmodule._basis_changes:
+                try:
+                    change = fmodule.basis_change(basis, from_basis)
+                except TypeError:
                     raise ValueError("The change-of-basis matrix from the " + 
                                      str(basis) + " to the " + str(from_basis) +
                                      " has not been set.")
-                ppinv = \
-                  fmodule._basis_changes[(basis, from_basis)].comp(from_basis)
+                ppinv = change.comp(from_basis)
                 # ppinv not used if n_con = 0 (pure covariant tensor)
             old_comp = self._components[from_basis]
             new_comp = self._new_comp(basis)
-            rank = self._tensor_rank
-            # loop on the new components:
-            for ind_new in new_comp.non_redundant_index_generator(): 
-                # Summation on the old components multiplied by the proper 
-                # change-of-basis matrix elements (tensor formula): 
-                res = 0 
-                for ind_old in old_comp.index_generator(): 
-                    t = old_comp[[ind_old]]
-                    for i in range(n_con): # loop on contravariant indices
-                        t *= ppinv[[ind_new[i], ind_old[i]]]
-                    for i in range(n_con,rank):  # loop on covariant indices
-                        t *= pp[[ind_old[i], ind_new[i]]]
-                    res += t
-                new_comp[ind_new] = res
+            # Nonzero entries of the change-of-basis matrices, sorted by the
+            # value of the old index: 
+            columns = []
+            if n_con > 0:
+                col_con = {}
+                for ind, coef in ppinv._full_comp().iteritems():
+                    col_con.setdefault(ind[1], []).append((ind[0], coef))
+                columns += [col_con] * n_con
+            if n_cov > 0:
+                col_cov = {}
+                for ind, coef in pp._full_comp().iteritems():
+                    col_cov.setdefault(ind[0], []).append((ind[1], coef))
+                columns += [col_cov] * n_cov
+            # The tensor change-of-basis formula is applied one index slot
+            # at a time:
+            old_comp._slot_transform(columns, new_comp)
             self._components[basis] = new_comp
             # end of case where the computation was necessary
         return self._components[basis]
@@ -31,6 +31,9 @@ class PureHodgeModule(FiniteRankFreeModule):
         self._known_bases = []  # List of known bases on the free module
         self._def_basis = None # default basis
         self._basis_changes = {} # Dictionary of the changes of bases
+        self._derived_basis_changes = set() # keys of the changes of bases 
+                                            # obtained by inversion or 
+                                            # composition of other ones
         # Zero element:
         if not hasattr(self, '_zero_element'):
             self._zero_element = self._element_constructor_(name='zero', 